@@ -0,0 +1,51 @@
+"""
+Micro-benchmark for the age kernel used by validate_age.
+
+Usage:
+    python -m benchmarks.bench_age [count]
+"""
+import random
+import sys
+import timeit
+from datetime import date, timedelta
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from src.rules.age import age_in_years, ages_in_years
+
+REFERENCE_DATE = date(2026, 1, 19)
+
+
+def make_dobs(count: int, seed: int = 42) -> list[date]:
+    rng = random.Random(seed)
+    start = date(1950, 1, 1)
+    return [start + timedelta(days=rng.randrange(0, 365 * 60)) for _ in range(count)]
+
+
+def run(count: int = 100_000, repeat: int = 3) -> dict:
+    dobs = make_dobs(count)
+    dob_array = np.array(dobs, dtype="datetime64[D]")
+
+    timings = {
+        "relativedelta": min(timeit.repeat(
+            lambda: [relativedelta(REFERENCE_DATE, dob).years for dob in dobs], number=1, repeat=repeat)),
+        "age_in_years": min(timeit.repeat(
+            lambda: [age_in_years(dob, REFERENCE_DATE) for dob in dobs], number=1, repeat=repeat)),
+        "ages_in_years": min(timeit.repeat(
+            lambda: ages_in_years(dob_array, REFERENCE_DATE), number=1, repeat=repeat)),
+    }
+    return timings
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    timings = run(count)
+    baseline = timings["relativedelta"]
+    print(f"Age kernel benchmark ({count:,} dates of birth)")
+    for name, seconds in timings.items():
+        print(f"  {name:<15} {seconds * 1000:10.1f} ms   {baseline / seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Seeded synthetic data for the benchmark suite.
+
+Every generator takes a seed so runs are reproducible and baselines comparable.
+"""
+import json
+import random
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.kyc.verhoeff import verhoeff_valid_array
+from src.rules.eligibility import Borrower
+from src.securitization.pooling import Loan
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+_FIRST_NAMES = ("Priya", "Rahul", "Anita", "Vijay", "Meera", "Arjun", "Kavya", "Rohan")
+_LAST_NAMES = ("Sharma", "Verma", "Patel", "Kumar", "Reddy", "Iyer", "Singh", "Das")
+
+
+def make_aadhaar_ids(count: int, seed: int = 0) -> list[str]:
+    """12-digit IDs with a valid Verhoeff check digit, as the KYC wrappers require by default."""
+    rng = np.random.default_rng(seed)
+    payloads = rng.integers(10**10, 10**11, size=count) * 10
+    check_digits = np.zeros(count, dtype=np.int64)
+    for digit in range(10):
+        check_digits[verhoeff_valid_array(payloads + digit)] = digit
+    return [str(n) for n in payloads + check_digits]
+
+
+def make_borrower_columns(count: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    income = rng.uniform(20_000, 300_000, size=count).round(2)
+    return {
+        "aadhaar_id": np.array(make_aadhaar_ids(count, seed)),
+        "credit_score": rng.integers(600, 900, size=count),
+        "date_of_birth": np.datetime64("1960-01-01") + rng.integers(0, 365 * 45, size=count).astype("timedelta64[D]"),
+        "monthly_income": income,
+        "monthly_liabilities": (income * rng.uniform(0.05, 0.8, size=count)).round(2),
+    }
+
+
+def make_borrowers(count: int, seed: int = 0) -> list[Borrower]:
+    columns = make_borrower_columns(count, seed)
+    rng = random.Random(seed)
+    return [
+        Borrower(
+            aadhaar_id=columns["aadhaar_id"][i],
+            name=f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}",
+            date_of_birth=columns["date_of_birth"][i].item(),
+            monthly_income=float(columns["monthly_income"][i]),
+            monthly_liabilities=float(columns["monthly_liabilities"][i]),
+            credit_score=int(columns["credit_score"][i]),
+        )
+        for i in range(count)
+    ]
+
+
+def make_loan_columns(count: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        "loan_id": np.array([f"LOAN-{n:08X}" for n in rng.integers(0, 16**8, size=count)]),
+        "borrower_id": np.array(make_aadhaar_ids(count, seed + 1)),
+        "amount": rng.uniform(500_000, 10_000_000, size=count).round(-3),
+        "interest_rate": rng.choice([0.0725, 0.0750, 0.0775, 0.0800, 0.0850], size=count),
+        "tenure_months": rng.choice([120, 180, 240, 300, 360], size=count),
+        "disbursement_date": np.datetime64("2022-01-01") + rng.integers(0, 365 * 4, size=count).astype("timedelta64[D]"),
+    }
+
+
+def make_loans(count: int, seed: int = 0) -> list[Loan]:
+    columns = make_loan_columns(count, seed)
+    return [
+        Loan(
+            loan_id=columns["loan_id"][i],
+            borrower_id=columns["borrower_id"][i],
+            amount=float(columns["amount"][i]),
+            disbursement_date=columns["disbursement_date"][i].item(),
+        )
+        for i in range(count)
+    ]
+
+
+def make_kyc_payloads(aadhaar_ids: list[str], seed: int = 0, not_found_rate: float = 0.1) -> dict:
+    """Stored-procedure responses per Aadhaar ID, shaped like VERIFY_AADHAAR/FETCH_DIGILOCKER_DOCUMENTS/PERFORM_KYC_CHECK."""
+    rng = random.Random(seed)
+    payloads = {}
+    for aadhaar_id in aadhaar_ids:
+        if rng.random() < not_found_rate:
+            error = {"success": False, "error_code": "NOT_FOUND", "error_message": "Aadhaar not found in registry"}
+            payloads[aadhaar_id] = {
+                "CORE.VERIFY_AADHAAR": error,
+                "CORE.FETCH_DIGILOCKER_DOCUMENTS": {**error, "error_code": "AADHAAR_INVALID"},
+                "CORE.PERFORM_KYC_CHECK": {"kyc_status": "FAILED", "stage": "AADHAAR_VERIFICATION",
+                                           "error": "Aadhaar not found in registry"},
+            }
+            continue
+        name = f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}"
+        dob = (date(1960, 1, 1) + timedelta(days=rng.randrange(0, 365 * 45))).isoformat()
+        has_pan = rng.random() < 0.8
+        has_income_proof = rng.random() < 0.7
+        documents = [{"doc_type": "AADHAAR", "doc_number": aadhaar_id, "issuer": "UIDAI", "status": "VERIFIED", "metadata": {}}]
+        if has_pan:
+            documents.append({"doc_type": "PAN", "doc_number": "ABCDE1234F", "issuer": "Income Tax Dept",
+                              "status": "VERIFIED", "metadata": {}})
+        if has_income_proof:
+            documents.append({"doc_type": "FORM_16", "doc_number": "F16-2024", "issuer": "TCS Ltd",
+                              "status": "VERIFIED", "metadata": {"assessment_year": "2024-25"}})
+        missing = [doc for doc, present in (("PAN", has_pan), ("Income Proof (Form 16 or ITR)", has_income_proof))
+                   if not present]
+        payloads[aadhaar_id] = {
+            "CORE.VERIFY_AADHAAR": {"success": True, "aadhaar_id": aadhaar_id, "name": name,
+                                    "date_of_birth": dob, "gender": rng.choice("MF")},
+            "CORE.FETCH_DIGILOCKER_DOCUMENTS": {"success": True, "aadhaar_id": aadhaar_id, "holder_name": name,
+                                                "document_count": len(documents), "documents": documents},
+            "CORE.PERFORM_KYC_CHECK": {"kyc_status": "PASSED" if has_pan else "INCOMPLETE", "aadhaar_verified": True,
+                                       "holder_name": name, "date_of_birth": dob, "has_pan": has_pan,
+                                       "has_income_proof": has_income_proof, "missing_documents": missing},
+        }
+    return payloads
+
+
+class LatencySession:
+    """
+    MockSession that sleeps per call to model the Snowflake round-trip and returns JSON strings.
+
+    *_BATCH procedures take a list of IDs and answer with an object keyed by ID.
+    """
+
+    def __init__(self, payloads: dict, latency_seconds: float = 0.0005):
+        self.payloads = payloads
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    def call(self, procedure: str, *args):
+        self.calls += 1
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if procedure.endswith("_BATCH"):
+            single = procedure[:-len("_BATCH")]
+            return json.dumps({i: self.payloads.get(i, {}).get(single, {}) for i in args[0]})
+        return json.dumps(self.payloads.get(args[0], {}).get(procedure, {}))
@@ -0,0 +1,205 @@
+"""
+Benchmark suite for the eligibility, pooling, EMI and KYC hot paths.
+
+Usage:
+    python -m benchmarks.suite [--scale 10k|100k|1m] [--update-baseline] [--tolerance 0.25]
+
+Timings are compared with benchmarks/baselines/<scale>.json; any case slower
+than baseline * (1 + tolerance), and by more than NOISE_FLOOR_SECONDS, fails
+the run with exit code 1. So does a missing baseline file, or a case with no
+baseline entry (or one recorded at a different row count), since it could
+never report a regression. Baselines are machine specific, so refresh them
+with --update-baseline on the reference host.
+"""
+import argparse
+import json
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.generators import (
+    SCALES,
+    LatencySession,
+    make_borrower_columns,
+    make_borrowers,
+    make_kyc_payloads,
+    make_loan_columns,
+    make_loans,
+)
+from src.kyc.aadhaar import (
+    digilocker_from_payload,
+    fetch_digilocker_documents,
+    kyc_from_payload,
+    perform_kyc_check,
+    validate_aadhaar,
+)
+from src.kyc.batch import perform_kyc_check_batch, validate_aadhaar_batch
+from src.kyc.decode import decode_digilocker, decode_kyc
+from src.marketplace.emi import calculate_emi
+from src.rules.batch import issue_eligibility_certificates_batch
+from src.rules.eligibility import issue_eligibility_certificate
+from src.securitization.batch import assign_rmbs_pools
+from src.securitization.catalog import PoolCatalog
+from src.securitization.pooling import assign_rmbs_pool, get_pool_for_date
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+DEFAULT_TOLERANCE = 0.25
+# Slowdowns smaller than this are timer noise, whatever the ratio
+NOISE_FLOOR_SECONDS = 0.01
+REFERENCE_DATE = date(2026, 1, 19)
+# KYC cases pay a simulated round-trip per call, so they run on a slice of the scale
+KYC_SCALE_DIVISOR = 100
+# Payload decoding is pure CPU but each payload is a few hundred bytes of JSON
+DECODE_SCALE_DIVISOR = 10
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    rows: int
+    run: Callable[[], object]
+
+
+def build_cases(count: int, seed: int = 0, kyc_latency_seconds: float = 0.0005) -> list[BenchmarkCase]:
+    borrowers = make_borrowers(count, seed)
+    borrower_columns = make_borrower_columns(count, seed)
+    loans = make_loans(count, seed)
+    loan_columns = make_loan_columns(count, seed)
+    eligible_dates = [loan.disbursement_date for loan in loans]
+    emi_inputs = list(zip(loan_columns["amount"].tolist(), (loan_columns["interest_rate"] * 100).tolist(),
+                          loan_columns["tenure_months"].tolist()))
+
+    catalog = PoolCatalog()
+
+    kyc_ids = borrower_columns["aadhaar_id"][:max(1, count // KYC_SCALE_DIVISOR)].tolist()
+    session = LatencySession(make_kyc_payloads(kyc_ids, seed), latency_seconds=kyc_latency_seconds)
+
+    decode_ids = borrower_columns["aadhaar_id"][:max(1, count // DECODE_SCALE_DIVISOR)].tolist()
+    decode_payloads = make_kyc_payloads(decode_ids, seed)
+    digilocker_json = [json.dumps(decode_payloads[i]["CORE.FETCH_DIGILOCKER_DOCUMENTS"]) for i in decode_ids]
+    kyc_json = [json.dumps(decode_payloads[i]["CORE.PERFORM_KYC_CHECK"]) for i in decode_ids]
+
+    return [
+        BenchmarkCase("issue_eligibility_certificate", count,
+                      lambda: [issue_eligibility_certificate(b, REFERENCE_DATE) for b in borrowers]),
+        BenchmarkCase("issue_eligibility_certificates_batch", count,
+                      lambda: issue_eligibility_certificates_batch(borrower_columns, REFERENCE_DATE)),
+        BenchmarkCase("assign_rmbs_pool", count,
+                      lambda: [assign_rmbs_pool(loan, REFERENCE_DATE) for loan in loans]),
+        BenchmarkCase("assign_rmbs_pools", count,
+                      lambda: assign_rmbs_pools(loan_columns["disbursement_date"], REFERENCE_DATE)),
+        BenchmarkCase("get_pool_for_date", count,
+                      lambda: [get_pool_for_date(d) for d in eligible_dates]),
+        BenchmarkCase("pool_catalog.pool_for_date", count,
+                      lambda: [catalog.pool_for_date(d) for d in eligible_dates]),
+        BenchmarkCase("calculate_emi", count,
+                      lambda: [calculate_emi(p, r, n) for p, r, n in emi_inputs]),
+        BenchmarkCase("validate_aadhaar", len(kyc_ids),
+                      lambda: [validate_aadhaar(session, i) for i in kyc_ids]),
+        BenchmarkCase("fetch_digilocker_documents", len(kyc_ids),
+                      lambda: [fetch_digilocker_documents(session, i) for i in kyc_ids]),
+        BenchmarkCase("perform_kyc_check", len(kyc_ids),
+                      lambda: [perform_kyc_check(session, i) for i in kyc_ids]),
+        BenchmarkCase("validate_aadhaar_batch", len(kyc_ids),
+                      lambda: validate_aadhaar_batch(session, kyc_ids)),
+        BenchmarkCase("perform_kyc_check_batch", len(kyc_ids),
+                      lambda: perform_kyc_check_batch(session, kyc_ids)),
+        BenchmarkCase("digilocker_from_payload", len(decode_ids),
+                      lambda: [digilocker_from_payload(i, json.loads(p)) for i, p in zip(decode_ids, digilocker_json)]),
+        BenchmarkCase("decode_digilocker", len(decode_ids),
+                      lambda: [decode_digilocker(i, p) for i, p in zip(decode_ids, digilocker_json)]),
+        BenchmarkCase("kyc_from_payload", len(decode_ids),
+                      lambda: [kyc_from_payload(json.loads(p)) for p in kyc_json]),
+        BenchmarkCase("decode_kyc", len(decode_ids),
+                      lambda: [decode_kyc(p) for p in kyc_json]),
+    ]
+
+
+def run_cases(cases: list[BenchmarkCase], repeat: int = 5) -> dict[str, dict]:
+    results = {}
+    for case in cases:
+        seconds = min(timeit.repeat(case.run, number=1, repeat=repeat))
+        results[case.name] = {"rows": case.rows, "seconds": seconds}
+    return results
+
+
+def missing_from_baseline(results: dict, baseline: dict) -> list[str]:
+    """Names of cases the baseline cannot judge: no entry, or one recorded for a different row count."""
+    return [
+        name for name, result in results.items()
+        if name not in baseline or baseline[name]["rows"] != result["rows"]
+    ]
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Names of cases slower than their baseline by more than tolerance (see missing_from_baseline for the rest)."""
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None or expected["rows"] != result["rows"]:
+            continue
+        slowdown = result["seconds"] - expected["seconds"]
+        if result["seconds"] > expected["seconds"] * (1 + tolerance) and slowdown > NOISE_FLOOR_SECONDS:
+            regressions.append(name)
+    return regressions
+
+
+def baseline_path(scale: str) -> Path:
+    return BASELINE_DIR / f"{scale}.json"
+
+
+def load_baseline(scale: str) -> dict:
+    path = baseline_path(scale)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(scale: str, results: dict):
+    BASELINE_DIR.mkdir(exist_ok=True)
+    baseline_path(scale).write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="10k")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_cases(build_cases(SCALES[args.scale], args.seed), args.repeat)
+    baseline = load_baseline(args.scale)
+
+    print(f"Benchmark suite ({args.scale})")
+    for name, result in results.items():
+        expected = baseline.get(name)
+        ratio = f"{result['seconds'] / expected['seconds']:6.2f}x baseline" if expected else "no baseline"
+        print(f"  {name:<38} {result['rows']:>9,} rows {result['seconds'] * 1000:10.1f} ms   {ratio}")
+
+    if args.update_baseline:
+        save_baseline(args.scale, results)
+        print(f"Baseline written to {baseline_path(args.scale)}")
+        return 0
+
+    if not baseline_path(args.scale).exists():
+        print(f"No baseline at {baseline_path(args.scale)}; record one with --update-baseline")
+        return 1
+    status = 0
+    missing = missing_from_baseline(results, baseline)
+    if missing:
+        print(f"Cases missing from the baseline (record with --update-baseline): {', '.join(missing)}")
+        status = 1
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print(f"Regressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -53,10 +53,10 @@ echo "  - BORROWER_ELIGIBILITY_STATUS (real-time eligibility)"
 echo "  - RMBS_ELIGIBLE_LOANS (6-month MHP tracking)"
 echo ""
 echo "Test Aadhaar Numbers:"
-echo "  - 123456789012 (Priya Sharma) - Full KYC"
-echo "  - 234567890123 (Rahul Verma) - Full KYC"
-echo "  - 345678901234 (Anita Patel) - Partial KYC"
-echo "  - 567890123456 (Meera Reddy) - Minimal docs"
+echo "  - 123456789010 (Priya Sharma) - Full KYC"
+echo "  - 234567890124 (Rahul Verma) - Full KYC"
+echo "  - 345678901238 (Anita Patel) - Partial KYC"
+echo "  - 567890123458 (Meera Reddy) - Minimal docs"
 echo ""
 echo "To deploy Streamlit app:"
 echo "  snow streamlit deploy --connection $CONNECTION"
@@ -36,30 +36,30 @@ CREATE TABLE IF NOT EXISTS CORE.MOCK_DIGILOCKER_DOCUMENTS (
 -- Seed mock UIDAI data for testing
 INSERT INTO CORE.MOCK_UIDAI_REGISTRY (AADHAAR_ID, NAME, DATE_OF_BIRTH, GENDER, ADDRESS, IS_ACTIVE)
 SELECT * FROM VALUES
-    ('123456789012', 'Priya Sharma', '1990-05-15', 'F', '42 MG Road, Bangalore, Karnataka 560001', TRUE),
-    ('234567890123', 'Rahul Verma', '1985-08-22', 'M', '15 Park Street, Kolkata, West Bengal 700016', TRUE),
-    ('345678901234', 'Anita Patel', '1992-03-10', 'F', '78 Link Road, Mumbai, Maharashtra 400053', TRUE),
-    ('456789012345', 'Vijay Kumar', '1988-11-28', 'M', '23 Anna Salai, Chennai, Tamil Nadu 600002', TRUE),
-    ('567890123456', 'Meera Reddy', '1995-07-04', 'F', '56 Jubilee Hills, Hyderabad, Telangana 500033', TRUE),
-    ('999999999999', 'Inactive User', '1980-01-01', 'M', 'Unknown', FALSE)
+    ('123456789010', 'Priya Sharma', '1990-05-15', 'F', '42 MG Road, Bangalore, Karnataka 560001', TRUE),
+    ('234567890124', 'Rahul Verma', '1985-08-22', 'M', '15 Park Street, Kolkata, West Bengal 700016', TRUE),
+    ('345678901238', 'Anita Patel', '1992-03-10', 'F', '78 Link Road, Mumbai, Maharashtra 400053', TRUE),
+    ('456789012341', 'Vijay Kumar', '1988-11-28', 'M', '23 Anna Salai, Chennai, Tamil Nadu 600002', TRUE),
+    ('567890123458', 'Meera Reddy', '1995-07-04', 'F', '56 Jubilee Hills, Hyderabad, Telangana 500033', TRUE),
+    ('999999999997', 'Inactive User', '1980-01-01', 'M', 'Unknown', FALSE)
 WHERE NOT EXISTS (SELECT 1 FROM CORE.MOCK_UIDAI_REGISTRY LIMIT 1);
 
 -- Seed mock DigiLocker documents
 INSERT INTO CORE.MOCK_DIGILOCKER_DOCUMENTS (DOC_ID, AADHAAR_ID, DOC_TYPE, DOC_NUMBER, ISSUER, ISSUE_DATE, VERIFICATION_STATUS, DOC_METADATA)
 SELECT * FROM VALUES
-    (UUID_STRING(), '123456789012', 'AADHAAR', '123456789012', 'UIDAI', '2015-01-10', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-9012"}')),
-    (UUID_STRING(), '123456789012', 'PAN', 'ABCDE1234F', 'Income Tax Dept', '2016-03-20', 'VERIFIED', PARSE_JSON('{"name_on_card": "PRIYA SHARMA"}')),
-    (UUID_STRING(), '123456789012', 'FORM_16', 'F16-2024-PS', 'TCS Ltd', '2024-06-15', 'VERIFIED', PARSE_JSON('{"fy": "2023-24", "gross_salary": 1200000}')),
-    (UUID_STRING(), '234567890123', 'AADHAAR', '234567890123', 'UIDAI', '2014-06-05', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-0123"}')),
-    (UUID_STRING(), '234567890123', 'PAN', 'FGHIJ5678K', 'Income Tax Dept', '2015-09-12', 'VERIFIED', PARSE_JSON('{"name_on_card": "RAHUL VERMA"}')),
-    (UUID_STRING(), '234567890123', 'ITR', 'ITR-2024-RV', 'Income Tax Dept', '2024-07-31', 'VERIFIED', PARSE_JSON('{"ay": "2024-25", "total_income": 1800000}')),
-    (UUID_STRING(), '345678901234', 'AADHAAR', '345678901234', 'UIDAI', '2016-02-28', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-1234"}')),
-    (UUID_STRING(), '345678901234', 'PAN', 'KLMNO9012P', 'Income Tax Dept', '2017-01-15', 'VERIFIED', PARSE_JSON('{"name_on_card": "ANITA PATEL"}')),
-    (UUID_STRING(), '345678901234', 'PROPERTY_DEED', 'PD-MH-2023-456', 'Sub-Registrar Mumbai', '2023-04-10', 'VERIFIED', PARSE_JSON('{"property_value": 7500000, "area_sqft": 850}')),
-    (UUID_STRING(), '456789012345', 'AADHAAR', '456789012345', 'UIDAI', '2013-11-20', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-2345"}')),
-    (UUID_STRING(), '456789012345', 'PAN', 'PQRST3456U', 'Income Tax Dept', '2014-05-08', 'VERIFIED', PARSE_JSON('{"name_on_card": "VIJAY KUMAR"}')),
-    (UUID_STRING(), '567890123456', 'AADHAAR', '567890123456', 'UIDAI', '2017-09-14', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-3456"}')),
-    (UUID_STRING(), '567890123456', 'DRIVING_LICENSE', 'TS-1234567890', 'RTO Hyderabad', '2020-02-20', 'VERIFIED', PARSE_JSON('{"valid_until": "2040-02-19", "vehicle_class": "LMV"}'))
+    (UUID_STRING(), '123456789010', 'AADHAAR', '123456789010', 'UIDAI', '2015-01-10', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-9010"}')),
+    (UUID_STRING(), '123456789010', 'PAN', 'ABCDE1234F', 'Income Tax Dept', '2016-03-20', 'VERIFIED', PARSE_JSON('{"name_on_card": "PRIYA SHARMA"}')),
+    (UUID_STRING(), '123456789010', 'FORM_16', 'F16-2024-PS', 'TCS Ltd', '2024-06-15', 'VERIFIED', PARSE_JSON('{"fy": "2023-24", "gross_salary": 1200000}')),
+    (UUID_STRING(), '234567890124', 'AADHAAR', '234567890124', 'UIDAI', '2014-06-05', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-0124"}')),
+    (UUID_STRING(), '234567890124', 'PAN', 'FGHIJ5678K', 'Income Tax Dept', '2015-09-12', 'VERIFIED', PARSE_JSON('{"name_on_card": "RAHUL VERMA"}')),
+    (UUID_STRING(), '234567890124', 'ITR', 'ITR-2024-RV', 'Income Tax Dept', '2024-07-31', 'VERIFIED', PARSE_JSON('{"ay": "2024-25", "total_income": 1800000}')),
+    (UUID_STRING(), '345678901238', 'AADHAAR', '345678901238', 'UIDAI', '2016-02-28', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-1238"}')),
+    (UUID_STRING(), '345678901238', 'PAN', 'KLMNO9012P', 'Income Tax Dept', '2017-01-15', 'VERIFIED', PARSE_JSON('{"name_on_card": "ANITA PATEL"}')),
+    (UUID_STRING(), '345678901238', 'PROPERTY_DEED', 'PD-MH-2023-456', 'Sub-Registrar Mumbai', '2023-04-10', 'VERIFIED', PARSE_JSON('{"property_value": 7500000, "area_sqft": 850}')),
+    (UUID_STRING(), '456789012341', 'AADHAAR', '456789012341', 'UIDAI', '2013-11-20', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-2341"}')),
+    (UUID_STRING(), '456789012341', 'PAN', 'PQRST3456U', 'Income Tax Dept', '2014-05-08', 'VERIFIED', PARSE_JSON('{"name_on_card": "VIJAY KUMAR"}')),
+    (UUID_STRING(), '567890123458', 'AADHAAR', '567890123458', 'UIDAI', '2017-09-14', 'VERIFIED', PARSE_JSON('{"masked": "XXXX-XXXX-3458"}')),
+    (UUID_STRING(), '567890123458', 'DRIVING_LICENSE', 'TS-1234567890', 'RTO Hyderabad', '2020-02-20', 'VERIFIED', PARSE_JSON('{"valid_until": "2040-02-19", "vehicle_class": "LMV"}'))
 WHERE NOT EXISTS (SELECT 1 FROM CORE.MOCK_DIGILOCKER_DOCUMENTS LIMIT 1);
 
 -- ============================================
@@ -225,6 +225,135 @@ BEGIN
 END;
 $$;
 
+-- Set-based variants: one call resolves an array of Aadhaar IDs and returns an
+-- object keyed by ID whose values match the single-ID procedures' responses
+CREATE OR REPLACE PROCEDURE CORE.VERIFY_AADHAAR_BATCH(AADHAAR_IDS ARRAY)
+RETURNS OBJECT
+LANGUAGE SQL
+AS
+$$
+DECLARE
+    results OBJECT;
+BEGIN
+    SELECT OBJECT_AGG(i.ID, CASE
+        WHEN LENGTH(i.ID) != 12 OR TRY_TO_NUMBER(i.ID) IS NULL THEN OBJECT_CONSTRUCT(
+            'success', FALSE, 'error_code', 'INVALID_FORMAT', 'error_message', 'Aadhaar must be 12 digits')
+        WHEN r.AADHAAR_ID IS NULL THEN OBJECT_CONSTRUCT(
+            'success', FALSE, 'error_code', 'NOT_FOUND', 'error_message', 'Aadhaar not found in registry')
+        WHEN r.IS_ACTIVE = FALSE THEN OBJECT_CONSTRUCT(
+            'success', FALSE, 'error_code', 'INACTIVE', 'error_message', 'Aadhaar is deactivated')
+        ELSE OBJECT_CONSTRUCT(
+            'success', TRUE,
+            'aadhaar_id', r.AADHAAR_ID,
+            'name', r.NAME,
+            'date_of_birth', r.DATE_OF_BIRTH,
+            'gender', r.GENDER,
+            'is_active', r.IS_ACTIVE,
+            'verification_timestamp', CURRENT_TIMESTAMP())
+    END) INTO results
+    FROM (SELECT DISTINCT f.value::VARCHAR AS ID FROM TABLE(FLATTEN(INPUT => :AADHAAR_IDS)) f) i
+    LEFT JOIN CORE.MOCK_UIDAI_REGISTRY r ON r.AADHAAR_ID = i.ID;
+    
+    RETURN COALESCE(results, OBJECT_CONSTRUCT());
+END;
+$$;
+
+CREATE OR REPLACE PROCEDURE CORE.FETCH_DIGILOCKER_DOCUMENTS_BATCH(AADHAAR_IDS ARRAY, DOC_TYPE VARCHAR DEFAULT NULL)
+RETURNS OBJECT
+LANGUAGE SQL
+AS
+$$
+DECLARE
+    verified OBJECT;
+    results OBJECT;
+BEGIN
+    CALL CORE.VERIFY_AADHAAR_BATCH(:AADHAAR_IDS) INTO verified;
+    
+    SELECT OBJECT_AGG(v.key, IFF(v.value:success = FALSE,
+        OBJECT_CONSTRUCT(
+            'success', FALSE,
+            'error_code', 'AADHAAR_INVALID',
+            'error_message', v.value:error_message),
+        OBJECT_CONSTRUCT(
+            'success', TRUE,
+            'aadhaar_id', v.key,
+            'holder_name', v.value:name,
+            'document_count', ARRAY_SIZE(COALESCE(d.DOCS, ARRAY_CONSTRUCT())),
+            'documents', COALESCE(d.DOCS, ARRAY_CONSTRUCT()))
+    )) INTO results
+    FROM TABLE(FLATTEN(INPUT => :verified)) v
+    LEFT JOIN (
+        SELECT AADHAAR_ID, ARRAY_AGG(OBJECT_CONSTRUCT(
+            'doc_id', DOC_ID,
+            'doc_type', DOC_TYPE,
+            'doc_number', DOC_NUMBER,
+            'issuer', ISSUER,
+            'issue_date', ISSUE_DATE,
+            'status', VERIFICATION_STATUS,
+            'metadata', DOC_METADATA
+        )) AS DOCS
+        FROM CORE.MOCK_DIGILOCKER_DOCUMENTS
+        WHERE ARRAY_CONTAINS(AADHAAR_ID::VARIANT, :AADHAAR_IDS)
+          AND (:DOC_TYPE IS NULL OR DOC_TYPE = :DOC_TYPE)
+        GROUP BY AADHAAR_ID
+    ) d ON d.AADHAAR_ID = v.key;
+    
+    RETURN COALESCE(results, OBJECT_CONSTRUCT());
+END;
+$$;
+
+CREATE OR REPLACE PROCEDURE CORE.PERFORM_KYC_CHECK_BATCH(AADHAAR_IDS ARRAY)
+RETURNS OBJECT
+LANGUAGE SQL
+AS
+$$
+DECLARE
+    verified OBJECT;
+    documents OBJECT;
+    results OBJECT;
+BEGIN
+    CALL CORE.VERIFY_AADHAAR_BATCH(:AADHAAR_IDS) INTO verified;
+    CALL CORE.FETCH_DIGILOCKER_DOCUMENTS_BATCH(:AADHAAR_IDS) INTO documents;
+    
+    SELECT OBJECT_AGG(k.ID, IFF(k.AADHAAR:success = FALSE,
+        OBJECT_CONSTRUCT(
+            'kyc_status', 'FAILED',
+            'stage', 'AADHAAR_VERIFICATION',
+            'error', k.AADHAAR:error_message),
+        OBJECT_CONSTRUCT(
+            'kyc_status', IFF(k.HAS_PAN, 'PASSED', 'INCOMPLETE'),
+            'aadhaar_verified', TRUE,
+            'holder_name', k.AADHAAR:name,
+            'date_of_birth', k.AADHAAR:date_of_birth,
+            'documents_found', k.DOCUMENT_COUNT,
+            'has_pan', k.HAS_PAN,
+            'has_income_proof', k.HAS_INCOME_PROOF,
+            'missing_documents', ARRAY_CONSTRUCT_COMPACT(
+                IFF(NOT k.HAS_PAN, 'PAN', NULL),
+                IFF(NOT k.HAS_INCOME_PROOF, 'Income Proof (Form 16 or ITR)', NULL)
+            ),
+            'verification_timestamp', CURRENT_TIMESTAMP())
+    )) INTO results
+    FROM (
+        SELECT
+            j.ID,
+            ANY_VALUE(j.AADHAAR) AS AADHAAR,
+            ANY_VALUE(j.DIGILOCKER:document_count) AS DOCUMENT_COUNT,
+            COUNT_IF(d.value:doc_type = 'PAN') > 0 AS HAS_PAN,
+            COUNT_IF(d.value:doc_type IN ('FORM_16', 'ITR')) > 0 AS HAS_INCOME_PROOF
+        FROM (
+            SELECT v.key AS ID, v.value AS AADHAAR, dl.value AS DIGILOCKER
+            FROM TABLE(FLATTEN(INPUT => :verified)) v
+            LEFT JOIN TABLE(FLATTEN(INPUT => :documents)) dl ON dl.key = v.key
+        ) j,
+        LATERAL FLATTEN(INPUT => j.DIGILOCKER:documents, OUTER => TRUE) d
+        GROUP BY j.ID
+    ) k;
+    
+    RETURN COALESCE(results, OBJECT_CONSTRUCT());
+END;
+$$;
+
 -- ============================================
 -- BASE TABLES
 -- ============================================
@@ -273,10 +402,44 @@ CREATE TABLE IF NOT EXISTS CORE.RMBS_POOLS (
     TRUSTEE VARCHAR(255) NOT NULL,
     TOTAL_VALUE NUMBER(20,2) DEFAULT 0,
     LOAN_COUNT INT DEFAULT 0,
+    CREDIT_SCORE_SUM NUMBER(20,0) DEFAULT 0,
+    WEIGHTED_RATE_SUM NUMBER(28,6) DEFAULT 0,
     STATUS VARCHAR(20) DEFAULT 'OPEN',
     CREATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
 );
 
+-- Last run of ASSIGN_LOANS_TO_POOLS: loans whose eligible date is on or before
+-- WATERMARK were already considered, so each run only looks past it (plus loans
+-- and borrowers changed since LAST_RUN_AT, e.g. approvals and late back-dated loans)
+CREATE TABLE IF NOT EXISTS CORE.POOL_ASSIGNMENT_WATERMARK (
+    JOB_NAME VARCHAR(50) PRIMARY KEY,
+    WATERMARK DATE,
+    LAST_RUN_AT TIMESTAMP_NTZ,
+    UPDATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
+);
+
+-- Running aggregates maintained by ASSIGN_LOANS_TO_POOLS (added for existing installs)
+ALTER TABLE CORE.RMBS_POOLS ADD COLUMN IF NOT EXISTS CREDIT_SCORE_SUM NUMBER(20,0) DEFAULT 0;
+ALTER TABLE CORE.RMBS_POOLS ADD COLUMN IF NOT EXISTS WEIGHTED_RATE_SUM NUMBER(28,6) DEFAULT 0;
+
+-- Backfill the new sums for pools that already hold loans, so averages and WAC are right
+-- from install instead of reading 0 until the weekly verification repairs them
+MERGE INTO CORE.RMBS_POOLS P
+USING (
+    SELECT
+        L.POOL_ID,
+        SUM(B.CREDIT_SCORE) AS CREDIT_SCORE_SUM,
+        SUM(L.AMOUNT * L.INTEREST_RATE) AS WEIGHTED_RATE_SUM
+    FROM CORE.LOANS L
+    JOIN CORE.BORROWERS B ON L.BORROWER_ID = B.AADHAAR_ID
+    WHERE L.POOL_ID IS NOT NULL
+    GROUP BY L.POOL_ID
+) S
+ON P.POOL_ID = S.POOL_ID
+WHEN MATCHED AND COALESCE(P.CREDIT_SCORE_SUM, 0) = 0 AND COALESCE(P.WEIGHTED_RATE_SUM, 0) = 0 THEN UPDATE SET
+    P.CREDIT_SCORE_SUM = S.CREDIT_SCORE_SUM,
+    P.WEIGHTED_RATE_SUM = S.WEIGHTED_RATE_SUM;
+
 -- ============================================
 -- SEED DATA: Sample borrowers and loans for MVP demo
 -- ============================================
@@ -284,20 +447,20 @@ CREATE TABLE IF NOT EXISTS CORE.RMBS_POOLS (
 -- Seed borrowers from mock UIDAI data (with financial details)
 INSERT INTO CORE.BORROWERS (AADHAAR_ID, NAME, DATE_OF_BIRTH, MONTHLY_INCOME, MONTHLY_LIABILITIES, CREDIT_SCORE, KYC_VERIFIED, KYC_VERIFIED_DATE)
 SELECT * FROM VALUES
-    ('123456789012', 'Priya Sharma', '1990-05-15'::DATE, 100000.00, 25000.00, 785, TRUE, CURRENT_TIMESTAMP()),
-    ('234567890123', 'Rahul Verma', '1985-08-22'::DATE, 150000.00, 40000.00, 810, TRUE, CURRENT_TIMESTAMP()),
-    ('345678901234', 'Anita Patel', '1992-03-10'::DATE, 85000.00, 30000.00, 760, TRUE, CURRENT_TIMESTAMP()),
-    ('456789012345', 'Vijay Kumar', '1988-11-28'::DATE, 120000.00, 65000.00, 720, TRUE, CURRENT_TIMESTAMP())
+    ('123456789010', 'Priya Sharma', '1990-05-15'::DATE, 100000.00, 25000.00, 785, TRUE, CURRENT_TIMESTAMP()),
+    ('234567890124', 'Rahul Verma', '1985-08-22'::DATE, 150000.00, 40000.00, 810, TRUE, CURRENT_TIMESTAMP()),
+    ('345678901238', 'Anita Patel', '1992-03-10'::DATE, 85000.00, 30000.00, 760, TRUE, CURRENT_TIMESTAMP()),
+    ('456789012341', 'Vijay Kumar', '1988-11-28'::DATE, 120000.00, 65000.00, 720, TRUE, CURRENT_TIMESTAMP())
 WHERE NOT EXISTS (SELECT 1 FROM CORE.BORROWERS LIMIT 1);
 
 -- Seed sample loans (some eligible for RMBS pooling)
 INSERT INTO CORE.LOANS (LOAN_ID, BORROWER_ID, AMOUNT, INTEREST_RATE, TENURE_MONTHS, DISBURSEMENT_DATE, STATUS)
 SELECT * FROM VALUES
-    ('LOAN-A1B2C3D4', '123456789012', 5000000.00, 0.0750, 240, '2025-03-15'::DATE, 'ACTIVE'),
-    ('LOAN-E5F6G7H8', '234567890123', 7500000.00, 0.0725, 300, '2025-02-01'::DATE, 'ACTIVE'),
-    ('LOAN-I9J0K1L2', '345678901234', 3500000.00, 0.0775, 180, '2025-04-20'::DATE, 'ACTIVE'),
-    ('LOAN-M3N4O5P6', '123456789012', 1500000.00, 0.0800, 120, '2024-06-10'::DATE, 'ACTIVE'),
-    ('LOAN-Q7R8S9T0', '234567890123', 4500000.00, 0.0750, 240, '2024-05-01'::DATE, 'ACTIVE')
+    ('LOAN-A1B2C3D4', '123456789010', 5000000.00, 0.0750, 240, '2025-03-15'::DATE, 'ACTIVE'),
+    ('LOAN-E5F6G7H8', '234567890124', 7500000.00, 0.0725, 300, '2025-02-01'::DATE, 'ACTIVE'),
+    ('LOAN-I9J0K1L2', '345678901238', 3500000.00, 0.0775, 180, '2025-04-20'::DATE, 'ACTIVE'),
+    ('LOAN-M3N4O5P6', '123456789010', 1500000.00, 0.0800, 120, '2024-06-10'::DATE, 'ACTIVE'),
+    ('LOAN-Q7R8S9T0', '234567890124', 4500000.00, 0.0750, 240, '2024-05-01'::DATE, 'ACTIVE')
 WHERE NOT EXISTS (SELECT 1 FROM CORE.LOANS LIMIT 1);
 
 -- ============================================
@@ -512,46 +675,159 @@ AS
 $$
 DECLARE
     assigned_count INT DEFAULT 0;
+    run_date DATE DEFAULT CURRENT_DATE();
+    run_started_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()::TIMESTAMP_NTZ;
+    last_watermark DATE;
+    last_run_at TIMESTAMP_NTZ;
 BEGIN
+    SELECT MAX(WATERMARK), MAX(LAST_RUN_AT) INTO last_watermark, last_run_at
+    FROM CORE.POOL_ASSIGNMENT_WATERMARK
+    WHERE JOB_NAME = 'ASSIGN_LOANS_TO_POOLS';
+    
+    -- Snapshot the loans crossing the MHP since the watermark (all unpooled loans on the first run)
+    CREATE OR REPLACE TEMPORARY TABLE CORE.NEWLY_POOLED_LOANS (
+        LOAN_ID VARCHAR(36),
+        ASSIGNED_POOL_ID VARCHAR(50),
+        POOL_ELIGIBLE_DATE DATE,
+        AMOUNT NUMBER(15,2),
+        INTEREST_RATE NUMBER(5,4),
+        CREDIT_SCORE INT
+    );
+    
+    INSERT INTO CORE.NEWLY_POOLED_LOANS
+    SELECT
+        L.LOAN_ID,
+        CONCAT('RMBS-', YEAR(L.ELIGIBLE_DATE), '-Q', CEIL(MONTH(L.ELIGIBLE_DATE) / 3)),
+        L.ELIGIBLE_DATE,
+        L.AMOUNT,
+        L.INTEREST_RATE,
+        B.CREDIT_SCORE
+    FROM (
+        SELECT LOAN_ID, BORROWER_ID, AMOUNT, INTEREST_RATE, UPDATED_AT,
+            COALESCE(POOL_ELIGIBLE_DATE, DATEADD(MONTH, 6, DISBURSEMENT_DATE)) AS ELIGIBLE_DATE
+        FROM CORE.LOANS
+        WHERE POOL_ID IS NULL AND STATUS = 'ACTIVE'
+    ) L
+    JOIN CORE.BORROWERS B ON L.BORROWER_ID = B.AADHAAR_ID
+    WHERE B.CREDIT_SCORE >= 750
+      AND L.ELIGIBLE_DATE <= :run_date
+      AND (
+          :last_watermark IS NULL
+          OR L.ELIGIBLE_DATE > :last_watermark
+          OR L.UPDATED_AT >= :last_run_at
+          OR B.UPDATED_AT >= :last_run_at
+      );
+    
     -- Update loans that are now eligible for RMBS pools
     UPDATE CORE.LOANS L
     SET 
-        POOL_ID = E.ASSIGNED_POOL_ID,
-        POOL_ELIGIBLE_DATE = E.POOL_ELIGIBLE_DATE,
+        POOL_ID = N.ASSIGNED_POOL_ID,
+        POOL_ELIGIBLE_DATE = N.POOL_ELIGIBLE_DATE,
         UPDATED_AT = CURRENT_TIMESTAMP()
-    FROM CORE.RMBS_ELIGIBLE_LOANS E
-    WHERE L.LOAN_ID = E.LOAN_ID
+    FROM CORE.NEWLY_POOLED_LOANS N
+    WHERE L.LOAN_ID = N.LOAN_ID
       AND L.POOL_ID IS NULL;
     
     assigned_count := SQLROWCOUNT;
     
-    -- Ensure pools exist
+    -- Ensure pools exist (one row per pool, aggregated from its earliest eligible loan)
     INSERT INTO CORE.RMBS_POOLS (POOL_ID, NAME, AGGREGATION_DATE, TRUSTEE)
-    SELECT DISTINCT 
+    SELECT 
         ASSIGNED_POOL_ID,
-        CONCAT('Housing Pool ', YEAR(POOL_ELIGIBLE_DATE), ' Q', CEIL(MONTH(POOL_ELIGIBLE_DATE) / 3)),
-        POOL_ELIGIBLE_DATE,
+        CONCAT('Housing Pool ', YEAR(MIN(POOL_ELIGIBLE_DATE)), ' Q', CEIL(MONTH(MIN(POOL_ELIGIBLE_DATE)) / 3)),
+        MIN(POOL_ELIGIBLE_DATE),
         'India Housing Trust'
-    FROM CORE.RMBS_ELIGIBLE_LOANS
-    WHERE ASSIGNED_POOL_ID NOT IN (SELECT POOL_ID FROM CORE.RMBS_POOLS);
+    FROM CORE.NEWLY_POOLED_LOANS
+    WHERE ASSIGNED_POOL_ID NOT IN (SELECT POOL_ID FROM CORE.RMBS_POOLS)
+    GROUP BY ASSIGNED_POOL_ID;
     
-    -- Update pool statistics
+    -- Apply this run's deltas to the running pool statistics
     MERGE INTO CORE.RMBS_POOLS P
     USING (
-        SELECT POOL_ID, COUNT(*) AS LOAN_COUNT, SUM(AMOUNT) AS TOTAL_VALUE
-        FROM CORE.LOANS
-        WHERE POOL_ID IS NOT NULL
-        GROUP BY POOL_ID
+        SELECT
+            ASSIGNED_POOL_ID AS POOL_ID,
+            COUNT(*) AS LOAN_COUNT,
+            SUM(AMOUNT) AS TOTAL_VALUE,
+            SUM(CREDIT_SCORE) AS CREDIT_SCORE_SUM,
+            SUM(AMOUNT * INTEREST_RATE) AS WEIGHTED_RATE_SUM
+        FROM CORE.NEWLY_POOLED_LOANS
+        GROUP BY ASSIGNED_POOL_ID
     ) S
     ON P.POOL_ID = S.POOL_ID
     WHEN MATCHED THEN UPDATE SET
-        P.LOAN_COUNT = S.LOAN_COUNT,
-        P.TOTAL_VALUE = S.TOTAL_VALUE;
+        P.LOAN_COUNT = COALESCE(P.LOAN_COUNT, 0) + S.LOAN_COUNT,
+        P.TOTAL_VALUE = COALESCE(P.TOTAL_VALUE, 0) + S.TOTAL_VALUE,
+        P.CREDIT_SCORE_SUM = COALESCE(P.CREDIT_SCORE_SUM, 0) + S.CREDIT_SCORE_SUM,
+        P.WEIGHTED_RATE_SUM = COALESCE(P.WEIGHTED_RATE_SUM, 0) + S.WEIGHTED_RATE_SUM;
+    
+    DROP TABLE IF EXISTS CORE.NEWLY_POOLED_LOANS;
+    
+    MERGE INTO CORE.POOL_ASSIGNMENT_WATERMARK W
+    USING (SELECT 'ASSIGN_LOANS_TO_POOLS' AS JOB_NAME) S
+    ON W.JOB_NAME = S.JOB_NAME
+    WHEN MATCHED THEN UPDATE SET
+        W.WATERMARK = :run_date, W.LAST_RUN_AT = :run_started_at, W.UPDATED_AT = CURRENT_TIMESTAMP()
+    WHEN NOT MATCHED THEN INSERT (JOB_NAME, WATERMARK, LAST_RUN_AT)
+        VALUES (S.JOB_NAME, :run_date, :run_started_at);
     
     RETURN 'Assigned ' || assigned_count || ' loans to RMBS pools';
 END;
 $$;
 
+-- Full GROUP BY rebuild of the running pool statistics; reports drift and repairs it when asked
+CREATE OR REPLACE PROCEDURE CORE.VERIFY_POOL_AGGREGATES(P_REPAIR BOOLEAN)
+RETURNS OBJECT
+LANGUAGE SQL
+AS
+$$
+DECLARE
+    drifted_pools INT DEFAULT 0;
+BEGIN
+    CREATE OR REPLACE TEMPORARY TABLE CORE.POOL_AGGREGATES_REBUILT AS
+    SELECT
+        L.POOL_ID,
+        COUNT(*) AS LOAN_COUNT,
+        SUM(L.AMOUNT) AS TOTAL_VALUE,
+        SUM(B.CREDIT_SCORE) AS CREDIT_SCORE_SUM,
+        SUM(L.AMOUNT * L.INTEREST_RATE) AS WEIGHTED_RATE_SUM
+    FROM CORE.LOANS L
+    JOIN CORE.BORROWERS B ON L.BORROWER_ID = B.AADHAAR_ID
+    WHERE L.POOL_ID IS NOT NULL
+    GROUP BY L.POOL_ID;
+    
+    SELECT COUNT(*) INTO drifted_pools
+    FROM CORE.RMBS_POOLS P
+    LEFT JOIN CORE.POOL_AGGREGATES_REBUILT S ON P.POOL_ID = S.POOL_ID
+    WHERE COALESCE(P.LOAN_COUNT, 0) != COALESCE(S.LOAN_COUNT, 0)
+       OR COALESCE(P.TOTAL_VALUE, 0) != COALESCE(S.TOTAL_VALUE, 0)
+       OR COALESCE(P.CREDIT_SCORE_SUM, 0) != COALESCE(S.CREDIT_SCORE_SUM, 0)
+       OR ABS(COALESCE(P.WEIGHTED_RATE_SUM, 0) - COALESCE(S.WEIGHTED_RATE_SUM, 0)) > 0.01;
+    
+    IF (P_REPAIR AND drifted_pools > 0) THEN
+        MERGE INTO CORE.RMBS_POOLS P
+        USING (
+            SELECT P2.POOL_ID,
+                COALESCE(S.LOAN_COUNT, 0) AS LOAN_COUNT,
+                COALESCE(S.TOTAL_VALUE, 0) AS TOTAL_VALUE,
+                COALESCE(S.CREDIT_SCORE_SUM, 0) AS CREDIT_SCORE_SUM,
+                COALESCE(S.WEIGHTED_RATE_SUM, 0) AS WEIGHTED_RATE_SUM
+            FROM CORE.RMBS_POOLS P2
+            LEFT JOIN CORE.POOL_AGGREGATES_REBUILT S ON P2.POOL_ID = S.POOL_ID
+        ) S
+        ON P.POOL_ID = S.POOL_ID
+        WHEN MATCHED THEN UPDATE SET
+            P.LOAN_COUNT = S.LOAN_COUNT,
+            P.TOTAL_VALUE = S.TOTAL_VALUE,
+            P.CREDIT_SCORE_SUM = S.CREDIT_SCORE_SUM,
+            P.WEIGHTED_RATE_SUM = S.WEIGHTED_RATE_SUM;
+    END IF;
+    
+    DROP TABLE IF EXISTS CORE.POOL_AGGREGATES_REBUILT;
+    
+    RETURN OBJECT_CONSTRUCT('drifted_pools', drifted_pools, 'repaired', P_REPAIR AND drifted_pools > 0);
+END;
+$$;
+
 CREATE OR REPLACE PROCEDURE CORE.ISSUE_ELIGIBILITY_CERTIFICATE(BORROWER_AADHAAR VARCHAR)
 RETURNS OBJECT
 LANGUAGE SQL
@@ -607,6 +883,15 @@ AS
 -- Enable the task
 ALTER TASK CORE.DAILY_POOL_ASSIGNMENT RESUME;
 
+-- Weekly full rebuild to catch drift in the running pool statistics
+CREATE OR REPLACE TASK CORE.WEEKLY_POOL_AGGREGATE_VERIFICATION
+    WAREHOUSE = COMPUTE_WH
+    SCHEDULE = 'USING CRON 0 3 * * 0 UTC'
+AS
+    CALL CORE.VERIFY_POOL_AGGREGATES(TRUE);
+
+ALTER TASK CORE.WEEKLY_POOL_AGGREGATE_VERIFICATION RESUME;
+
 -- ============================================
 -- GRANTS for application roles
 -- ============================================
@@ -622,10 +907,14 @@ GRANT USAGE ON SCHEMA CORE TO APPLICATION ROLE APP_ADMIN;
 GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA CORE TO APPLICATION ROLE APP_ADMIN;
 GRANT ALL PRIVILEGES ON ALL DYNAMIC TABLES IN SCHEMA CORE TO APPLICATION ROLE APP_ADMIN;
 GRANT USAGE ON PROCEDURE CORE.ASSIGN_LOANS_TO_POOLS() TO APPLICATION ROLE APP_ADMIN;
+GRANT USAGE ON PROCEDURE CORE.VERIFY_POOL_AGGREGATES(BOOLEAN) TO APPLICATION ROLE APP_ADMIN;
 GRANT USAGE ON PROCEDURE CORE.ISSUE_ELIGIBILITY_CERTIFICATE(VARCHAR) TO APPLICATION ROLE APP_ADMIN;
 GRANT USAGE ON PROCEDURE CORE.VERIFY_AADHAAR(VARCHAR) TO APPLICATION ROLE APP_USER;
 GRANT USAGE ON PROCEDURE CORE.FETCH_DIGILOCKER_DOCUMENTS(VARCHAR, VARCHAR) TO APPLICATION ROLE APP_USER;
 GRANT USAGE ON PROCEDURE CORE.PERFORM_KYC_CHECK(VARCHAR) TO APPLICATION ROLE APP_USER;
+GRANT USAGE ON PROCEDURE CORE.VERIFY_AADHAAR_BATCH(ARRAY) TO APPLICATION ROLE APP_USER;
+GRANT USAGE ON PROCEDURE CORE.FETCH_DIGILOCKER_DOCUMENTS_BATCH(ARRAY, VARCHAR) TO APPLICATION ROLE APP_USER;
+GRANT USAGE ON PROCEDURE CORE.PERFORM_KYC_CHECK_BATCH(ARRAY) TO APPLICATION ROLE APP_USER;
 GRANT USAGE ON PROCEDURE CORE.REGISTER_BORROWER_FROM_KYC(VARCHAR, NUMBER, NUMBER, INT) TO APPLICATION ROLE APP_USER;
 GRANT USAGE ON PROCEDURE CORE.GET_BORROWER_SUMMARY(VARCHAR) TO APPLICATION ROLE APP_USER;
 
@@ -943,6 +1232,45 @@ CREATE TABLE IF NOT EXISTS CORE.LOAN_AMORTIZATION (
     CREATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
 );
 
+-- The demo Aadhaar IDs now end in a valid Verhoeff check digit, which the Python clients
+-- verify by default; move installs seeded with the old IDs onto the new ones. Runs after
+-- every table keyed by Aadhaar ID exists, so uploads and notifications move too
+CREATE OR REPLACE TEMPORARY TABLE CORE.DEMO_AADHAAR_REKEY (OLD_ID VARCHAR(12), NEW_ID VARCHAR(12)) AS
+SELECT * FROM VALUES
+    ('123456789012', '123456789010'),
+    ('234567890123', '234567890124'),
+    ('345678901234', '345678901238'),
+    ('456789012345', '456789012341'),
+    ('567890123456', '567890123458'),
+    ('999999999999', '999999999997');
+
+UPDATE CORE.MOCK_UIDAI_REGISTRY T SET AADHAAR_ID = M.NEW_ID
+FROM CORE.DEMO_AADHAAR_REKEY M WHERE T.AADHAAR_ID = M.OLD_ID;
+
+UPDATE CORE.MOCK_DIGILOCKER_DOCUMENTS T SET
+    AADHAAR_ID = M.NEW_ID,
+    DOC_NUMBER = IFF(T.DOC_TYPE = 'AADHAAR', M.NEW_ID, T.DOC_NUMBER),
+    DOC_METADATA = IFF(T.DOC_TYPE = 'AADHAAR', OBJECT_CONSTRUCT('masked', 'XXXX-XXXX-' || RIGHT(M.NEW_ID, 4)), T.DOC_METADATA)
+FROM CORE.DEMO_AADHAAR_REKEY M WHERE T.AADHAAR_ID = M.OLD_ID;
+
+UPDATE CORE.BORROWERS T SET AADHAAR_ID = M.NEW_ID
+FROM CORE.DEMO_AADHAAR_REKEY M WHERE T.AADHAAR_ID = M.OLD_ID;
+
+UPDATE CORE.LOANS T SET BORROWER_ID = M.NEW_ID
+FROM CORE.DEMO_AADHAAR_REKEY M WHERE T.BORROWER_ID = M.OLD_ID;
+
+UPDATE CORE.ELIGIBILITY_CERTIFICATES T SET BORROWER_ID = M.NEW_ID
+FROM CORE.DEMO_AADHAAR_REKEY M WHERE T.BORROWER_ID = M.OLD_ID;
+
+UPDATE CORE.UPLOADED_DOCUMENTS T SET AADHAAR_ID = M.NEW_ID
+FROM CORE.DEMO_AADHAAR_REKEY M WHERE T.AADHAAR_ID = M.OLD_ID;
+
+-- SEND_NOTIFICATION addresses borrowers by Aadhaar ID
+UPDATE CORE.NOTIFICATIONS T SET USER_ID = M.NEW_ID
+FROM CORE.DEMO_AADHAAR_REKEY M WHERE T.USER_ID = M.OLD_ID;
+
+DROP TABLE IF EXISTS CORE.DEMO_AADHAAR_REKEY;
+
 -- Generate Amortization Schedule
 CREATE OR REPLACE PROCEDURE CORE.GENERATE_AMORTIZATION_SCHEDULE(P_LOAN_ID VARCHAR)
 RETURNS OBJECT
@@ -2,6 +2,11 @@ from dataclasses import dataclass
 from typing import Optional, List
 import json
 
+from src.kyc.verhoeff import is_valid_verhoeff
+
+INVALID_FORMAT_MESSAGE = "Invalid Aadhaar format: must be 12 digits"
+INVALID_CHECKSUM_MESSAGE = "Invalid Aadhaar format: check digit mismatch"
+
 
 @dataclass
 class AadhaarVerificationResult:
@@ -42,27 +47,24 @@ class KYCResult:
     error_message: Optional[str]
 
 
-def validate_aadhaar(session, aadhaar_id: str) -> AadhaarVerificationResult:
+def validate_aadhaar(session, aadhaar_id: str, verify_checksum: bool = True) -> AadhaarVerificationResult:
     """
     Validate Aadhaar ID against mock UIDAI registry in Snowflake.
     
     Args:
         session: Snowflake session/connection
         aadhaar_id: 12-digit Aadhaar number
+        verify_checksum: Also reject IDs whose Verhoeff check digit is wrong
+            without calling Snowflake; pass False only to look up IDs that
+            predate check digits
     
     Returns:
         AadhaarVerificationResult with validation status and details
     """
     # Client-side format validation
-    if not aadhaar_id or len(aadhaar_id) != 12 or not aadhaar_id.isdigit():
-        return AadhaarVerificationResult(
-            aadhaar_id=aadhaar_id,
-            is_valid=False,
-            name=None,
-            date_of_birth=None,
-            gender=None,
-            error_message="Invalid Aadhaar format: must be 12 digits",
-        )
+    error_message = aadhaar_format_error(aadhaar_id, verify_checksum)
+    if error_message is not None:
+        return invalid_aadhaar_result(aadhaar_id, error_message)
     
     # Call Snowflake stored procedure
     result = session.call("CORE.VERIFY_AADHAAR", aadhaar_id)
@@ -70,6 +72,35 @@ def validate_aadhaar(session, aadhaar_id: str) -> AadhaarVerificationResult:
     if isinstance(result, str):
         result = json.loads(result)
     
+    return verification_from_payload(aadhaar_id, result)
+
+
+def is_valid_aadhaar_format(aadhaar_id: str) -> bool:
+    return bool(aadhaar_id) and len(aadhaar_id) == 12 and aadhaar_id.isdigit()
+
+
+def aadhaar_format_error(aadhaar_id: str, verify_checksum: bool = True) -> Optional[str]:
+    """Message for an ID that fails the local checks, or None if it may be sent to the registry."""
+    if not is_valid_aadhaar_format(aadhaar_id):
+        return INVALID_FORMAT_MESSAGE
+    if verify_checksum and not is_valid_verhoeff(aadhaar_id):
+        return INVALID_CHECKSUM_MESSAGE
+    return None
+
+
+def invalid_aadhaar_result(aadhaar_id: str, error_message: str = INVALID_FORMAT_MESSAGE) -> AadhaarVerificationResult:
+    return AadhaarVerificationResult(
+        aadhaar_id=aadhaar_id,
+        is_valid=False,
+        name=None,
+        date_of_birth=None,
+        gender=None,
+        error_message=error_message,
+    )
+
+
+def verification_from_payload(aadhaar_id: str, result: dict) -> AadhaarVerificationResult:
+    """Map a VERIFY_AADHAAR response object to AadhaarVerificationResult."""
     if not result.get("success"):
         return AadhaarVerificationResult(
             aadhaar_id=aadhaar_id,
@@ -90,7 +121,9 @@ def validate_aadhaar(session, aadhaar_id: str) -> AadhaarVerificationResult:
     )
 
 
-def fetch_digilocker_documents(session, aadhaar_id: str, doc_type: str = None) -> DigiLockerResult:
+def fetch_digilocker_documents(
+    session, aadhaar_id: str, doc_type: str = None, verify_checksum: bool = True
+) -> DigiLockerResult:
     """
     Fetch documents from mock DigiLocker registry in Snowflake.
     
@@ -98,10 +131,17 @@ def fetch_digilocker_documents(session, aadhaar_id: str, doc_type: str = None) -
         session: Snowflake session/connection
         aadhaar_id: 12-digit Aadhaar number
         doc_type: Optional filter for specific document type
+        verify_checksum: Reject malformed IDs and IDs with a wrong Verhoeff
+            check digit without calling Snowflake
     
     Returns:
         DigiLockerResult with documents list
     """
+    if verify_checksum:
+        error_message = aadhaar_format_error(aadhaar_id, verify_checksum)
+        if error_message is not None:
+            return DigiLockerResult(aadhaar_id, None, [], error_message)
+    
     # Call Snowflake stored procedure
     if doc_type:
         result = session.call("CORE.FETCH_DIGILOCKER_DOCUMENTS", aadhaar_id, doc_type)
@@ -111,6 +151,11 @@ def fetch_digilocker_documents(session, aadhaar_id: str, doc_type: str = None) -
     if isinstance(result, str):
         result = json.loads(result)
     
+    return digilocker_from_payload(aadhaar_id, result)
+
+
+def digilocker_from_payload(aadhaar_id: str, result: dict) -> DigiLockerResult:
+    """Map a FETCH_DIGILOCKER_DOCUMENTS response object to DigiLockerResult."""
     if not result.get("success"):
         return DigiLockerResult(
             aadhaar_id=aadhaar_id,
@@ -137,34 +182,37 @@ def fetch_digilocker_documents(session, aadhaar_id: str, doc_type: str = None) -
     )
 
 
-def perform_kyc_check(session, aadhaar_id: str) -> KYCResult:
+def perform_kyc_check(session, aadhaar_id: str, verify_checksum: bool = True) -> KYCResult:
     """
     Perform complete KYC verification using mock UIDAI and DigiLocker.
     
     Args:
         session: Snowflake session/connection
         aadhaar_id: 12-digit Aadhaar number
+        verify_checksum: Reject malformed IDs and IDs with a wrong Verhoeff
+            check digit without calling Snowflake
     
     Returns:
         KYCResult with complete verification status
     """
+    if verify_checksum:
+        error_message = aadhaar_format_error(aadhaar_id, verify_checksum)
+        if error_message is not None:
+            return kyc_failure(error_message)
+    
     # Call combined KYC procedure
     result = session.call("CORE.PERFORM_KYC_CHECK", aadhaar_id)
     
     if isinstance(result, str):
         result = json.loads(result)
     
+    return kyc_from_payload(result)
+
+
+def kyc_from_payload(result: dict) -> KYCResult:
+    """Map a PERFORM_KYC_CHECK response object to KYCResult."""
     if result.get("kyc_status") == "FAILED":
-        return KYCResult(
-            kyc_status="FAILED",
-            aadhaar_verified=False,
-            holder_name=None,
-            date_of_birth=None,
-            has_pan=False,
-            has_income_proof=False,
-            missing_documents=[],
-            error_message=result.get("error"),
-        )
+        return kyc_failure(result.get("error"))
     
     return KYCResult(
         kyc_status=result.get("kyc_status"),
@@ -176,3 +224,16 @@ def perform_kyc_check(session, aadhaar_id: str) -> KYCResult:
         missing_documents=result.get("missing_documents", []),
         error_message=None,
     )
+
+
+def kyc_failure(error_message: Optional[str]) -> KYCResult:
+    return KYCResult(
+        kyc_status="FAILED",
+        aadhaar_verified=False,
+        holder_name=None,
+        date_of_birth=None,
+        has_pan=False,
+        has_income_proof=False,
+        missing_documents=[],
+        error_message=error_message,
+    )
@@ -0,0 +1,180 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterable, Optional
+
+from src.kyc.aadhaar import (
+    AadhaarVerificationResult,
+    DigiLockerResult,
+    KYCResult,
+    fetch_digilocker_documents,
+    kyc_failure,
+    perform_kyc_check,
+    validate_aadhaar,
+)
+from src.kyc.singleflight import KYCSingleFlight
+
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+def _timed_out_result(operation: str, aadhaar_id: str, timeout_seconds: float):
+    message = f"KYC lookup timed out after {timeout_seconds:g}s"
+    if operation == "validate_aadhaar":
+        return AadhaarVerificationResult(aadhaar_id, False, None, None, None, message)
+    if operation == "fetch_digilocker_documents":
+        return DigiLockerResult(aadhaar_id, None, [], message)
+    return kyc_failure(message)
+
+
+def _mark_started(started: asyncio.Future) -> None:
+    if not started.done():
+        started.set_result(None)
+
+
+class AsyncKYCClient:
+    """
+    Runs the KYC wrappers concurrently for onboarding drives.
+
+    Snowpark calls block, so each lookup runs the existing synchronous wrapper
+    on a worker thread; a semaphore caps lookups in flight at max_concurrency
+    and each one is bounded by timeout_seconds, counted from the moment the
+    call starts on a worker rather than from when it was queued. A lookup that
+    times out yields a failed result of the usual type instead of raising, so
+    one slow ID cannot stall or abort a whole drive. The abandoned call keeps
+    its worker thread until the warehouse answers, so an owned executor gets
+    spare_workers extra threads (default max_concurrency) for new lookups to
+    run on meanwhile. With a single_flight, lookups for a
+    key already in flight (from this client or any other caller sharing it)
+    wait for that call instead of issuing their own.
+    """
+
+    OPERATIONS = {
+        "validate_aadhaar": validate_aadhaar,
+        "fetch_digilocker_documents": fetch_digilocker_documents,
+        "perform_kyc_check": perform_kyc_check,
+    }
+
+    def __init__(
+        self,
+        session,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        executor: ThreadPoolExecutor = None,
+        single_flight: KYCSingleFlight = None,
+        spare_workers: int = None,
+    ):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if spare_workers is None:
+            spare_workers = max_concurrency
+        if spare_workers < 0:
+            raise ValueError("spare_workers must not be negative")
+        self.session = session
+        self.max_concurrency = max_concurrency
+        self.timeout_seconds = timeout_seconds
+        self._owns_executor = executor is None
+        self._executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=max_concurrency + spare_workers
+        )
+        self.single_flight = single_flight
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.timeouts = 0
+
+    async def __aenter__(self) -> "AsyncKYCClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def validate_aadhaar(self, aadhaar_id: str) -> AadhaarVerificationResult:
+        return await self._run("validate_aadhaar", aadhaar_id)
+
+    async def fetch_digilocker_documents(self, aadhaar_id: str, doc_type: str = None) -> DigiLockerResult:
+        return await self._run("fetch_digilocker_documents", aadhaar_id, doc_type)
+
+    async def perform_kyc_check(self, aadhaar_id: str) -> KYCResult:
+        return await self._run("perform_kyc_check", aadhaar_id)
+
+    async def as_completed(self, aadhaar_ids: Iterable[str], operation: str = "perform_kyc_check") -> AsyncIterator[tuple]:
+        """
+        Look up every distinct ID concurrently and yield (aadhaar_id, result) as each finishes.
+
+        Args:
+            aadhaar_ids: Aadhaar numbers to look up
+            operation: "validate_aadhaar", "fetch_digilocker_documents" or "perform_kyc_check"
+        """
+        if operation not in self.OPERATIONS:
+            raise ValueError(f"Unknown KYC operation: {operation}")
+
+        async def lookup(aadhaar_id):
+            return aadhaar_id, await self._run(operation, aadhaar_id)
+
+        tasks = [asyncio.ensure_future(lookup(aadhaar_id)) for aadhaar_id in dict.fromkeys(aadhaar_ids)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations to land so no lookup outlives the iterator
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, operation: str, aadhaar_id: str, *args):
+        if self._semaphore is None:
+            # Created lazily so it binds to the running event loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        operation_fn = self.OPERATIONS[operation] if self.single_flight is None else getattr(self.single_flight, operation)
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+
+        def call():
+            loop.call_soon_threadsafe(_mark_started, started)
+            return operation_fn(self.session, aadhaar_id, *args)
+
+        async with self._semaphore:
+            future = loop.run_in_executor(self._executor, call)
+            # Time spent queued behind other calls for a worker does not count against the timeout
+            await asyncio.wait({started, future}, return_when=asyncio.FIRST_COMPLETED)
+            try:
+                return await asyncio.wait_for(future, self.timeout_seconds)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                return _timed_out_result(operation, aadhaar_id, self.timeout_seconds)
+
+
+def run_kyc_lookups(
+    session,
+    aadhaar_ids: Iterable[str],
+    operation: str = "perform_kyc_check",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    on_result: Callable[[str, object], None] = None,
+) -> dict:
+    """
+    Synchronous facade over AsyncKYCClient for callers without an event loop.
+
+    Args:
+        session: Snowflake session/connection
+        aadhaar_ids: Aadhaar numbers to look up
+        operation: "validate_aadhaar", "fetch_digilocker_documents" or "perform_kyc_check"
+        max_concurrency: Lookups in flight at once
+        timeout_seconds: Per-lookup timeout
+        on_result: Optional callback invoked with (aadhaar_id, result) as each lookup completes
+
+    Returns:
+        Results keyed by Aadhaar ID, in completion order
+    """
+    async def drive():
+        results = {}
+        async with AsyncKYCClient(session, max_concurrency, timeout_seconds) as client:
+            async for aadhaar_id, result in client.as_completed(aadhaar_ids, operation):
+                results[aadhaar_id] = result
+                if on_result is not None:
+                    on_result(aadhaar_id, result)
+        return results
+
+    return asyncio.run(drive())
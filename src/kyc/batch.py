@@ -0,0 +1,117 @@
+from typing import Callable, Iterable, TypeVar
+
+from src.kyc.aadhaar import (
+    INVALID_CHECKSUM_MESSAGE,
+    INVALID_FORMAT_MESSAGE,
+    AadhaarVerificationResult,
+    DigiLockerResult,
+    KYCResult,
+    invalid_aadhaar_result,
+    is_valid_aadhaar_format,
+    kyc_failure,
+)
+from src.kyc.decode import decode_digilocker, decode_kyc, decode_verification, loads_payload
+from src.kyc.verhoeff import verhoeff_valid_array
+
+DEFAULT_CHUNK_SIZE = 500
+
+T = TypeVar("T")
+
+
+def _call_batched(
+    session,
+    procedure: str,
+    aadhaar_ids: Iterable[str],
+    chunk_size: int,
+    extra_args: tuple,
+    on_invalid: Callable[[str, str], T],
+    from_payload: Callable[[str, dict], T],
+    verify_checksum: bool = True,
+) -> dict[str, T]:
+    """
+    Resolve many IDs with one set-based procedure call per chunk.
+
+    IDs failing the client-side format check (and, with verify_checksum, the
+    Verhoeff check, run vectorized over the whole batch) never reach the
+    warehouse. The procedure returns an object keyed by Aadhaar ID whose
+    values have the same shape as the single-ID procedure's response; each
+    one is decoded straight into its result type by src.kyc.decode. An entry
+    that fails to decode becomes an on_invalid result naming its ID and the
+    offending field; the rest of the batch is unaffected.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    unique_ids = list(dict.fromkeys(aadhaar_ids))
+    checksum_ok = verhoeff_valid_array(unique_ids) if verify_checksum else None
+
+    results: dict[str, T] = {}
+    pending = []
+    for index, aadhaar_id in enumerate(unique_ids):
+        if not is_valid_aadhaar_format(aadhaar_id):
+            results[aadhaar_id] = on_invalid(aadhaar_id, INVALID_FORMAT_MESSAGE)
+        elif checksum_ok is not None and not checksum_ok[index]:
+            results[aadhaar_id] = on_invalid(aadhaar_id, INVALID_CHECKSUM_MESSAGE)
+        else:
+            results[aadhaar_id] = None
+            pending.append(aadhaar_id)
+
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start:start + chunk_size]
+        response = loads_payload(session.call(procedure, chunk, *extra_args))
+        for aadhaar_id in chunk:
+            # DOC_METADATA and friends are untyped VARIANTs: one bad entry fails its own ID, not the batch
+            try:
+                results[aadhaar_id] = from_payload(aadhaar_id, response.get(aadhaar_id) or {})
+            except ValueError as exc:
+                results[aadhaar_id] = on_invalid(aadhaar_id, f"Malformed {procedure} response for {aadhaar_id}: {exc}")
+
+    return results
+
+
+def validate_aadhaar_batch(
+    session, aadhaar_ids: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE, verify_checksum: bool = True
+) -> dict[str, AadhaarVerificationResult]:
+    """
+    validate_aadhaar for many IDs via CORE.VERIFY_AADHAAR_BATCH.
+
+    Args:
+        session: Snowflake session/connection
+        aadhaar_ids: Aadhaar numbers (duplicates are looked up once)
+        chunk_size: Maximum IDs per procedure call
+        verify_checksum: Reject IDs with a wrong Verhoeff check digit locally
+
+    Returns:
+        Results keyed by Aadhaar ID, in first-seen input order
+    """
+    return _call_batched(
+        session, "CORE.VERIFY_AADHAAR_BATCH", aadhaar_ids, chunk_size, (),
+        invalid_aadhaar_result, decode_verification, verify_checksum,
+    )
+
+
+def fetch_digilocker_documents_batch(
+    session,
+    aadhaar_ids: Iterable[str],
+    doc_type: str = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    verify_checksum: bool = True,
+) -> dict[str, DigiLockerResult]:
+    """fetch_digilocker_documents for many IDs via CORE.FETCH_DIGILOCKER_DOCUMENTS_BATCH."""
+    return _call_batched(
+        session, "CORE.FETCH_DIGILOCKER_DOCUMENTS_BATCH", aadhaar_ids, chunk_size, (doc_type,),
+        lambda aadhaar_id, message: DigiLockerResult(aadhaar_id, None, [], message),
+        decode_digilocker, verify_checksum,
+    )
+
+
+def perform_kyc_check_batch(
+    session, aadhaar_ids: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE, verify_checksum: bool = True
+) -> dict[str, KYCResult]:
+    """perform_kyc_check for many IDs via CORE.PERFORM_KYC_CHECK_BATCH."""
+    return _call_batched(
+        session, "CORE.PERFORM_KYC_CHECK_BATCH", aadhaar_ids, chunk_size, (),
+        lambda aadhaar_id, message: kyc_failure(message),
+        lambda aadhaar_id, payload: decode_kyc(payload) if payload else kyc_failure("KYC check returned no result"),
+        verify_checksum,
+    )
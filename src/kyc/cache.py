@@ -0,0 +1,188 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+from src.kyc.aadhaar import (
+    AadhaarVerificationResult,
+    DigiLockerResult,
+    KYCResult,
+    aadhaar_format_error,
+    fetch_digilocker_documents,
+    invalid_aadhaar_result,
+    kyc_failure,
+    perform_kyc_check,
+    validate_aadhaar,
+)
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TTL_SECONDS = 900.0
+DEFAULT_NOT_FOUND_TTL_SECONDS = 60.0
+# Error message of the registry's NOT_FOUND answer, as returned by VERIFY_AADHAAR
+NOT_FOUND_MESSAGE = "Aadhaar not found in registry"
+
+KYCLookupResult = Union[AadhaarVerificationResult, DigiLockerResult, KYCResult]
+
+
+@dataclass
+class KYCCacheStats:
+    hits: int = 0
+    not_found_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    result: KYCLookupResult
+    expires_at: float
+    not_found: bool
+
+
+def classify_result(result: KYCLookupResult) -> Optional[bool]:
+    """
+    True for a registry NOT_FOUND answer, False for a successful lookup, and
+    None for anything else (format rejects, inactive IDs, errors), which is
+    never cached.
+    """
+    if isinstance(result, AadhaarVerificationResult):
+        succeeded, error = result.is_valid, result.error_message
+    elif isinstance(result, DigiLockerResult):
+        succeeded, error = result.error_message is None, result.error_message
+    else:
+        succeeded, error = result.kyc_status in ("PASSED", "INCOMPLETE"), result.error_message
+    if succeeded:
+        return False
+    if error == NOT_FOUND_MESSAGE:
+        return True
+    return None
+
+
+class KYCResultCache:
+    """
+    TTL cache in front of validate_aadhaar, fetch_digilocker_documents and perform_kyc_check.
+
+    Entries are keyed on (procedure, aadhaar_id, doc_type). Successful lookups
+    live for ttl_seconds and NOT_FOUND answers for the shorter
+    not_found_ttl_seconds, so a newly enrolled ID is picked up quickly;
+    other failures are not cached. Eviction is LRU bounded by max_entries.
+
+    verify_checksum is applied before the lookup, as the wrappers apply it
+    before calling Snowflake, so an ID the caller would reject is never
+    answered from an entry cached by a caller that did not check.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        not_found_ttl_seconds: float = DEFAULT_NOT_FOUND_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.not_found_ttl_seconds = not_found_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._keys_by_id: dict[str, set[tuple]] = {}
+        self._lock = threading.Lock()
+        self.stats = KYCCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def validate_aadhaar(self, session, aadhaar_id: str, verify_checksum: bool = True) -> AadhaarVerificationResult:
+        error_message = aadhaar_format_error(aadhaar_id, verify_checksum)
+        if error_message is not None:
+            return invalid_aadhaar_result(aadhaar_id, error_message)
+        return self._get(
+            ("CORE.VERIFY_AADHAAR", aadhaar_id, None), lambda: validate_aadhaar(session, aadhaar_id, verify_checksum)
+        )
+
+    def fetch_digilocker_documents(
+        self, session, aadhaar_id: str, doc_type: str = None, verify_checksum: bool = True
+    ) -> DigiLockerResult:
+        if verify_checksum:
+            error_message = aadhaar_format_error(aadhaar_id, verify_checksum)
+            if error_message is not None:
+                return DigiLockerResult(aadhaar_id, None, [], error_message)
+        return self._get(
+            ("CORE.FETCH_DIGILOCKER_DOCUMENTS", aadhaar_id, doc_type or None),
+            lambda: fetch_digilocker_documents(session, aadhaar_id, doc_type, verify_checksum),
+        )
+
+    def perform_kyc_check(self, session, aadhaar_id: str, verify_checksum: bool = True) -> KYCResult:
+        if verify_checksum:
+            error_message = aadhaar_format_error(aadhaar_id, verify_checksum)
+            if error_message is not None:
+                return kyc_failure(error_message)
+        return self._get(
+            ("CORE.PERFORM_KYC_CHECK", aadhaar_id, None), lambda: perform_kyc_check(session, aadhaar_id, verify_checksum)
+        )
+
+    def invalidate(self, aadhaar_id: str) -> int:
+        """Drop every cached lookup for an Aadhaar ID, e.g. after its documents change. Returns entries dropped."""
+        with self._lock:
+            keys = self._keys_by_id.pop(aadhaar_id, set())
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+
+    def _get(self, key: tuple, load: Callable[[], KYCLookupResult]) -> KYCLookupResult:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                self.stats.expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                if entry.not_found:
+                    self.stats.not_found_hits += 1
+                return entry.result
+            self.stats.misses += 1
+
+        result = load()
+        not_found = classify_result(result)
+        if not_found is None:
+            return result
+
+        ttl = self.not_found_ttl_seconds if not_found else self.ttl_seconds
+        with self._lock:
+            self._entries[key] = _CacheEntry(result=result, expires_at=now + ttl, not_found=not_found)
+            self._entries.move_to_end(key)
+            self._keys_by_id.setdefault(key[1], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+        return result
+
+    def _remove(self, key: tuple):
+        del self._entries[key]
+        keys = self._keys_by_id.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_id[key[1]]
+
+
+# Used by the eKYC page; module state outlives Streamlit reruns (the script re-executes, imports do not)
+KYC_RESULT_CACHE = KYCResultCache()
@@ -0,0 +1,179 @@
+import json
+from datetime import date
+from typing import Union
+
+from src.kyc.aadhaar import AadhaarVerificationResult, DigiLockerResult, Document, KYCResult, kyc_failure
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is not installed
+    orjson = None
+
+Payload = Union[dict, str, bytes, bytearray]
+
+_REQUIRED = object()
+_OPTIONAL_STR = (str, type(None))
+
+# Field schemas: key -> (accepted types, default); _REQUIRED fields must be present.
+# Payloads whose fields are all present with the expected types take a fast path
+# that indexes them directly; anything else is walked field by field, filling the
+# same defaults as the *_from_payload helpers and raising ValueError on a bad type.
+VERIFICATION_SCHEMA = {
+    "name": (_OPTIONAL_STR, None),
+    "date_of_birth": ((str, date, type(None)), None),
+    "gender": (_OPTIONAL_STR, None),
+}
+DOCUMENT_SCHEMA = {
+    "doc_type": (str, _REQUIRED),
+    "doc_number": (_OPTIONAL_STR, None),
+    "issuer": (_OPTIONAL_STR, None),
+    "status": (str, _REQUIRED),
+    "metadata": ((dict, type(None)), None),
+}
+DIGILOCKER_SCHEMA = {
+    "holder_name": (_OPTIONAL_STR, None),
+    "documents": (list, list),
+}
+KYC_SCHEMA = {
+    "kyc_status": (str, _REQUIRED),
+    "aadhaar_verified": (bool, False),
+    "holder_name": (_OPTIONAL_STR, None),
+    "date_of_birth": ((str, date, type(None)), None),
+    "has_pan": (bool, False),
+    "has_income_proof": (bool, False),
+    "missing_documents": (list, list),
+}
+
+
+def loads_payload(payload: Payload) -> dict:
+    """Parse a procedure payload into its top-level object."""
+    if isinstance(payload, dict):
+        return payload
+    if isinstance(payload, (str, bytes, bytearray)):
+        result = orjson.loads(payload) if orjson is not None else json.loads(payload)
+        if isinstance(result, dict):
+            return result
+        payload = result
+    raise ValueError(f"Expected a JSON object payload, got {type(payload).__name__}")
+
+
+def _type_names(types) -> str:
+    if isinstance(types, type):
+        types = (types,)
+    return " or ".join("null" if t is type(None) else t.__name__ for t in types)
+
+
+def _decode_fields(schema: dict, obj, path: str) -> list:
+    """Values for every schema field in order, with defaults applied and types checked."""
+    if not isinstance(obj, dict):
+        raise ValueError(f"{path}: expected object, got {type(obj).__name__}")
+    values = []
+    for key, (types, default) in schema.items():
+        value = obj.get(key, _REQUIRED)
+        if value is _REQUIRED:
+            if default is _REQUIRED:
+                raise ValueError(f"{path}.{key}: required field is missing")
+            value = default() if callable(default) else default
+        elif not isinstance(value, types):
+            raise ValueError(f"{path}.{key}: expected {_type_names(types)}, got {type(value).__name__}")
+        values.append(value)
+    return values
+
+
+def _date_string(value):
+    return value if value is None or type(value) is str else str(value)
+
+
+def _decode_documents(documents: list) -> list[Document]:
+    decoded = []
+    for index, doc in enumerate(documents):
+        try:
+            doc_type, doc_number, issuer, status, metadata = (
+                doc["doc_type"], doc["doc_number"], doc["issuer"], doc["status"], doc["metadata"]
+            )
+            fast = (
+                type(doc_type) is str and type(status) is str
+                and (doc_number is None or type(doc_number) is str)
+                and (issuer is None or type(issuer) is str)
+                and (metadata is None or type(metadata) is dict)
+            )
+        except (KeyError, TypeError):
+            fast = False
+        if fast:
+            decoded.append(Document(doc_type, doc_number, issuer, status, metadata))
+        else:
+            decoded.append(Document(*_decode_fields(DOCUMENT_SCHEMA, doc, f"$.documents[{index}]")))
+    return decoded
+
+
+def _success_flag(result: dict, path: str) -> bool:
+    success = result.get("success", False)
+    if type(success) is not bool:
+        raise ValueError(f"{path}.success: expected bool, got {type(success).__name__}")
+    return success
+
+
+def _error_message(result: dict, key: str, default, path: str):
+    message = result.get(key, default)
+    if message is not None and type(message) is not str:
+        raise ValueError(f"{path}.{key}: expected str or null, got {type(message).__name__}")
+    return message
+
+
+def decode_verification(aadhaar_id: str, payload: Payload) -> AadhaarVerificationResult:
+    """Decode a VERIFY_AADHAAR payload."""
+    result = loads_payload(payload)
+    if not _success_flag(result, "$"):
+        return AadhaarVerificationResult(
+            aadhaar_id, False, None, None, None,
+            _error_message(result, "error_message", "Verification failed", "$"),
+        )
+    name, date_of_birth, gender = _decode_fields(VERIFICATION_SCHEMA, result, "$")
+    # str() of the raw value, as verification_from_payload does, so a missing date reads "None"
+    return AadhaarVerificationResult(aadhaar_id, True, name, str(date_of_birth), gender, None)
+
+
+def decode_digilocker(aadhaar_id: str, payload: Payload) -> DigiLockerResult:
+    """Decode a FETCH_DIGILOCKER_DOCUMENTS payload."""
+    result = loads_payload(payload)
+    if not _success_flag(result, "$"):
+        return DigiLockerResult(
+            aadhaar_id, None, [], _error_message(result, "error_message", "Failed to fetch documents", "$")
+        )
+    holder_name, documents = result.get("holder_name"), result.get("documents")
+    if not ((holder_name is None or type(holder_name) is str) and type(documents) is list):
+        holder_name, documents = _decode_fields(DIGILOCKER_SCHEMA, result, "$")
+    return DigiLockerResult(aadhaar_id, holder_name, _decode_documents(documents), None)
+
+
+def decode_kyc(payload: Payload) -> KYCResult:
+    """Decode a PERFORM_KYC_CHECK payload."""
+    result = loads_payload(payload)
+    try:
+        status, verified, holder_name, date_of_birth, has_pan, has_income_proof, missing = (
+            result["kyc_status"], result["aadhaar_verified"], result["holder_name"], result["date_of_birth"],
+            result["has_pan"], result["has_income_proof"], result["missing_documents"],
+        )
+        fast = (
+            type(status) is str and status != "FAILED"
+            and type(verified) is bool and type(has_pan) is bool and type(has_income_proof) is bool
+            and (holder_name is None or type(holder_name) is str)
+            and (date_of_birth is None or type(date_of_birth) is str)
+            and type(missing) is list and (not missing or all(type(doc) is str for doc in missing))
+        )
+    except KeyError:
+        fast = False
+    if fast:
+        return KYCResult(status, verified, holder_name, date_of_birth or None, has_pan, has_income_proof, missing, None)
+
+    if result.get("kyc_status") == "FAILED":
+        return kyc_failure(_error_message(result, "error", None, "$"))
+    status, verified, holder_name, date_of_birth, has_pan, has_income_proof, missing = _decode_fields(
+        KYC_SCHEMA, result, "$"
+    )
+    for i, doc in enumerate(missing):
+        if type(doc) is not str:
+            raise ValueError(f"$.missing_documents[{i}]: expected str, got {type(doc).__name__}")
+    return KYCResult(
+        status, verified, holder_name, _date_string(date_of_birth) or None, has_pan, has_income_proof, missing, None
+    )
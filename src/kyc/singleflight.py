@@ -0,0 +1,126 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Callable
+
+from src.kyc.aadhaar import (
+    AadhaarVerificationResult,
+    DigiLockerResult,
+    KYCResult,
+    fetch_digilocker_documents,
+    perform_kyc_check,
+    validate_aadhaar,
+)
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    collapsed: int = 0
+
+    @property
+    def collapse_rate(self) -> float:
+        requests = self.calls + self.collapsed
+        return self.collapsed / requests if requests else 0.0
+
+
+class KYCSingleFlight:
+    """
+    Coalesces concurrent identical calls to the KYC wrappers.
+
+    Calls are keyed on (procedure, aadhaar_id, doc_type). The first caller
+    for a key runs the stored procedure; anyone asking for the same key while
+    it is in flight waits for that call and receives its result (or its
+    exception). Once the call finishes the key is released, so later lookups
+    go to the warehouse again - pair with KYCResultCache to reuse answers.
+
+    Threaded callers use the plain methods; coroutines use the *_async
+    methods, which run the call on an executor thread and share the same
+    in-flight table, so threads and event loops coalesce with each other.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = SingleFlightStats()
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def validate_aadhaar(self, session, aadhaar_id: str) -> AadhaarVerificationResult:
+        return self._do(("CORE.VERIFY_AADHAAR", aadhaar_id, None), lambda: validate_aadhaar(session, aadhaar_id))
+
+    def fetch_digilocker_documents(self, session, aadhaar_id: str, doc_type: str = None) -> DigiLockerResult:
+        return self._do(
+            ("CORE.FETCH_DIGILOCKER_DOCUMENTS", aadhaar_id, doc_type or None),
+            lambda: fetch_digilocker_documents(session, aadhaar_id, doc_type),
+        )
+
+    def perform_kyc_check(self, session, aadhaar_id: str) -> KYCResult:
+        return self._do(("CORE.PERFORM_KYC_CHECK", aadhaar_id, None), lambda: perform_kyc_check(session, aadhaar_id))
+
+    async def validate_aadhaar_async(
+        self, session, aadhaar_id: str, executor: Executor = None
+    ) -> AadhaarVerificationResult:
+        return await self._do_async(
+            ("CORE.VERIFY_AADHAAR", aadhaar_id, None), lambda: validate_aadhaar(session, aadhaar_id), executor
+        )
+
+    async def fetch_digilocker_documents_async(
+        self, session, aadhaar_id: str, doc_type: str = None, executor: Executor = None
+    ) -> DigiLockerResult:
+        return await self._do_async(
+            ("CORE.FETCH_DIGILOCKER_DOCUMENTS", aadhaar_id, doc_type or None),
+            lambda: fetch_digilocker_documents(session, aadhaar_id, doc_type),
+            executor,
+        )
+
+    async def perform_kyc_check_async(self, session, aadhaar_id: str, executor: Executor = None) -> KYCResult:
+        return await self._do_async(
+            ("CORE.PERFORM_KYC_CHECK", aadhaar_id, None), lambda: perform_kyc_check(session, aadhaar_id), executor
+        )
+
+    def _join(self, key: tuple) -> tuple[Future, bool]:
+        """Return the in-flight future for key and whether the caller must run the call."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.stats.collapsed += 1
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            self.stats.calls += 1
+            return future, True
+
+    def _run(self, key: tuple, future: Future, call: Callable):
+        try:
+            result = call()
+        except BaseException as exc:
+            self._release(key)
+            future.set_exception(exc)
+        else:
+            self._release(key)
+            future.set_result(result)
+
+    def _release(self, key: tuple):
+        # Released before the result is published so a caller woken by it never rejoins a finished call
+        with self._lock:
+            del self._in_flight[key]
+
+    def _do(self, key: tuple, call: Callable):
+        future, leader = self._join(key)
+        if leader:
+            self._run(key, future, call)
+        return future.result()
+
+    async def _do_async(self, key: tuple, call: Callable, executor: Executor = None):
+        future, leader = self._join(key)
+        if leader:
+            asyncio.get_running_loop().run_in_executor(executor, self._run, key, future, call)
+        # Shielded so a cancelled or timed-out waiter does not cancel the call other waiters share
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+
+# Shared across Streamlit sessions in the same process
+KYC_SINGLE_FLIGHT = KYCSingleFlight()
@@ -0,0 +1,101 @@
+from typing import Iterable, Union
+
+import numpy as np
+
+AADHAAR_LENGTH = 12
+
+# Multiplication table of the dihedral group D5
+_D = np.array([
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 2, 3, 4, 0, 6, 7, 8, 9, 5],
+    [2, 3, 4, 0, 1, 7, 8, 9, 5, 6],
+    [3, 4, 0, 1, 2, 8, 9, 5, 6, 7],
+    [4, 0, 1, 2, 3, 9, 5, 6, 7, 8],
+    [5, 9, 8, 7, 6, 0, 4, 3, 2, 1],
+    [6, 5, 9, 8, 7, 1, 0, 4, 3, 2],
+    [7, 6, 5, 9, 8, 2, 1, 0, 4, 3],
+    [8, 7, 6, 5, 9, 3, 2, 1, 0, 4],
+    [9, 8, 7, 6, 5, 4, 3, 2, 1, 0],
+], dtype=np.uint8)
+
+# Position permutation: row i applies to the digit i places from the right
+_P = np.array([
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 5, 7, 6, 2, 8, 3, 0, 9, 4],
+    [5, 8, 0, 3, 7, 9, 6, 2, 4, 1],
+    [8, 9, 1, 6, 0, 4, 3, 5, 2, 7],
+    [9, 4, 5, 3, 1, 2, 6, 8, 7, 0],
+    [4, 2, 8, 6, 5, 7, 3, 9, 0, 1],
+    [2, 7, 9, 3, 8, 0, 6, 4, 1, 5],
+    [7, 0, 4, 6, 9, 1, 3, 2, 5, 8],
+], dtype=np.uint8)
+
+_INV = np.array([0, 4, 3, 2, 1, 5, 6, 7, 8, 9], dtype=np.uint8)
+
+# Plain-list copies for the scalar path; indexing numpy arrays one digit at a time is slower
+_D_ROWS = _D.tolist()
+_P_ROWS = _P.tolist()
+_INV_ROW = _INV.tolist()
+
+
+def _checksum(digits: str, offset: int) -> int:
+    c = 0
+    for i, digit in enumerate(reversed(digits)):
+        c = _D_ROWS[c][_P_ROWS[(i + offset) % 8][ord(digit) - 48]]
+    return c
+
+
+def verhoeff_check_digit(digits: str) -> str:
+    """Check digit to append to a string of ASCII digits."""
+    if not digits.isascii() or not digits.isdigit():
+        raise ValueError("digits must be ASCII digits")
+    return str(_INV_ROW[_checksum(digits, 1)])
+
+
+def is_valid_verhoeff(number: str) -> bool:
+    """True if number is a non-empty string of ASCII digits whose last digit is its Verhoeff check digit."""
+    if not number or not number.isascii() or not number.isdigit():
+        return False
+    return _checksum(number, 0) == 0
+
+
+def verhoeff_valid_array(numbers: Union[np.ndarray, Iterable], length: int = AADHAAR_LENGTH) -> np.ndarray:
+    """
+    Vectorized Verhoeff check over many fixed-length numbers.
+
+    Accepts strings (any iterable, or a NumPy unicode array) or non-negative
+    integers. A string row is valid only if it is exactly length ASCII digits
+    with a correct check digit; integers are read as length digits with
+    leading zeros. Work is one table gather per digit position across all
+    rows, so millions of IDs cost a few dozen array operations.
+    """
+    values = np.asarray(numbers if isinstance(numbers, np.ndarray) else list(numbers))
+    if values.ndim != 1:
+        values = values.reshape(-1)
+    n = len(values)
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+
+    if values.dtype.kind in "iu":
+        remaining = values.astype(np.int64)
+        well_formed = (remaining >= 0) & (remaining < 10 ** length)
+        remaining = np.where(well_formed, remaining, 0)
+        digits = np.empty((n, length), dtype=np.uint8)
+        for position in range(length - 1, -1, -1):
+            remaining, digits[:, position] = np.divmod(remaining, 10)
+    else:
+        values = values.astype(np.str_)
+        width = values.dtype.itemsize // 4
+        if width < length:
+            return np.zeros(n, dtype=bool)
+        codes = values.view(np.uint32).reshape(n, width)
+        shifted = codes[:, :length].astype(np.int64) - 48
+        well_formed = ((shifted >= 0) & (shifted <= 9)).all(axis=1)
+        if width > length:
+            well_formed &= codes[:, length] == 0
+        digits = np.where(well_formed[:, None], shifted, 0).astype(np.uint8)
+
+    c = np.zeros(n, dtype=np.uint8)
+    for i in range(length):
+        c = _D[c, _P[i % 8, digits[:, length - 1 - i]]]
+    return well_formed & (c == 0)
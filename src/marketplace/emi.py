@@ -0,0 +1,17 @@
+def calculate_emi(principal, annual_rate, tenure_months):
+    """
+    Equated monthly instalment of a reducing-balance loan, rounded to the rupee.
+
+    Args:
+        principal: Loan amount in rupees
+        annual_rate: Annual interest rate in percent (7.5 for 7.5%)
+        tenure_months: Number of monthly instalments
+
+    Returns:
+        Monthly instalment; principal spread evenly over the tenure when the rate is zero
+    """
+    r = annual_rate / (12 * 100)
+    if r == 0:
+        return round(principal / tenure_months, 0)
+    emi = principal * r * ((1 + r) ** tenure_months) / (((1 + r) ** tenure_months) - 1)
+    return round(emi, 0)
@@ -0,0 +1,91 @@
+from datetime import date
+from typing import Union
+
+import numpy as np
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+YearMonthDay = tuple[int, int, int]
+
+
+def _is_leap_year(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    if month == 2 and _is_leap_year(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def _as_ymd(value: Union[date, YearMonthDay]) -> YearMonthDay:
+    if isinstance(value, tuple):
+        return value
+    return value.year, value.month, value.day
+
+
+def age_in_years(dob: Union[date, YearMonthDay], reference_date: Union[date, YearMonthDay]) -> int:
+    """
+    Whole years between dob and reference_date using integer arithmetic only.
+
+    Matches dateutil's relativedelta(reference_date, dob).years, including
+    29 Feb birthdays being reached on 28 Feb in non-leap years and truncation
+    towards zero when dob is after reference_date.
+
+    Args:
+        dob: Date of birth as a date or (year, month, day) tuple
+        reference_date: Date the age is measured at, same forms as dob
+
+    Returns:
+        Age in completed years
+    """
+    dob_year, dob_month, dob_day = _as_ymd(dob)
+    ref_year, ref_month, ref_day = _as_ymd(reference_date)
+
+    months = (ref_year - dob_year) * 12 + (ref_month - dob_month)
+    shifted_day = min(dob_day, _days_in_month(ref_year, ref_month))
+    if (ref_year, ref_month, ref_day) >= (dob_year, dob_month, dob_day):
+        if ref_day < shifted_day:
+            months -= 1
+        return months // 12
+    if ref_day > shifted_day:
+        months += 1
+    return -(-months // 12)
+
+
+def date_of_turning(dob: date, years: int) -> date:
+    """First date on which age_in_years(dob, ...) reaches years (29 Feb births turn on 28 Feb in non-leap years)."""
+    year = dob.year + years
+    return date(year, dob.month, min(dob.day, _days_in_month(year, dob.month)))
+
+
+def _split_dates(values: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    month_start = values.astype("datetime64[M]")
+    month_ordinal = month_start.astype(np.int64)
+    day = (values - month_start.astype("datetime64[D]")).astype(np.int64) + 1
+    days_in_month = ((month_start + 1).astype("datetime64[D]") - month_start.astype("datetime64[D]")).astype(np.int64)
+    return month_ordinal, day, days_in_month, values.astype(np.int64)
+
+
+def ages_in_years(dob, reference_date) -> np.ndarray:
+    """
+    Vectorized age_in_years over datetime64 arrays.
+
+    Args:
+        dob: Array-like of dates of birth (converted to datetime64[D])
+        reference_date: A single date or an array broadcastable against dob
+
+    Returns:
+        int64 array of ages in completed years
+    """
+    dob = np.asarray(dob, dtype="datetime64[D]")
+    reference = np.asarray(reference_date, dtype="datetime64[D]")
+
+    dob_months, dob_day, _, dob_days = _split_dates(dob)
+    ref_months, ref_day, ref_days_in_month, ref_days = _split_dates(reference)
+
+    months = ref_months - dob_months
+    shifted_day = np.minimum(dob_day, ref_days_in_month)
+    past = ref_days >= dob_days
+    months = months - (past & (ref_day < shifted_day)) + (~past & (ref_day > shifted_day))
+    return np.sign(months) * (np.abs(months) // 12)
@@ -0,0 +1,133 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Iterable, Mapping
+
+import src.rules.eligibility as eligibility
+from src.rules.age import date_of_turning
+from src.rules.eligibility import Borrower, EligibilityCertificate, issue_eligibility_certificate
+
+
+class AgeEventCalendar:
+    """
+    Dates on which a borrower's age-based eligibility can flip.
+
+    Age status only changes on the day a borrower turns MIN_AGE and the day
+    they turn MAX_AGE + 1, so those two dates are precomputed per borrower and
+    indexed by date. Rebuild the calendar if MIN_AGE or MAX_AGE change.
+    """
+
+    def __init__(self):
+        self._borrowers_by_date: dict[date, set[str]] = {}
+        self._dates: list[date] = []
+        self._events_by_borrower: dict[str, tuple[date, date]] = {}
+
+    def __len__(self) -> int:
+        return len(self._events_by_borrower)
+
+    @classmethod
+    def from_borrowers(cls, borrowers: Iterable[Borrower]) -> "AgeEventCalendar":
+        calendar = cls()
+        for borrower in borrowers:
+            calendar.add(borrower.aadhaar_id, borrower.date_of_birth)
+        return calendar
+
+    def events_for(self, aadhaar_id: str) -> tuple[date, date]:
+        return self._events_by_borrower[aadhaar_id]
+
+    def add(self, aadhaar_id: str, dob: date):
+        self.remove(aadhaar_id)
+        events = (date_of_turning(dob, eligibility.MIN_AGE), date_of_turning(dob, eligibility.MAX_AGE + 1))
+        self._events_by_borrower[aadhaar_id] = events
+        for event_date in events:
+            borrowers = self._borrowers_by_date.get(event_date)
+            if borrowers is None:
+                borrowers = self._borrowers_by_date[event_date] = set()
+                insort(self._dates, event_date)
+            borrowers.add(aadhaar_id)
+
+    def remove(self, aadhaar_id: str):
+        events = self._events_by_borrower.pop(aadhaar_id, None)
+        if events is None:
+            return
+        for event_date in events:
+            borrowers = self._borrowers_by_date[event_date]
+            borrowers.discard(aadhaar_id)
+            if not borrowers:
+                del self._borrowers_by_date[event_date]
+                del self._dates[bisect_left(self._dates, event_date)]
+
+    def due(self, on: date) -> set[str]:
+        return set(self._borrowers_by_date.get(on, ()))
+
+    def due_between(self, after: date, through: date) -> set[str]:
+        """Borrowers with an age event in (after, through], for catching up on skipped refreshes."""
+        due = set()
+        for event_date in self._dates[bisect_right(self._dates, after):bisect_right(self._dates, through)]:
+            due |= self._borrowers_by_date[event_date]
+        return due
+
+
+class IncrementalEligibilityRefresher:
+    """
+    Keeps eligibility certificates current by recomputing only what can have changed.
+
+    A full rebuild evaluates every borrower once; each later refresh touches only
+    borrowers with an age event since the previous refresh plus those whose
+    record changed, so a daily run is O(changes) instead of O(N).
+    """
+
+    def __init__(self):
+        self.calendar = AgeEventCalendar()
+        self.certificates: dict[str, EligibilityCertificate] = {}
+        self.last_refreshed: date = None
+
+    def rebuild(self, borrowers: Iterable[Borrower], on: date = None) -> dict[str, EligibilityCertificate]:
+        if on is None:
+            on = date.today()
+        self.calendar = AgeEventCalendar()
+        self.certificates = {}
+        for borrower in borrowers:
+            self.calendar.add(borrower.aadhaar_id, borrower.date_of_birth)
+            self.certificates[borrower.aadhaar_id] = issue_eligibility_certificate(borrower, on)
+        self.last_refreshed = on
+        return self.certificates
+
+    def refresh(
+        self,
+        borrowers: Mapping[str, Borrower],
+        changed_ids: Iterable[str] = (),
+        on: date = None,
+    ) -> dict[str, EligibilityCertificate]:
+        """
+        Recompute certificates for borrowers whose status may have flipped.
+
+        Args:
+            borrowers: Lookup of current borrower records by Aadhaar ID
+            changed_ids: Borrowers whose record was inserted, updated or deleted since the last refresh
+            on: Refresh date (defaults to today)
+
+        Returns:
+            The recomputed certificates keyed by Aadhaar ID (deleted borrowers are dropped)
+        """
+        if on is None:
+            on = date.today()
+        if self.last_refreshed is None:
+            raise RuntimeError("rebuild() must run before the first incremental refresh")
+
+        changed_ids = set(changed_ids)
+        for aadhaar_id in changed_ids:
+            borrower = borrowers.get(aadhaar_id)
+            if borrower is None:
+                self.calendar.remove(aadhaar_id)
+                self.certificates.pop(aadhaar_id, None)
+            else:
+                self.calendar.add(aadhaar_id, borrower.date_of_birth)
+
+        touched = (self.calendar.due_between(self.last_refreshed, on) | changed_ids) & borrowers.keys()
+        updated = {}
+        for aadhaar_id in touched:
+            certificate = issue_eligibility_certificate(borrowers[aadhaar_id], on)
+            self.certificates[aadhaar_id] = certificate
+            updated[aadhaar_id] = certificate
+        self.last_refreshed = on
+        return updated
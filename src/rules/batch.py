@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Sequence
+
+import numpy as np
+
+from src.rules import eligibility
+from src.rules.age import ages_in_years
+from src.rules.eligibility import EligibilityCertificate, Rejection, RejectionCode
+
+# Rejection reason bits, in the order issue_eligibility_certificate reports them
+REASON_CREDIT_SCORE = int(RejectionCode.CREDIT_SCORE_BELOW_MIN)
+REASON_AGE_BELOW_MIN = int(RejectionCode.AGE_BELOW_MIN)
+REASON_AGE_ABOVE_MAX = int(RejectionCode.AGE_ABOVE_MAX)
+REASON_INCOME_NOT_POSITIVE = int(RejectionCode.INCOME_NOT_POSITIVE)
+REASON_DTI_EXCEEDED = int(RejectionCode.DTI_ABOVE_MAX)
+
+BATCH_COLUMNS = ("credit_score", "date_of_birth", "monthly_income", "monthly_liabilities")
+
+
+def evaluation_thresholds() -> dict:
+    """The current eligibility limits, keyed by the rejection they produce."""
+    return {
+        RejectionCode.CREDIT_SCORE_BELOW_MIN: eligibility.MIN_CREDIT_SCORE,
+        RejectionCode.AGE_BELOW_MIN: eligibility.MIN_AGE,
+        RejectionCode.AGE_ABOVE_MAX: eligibility.MAX_AGE,
+        RejectionCode.INCOME_NOT_POSITIVE: None,
+        RejectionCode.DTI_ABOVE_MAX: eligibility.MAX_DTI_RATIO,
+    }
+
+
+@dataclass
+class EligibilityBatchResult:
+    is_eligible: np.ndarray
+    reason_mask: np.ndarray
+    credit_score: np.ndarray
+    age: np.ndarray
+    monthly_income: np.ndarray
+    dti: np.ndarray
+    # Captured when the rules ran, so rendered messages quote the limits that were applied
+    thresholds: dict = field(default_factory=evaluation_thresholds)
+
+    def __len__(self) -> int:
+        return len(self.is_eligible)
+
+    def rejections(self, index: int) -> list[Rejection]:
+        mask = int(self.reason_mask[index])
+        thresholds = self.thresholds
+        rejections = []
+        if mask & REASON_CREDIT_SCORE:
+            code = RejectionCode.CREDIT_SCORE_BELOW_MIN
+            rejections.append(Rejection(code, int(self.credit_score[index]), thresholds[code]))
+        if mask & REASON_AGE_BELOW_MIN:
+            code = RejectionCode.AGE_BELOW_MIN
+            rejections.append(Rejection(code, int(self.age[index]), thresholds[code]))
+        if mask & REASON_AGE_ABOVE_MAX:
+            code = RejectionCode.AGE_ABOVE_MAX
+            rejections.append(Rejection(code, int(self.age[index]), thresholds[code]))
+        if mask & REASON_INCOME_NOT_POSITIVE:
+            code = RejectionCode.INCOME_NOT_POSITIVE
+            rejections.append(Rejection(code, float(self.monthly_income[index]), thresholds[code]))
+        if mask & REASON_DTI_EXCEEDED:
+            code = RejectionCode.DTI_ABOVE_MAX
+            rejections.append(Rejection(code, float(self.dti[index]), thresholds[code]))
+        return rejections
+
+    def rejection_reasons(self, index: int) -> list[str]:
+        """Render the rejection reasons of one row exactly as the scalar rules do."""
+        return [rejection.message for rejection in self.rejections(index)]
+
+    def to_certificates(self, borrower_ids: Sequence[str], issued_date: date = None) -> list[EligibilityCertificate]:
+        if issued_date is None:
+            issued_date = date.today()
+        return [
+            EligibilityCertificate(
+                borrower_id=borrower_ids[i],
+                is_eligible=bool(self.is_eligible[i]),
+                issued_date=issued_date,
+                rejections=self.rejections(i),
+            )
+            for i in range(len(self))
+        ]
+
+
+def issue_eligibility_certificates_batch(data, reference_date: date = None) -> EligibilityBatchResult:
+    """
+    Evaluate the eligibility rules for many borrowers in one vectorized pass.
+
+    Args:
+        data: pandas DataFrame or mapping of column name to array with the
+            credit_score, date_of_birth, monthly_income and monthly_liabilities columns
+        reference_date: Date ages are measured against (defaults to today)
+
+    Returns:
+        EligibilityBatchResult with eligibility flags and a rejection-reason bitmask per row
+    """
+    if reference_date is None:
+        reference_date = date.today()
+    thresholds = evaluation_thresholds()
+
+    missing = [column for column in BATCH_COLUMNS if column not in data]
+    if missing:
+        raise ValueError(f"Missing eligibility columns: {', '.join(missing)}")
+
+    credit_score = np.asarray(data["credit_score"], dtype=np.int64)
+    dob = np.asarray(data["date_of_birth"], dtype="datetime64[D]")
+    income = np.asarray(data["monthly_income"], dtype=np.float64)
+    liabilities = np.asarray(data["monthly_liabilities"], dtype=np.float64)
+
+    age = ages_in_years(dob, reference_date)
+
+    income_positive = income > 0
+    dti = np.where(income_positive, liabilities / np.where(income_positive, income, 1.0), 0.0)
+
+    reason_mask = np.zeros(len(credit_score), dtype=np.uint8)
+    reason_mask[credit_score < thresholds[RejectionCode.CREDIT_SCORE_BELOW_MIN]] |= REASON_CREDIT_SCORE
+    reason_mask[age < thresholds[RejectionCode.AGE_BELOW_MIN]] |= REASON_AGE_BELOW_MIN
+    reason_mask[age > thresholds[RejectionCode.AGE_ABOVE_MAX]] |= REASON_AGE_ABOVE_MAX
+    reason_mask[~income_positive] |= REASON_INCOME_NOT_POSITIVE
+    reason_mask[income_positive & (dti > thresholds[RejectionCode.DTI_ABOVE_MAX])] |= REASON_DTI_EXCEEDED
+
+    return EligibilityBatchResult(
+        is_eligible=reason_mask == 0,
+        reason_mask=reason_mask,
+        credit_score=credit_score,
+        age=age,
+        monthly_income=income,
+        dti=dti,
+        thresholds=thresholds,
+    )
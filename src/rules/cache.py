@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Optional
+
+from src.rules.eligibility import (
+    Borrower,
+    EligibilityCertificate,
+    Rejection,
+    issue_eligibility_certificate,
+    rules_fingerprint,
+)
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    is_eligible: bool
+    rejections: tuple[Rejection, ...]
+    expires_at: float
+    borrower_ids: set[str]
+
+
+class EligibilityCertificateCache:
+    """
+    Memoizes issue_eligibility_certificate by borrower financial fingerprint.
+
+    Entries are keyed on (credit_score, date_of_birth, monthly_income,
+    monthly_liabilities, reference_date, rules fingerprint), so borrowers with
+    identical financials share an entry and any threshold or RULES_VERSION
+    change misses automatically. Eviction is LRU bounded by max_entries, and
+    entries older than ttl_seconds are recomputed.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple, _CacheEntry] = OrderedDict()
+        self._key_by_borrower: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def fingerprint(borrower: Borrower, reference_date: date) -> tuple:
+        return (
+            borrower.credit_score,
+            borrower.date_of_birth,
+            borrower.monthly_income,
+            borrower.monthly_liabilities,
+            reference_date,
+            rules_fingerprint(),
+        )
+
+    def get_certificate(self, borrower: Borrower, reference_date: date = None) -> EligibilityCertificate:
+        if reference_date is None:
+            reference_date = date.today()
+        key = self.fingerprint(borrower, reference_date)
+        now = self._clock()
+
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is not None:
+                self.stats.hits += 1
+                self._track(borrower.aadhaar_id, key, entry)
+                return EligibilityCertificate(
+                    borrower_id=borrower.aadhaar_id,
+                    is_eligible=entry.is_eligible,
+                    issued_date=reference_date,
+                    rejections=list(entry.rejections),
+                )
+            self.stats.misses += 1
+
+        certificate = issue_eligibility_certificate(borrower, reference_date)
+
+        with self._lock:
+            entry = _CacheEntry(
+                is_eligible=certificate.is_eligible,
+                rejections=tuple(certificate.rejections),
+                expires_at=now + self.ttl_seconds,
+                borrower_ids=set(),
+            )
+            self._entries[key] = entry
+            self._track(borrower.aadhaar_id, key, entry)
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._forget(evicted)
+                self.stats.evictions += 1
+
+        return certificate
+
+    def invalidate_borrower(self, aadhaar_id: str) -> bool:
+        """Drop the cached result last served to a borrower, e.g. after their record is updated."""
+        with self._lock:
+            key = self._key_by_borrower.pop(aadhaar_id, None)
+            if key is None:
+                return False
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._forget(entry)
+            self.stats.invalidations += 1
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._key_by_borrower.clear()
+
+    def _lookup(self, key: tuple, now: float) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del self._entries[key]
+            self._forget(entry)
+            self.stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _track(self, aadhaar_id: str, key: tuple, entry: _CacheEntry):
+        previous_key = self._key_by_borrower.get(aadhaar_id)
+        if previous_key is not None and previous_key != key:
+            previous = self._entries.get(previous_key)
+            if previous is not None:
+                previous.borrower_ids.discard(aadhaar_id)
+        self._key_by_borrower[aadhaar_id] = key
+        entry.borrower_ids.add(aadhaar_id)
+
+    def _forget(self, entry: _CacheEntry):
+        for aadhaar_id in entry.borrower_ids:
+            self._key_by_borrower.pop(aadhaar_id, None)
+
+
+# Used by the eligibility page; module state outlives Streamlit reruns (the script re-executes, imports do not)
+ELIGIBILITY_CERTIFICATE_CACHE = EligibilityCertificateCache()
@@ -1,14 +1,83 @@
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional
+from enum import IntFlag
+from typing import NamedTuple, Optional
+
+from src.rules.age import age_in_years
 
 MIN_CREDIT_SCORE = 750
 MIN_AGE = 25
 MAX_AGE = 50
 MAX_DTI_RATIO = 0.50
 
+# Bump whenever rule logic changes without a threshold change
+RULES_VERSION = 1
+
+
+class RejectionCode(IntFlag):
+    CREDIT_SCORE_BELOW_MIN = 1 << 0
+    AGE_BELOW_MIN = 1 << 1
+    AGE_ABOVE_MAX = 1 << 2
+    INCOME_NOT_POSITIVE = 1 << 3
+    DTI_ABOVE_MAX = 1 << 4
+
+
+class Rejection(NamedTuple):
+    """
+    One failed rule. threshold is the limit in force when the rule was
+    evaluated, so the message stays true if the module constants change
+    later; text carries a reason recorded only as a message (see
+    EligibilityCertificate's rejection_reasons keyword).
+    """
+    code: RejectionCode
+    value: float
+    threshold: Optional[float] = None
+    text: Optional[str] = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "Rejection":
+        return cls(RejectionCode(0), 0.0, None, text)
+
+    @property
+    def message(self) -> str:
+        if self.text is not None:
+            return self.text
+        return render_rejection(self.code, self.value, self.threshold)
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def current_threshold(code: RejectionCode) -> Optional[float]:
+    """The module threshold a rule is evaluated against right now."""
+    if code == RejectionCode.CREDIT_SCORE_BELOW_MIN:
+        return MIN_CREDIT_SCORE
+    if code == RejectionCode.AGE_BELOW_MIN:
+        return MIN_AGE
+    if code == RejectionCode.AGE_ABOVE_MAX:
+        return MAX_AGE
+    if code == RejectionCode.DTI_ABOVE_MAX:
+        return MAX_DTI_RATIO
+    return None
+
+
+def render_rejection(code: RejectionCode, value: float, threshold: float = None) -> str:
+    if threshold is None:
+        threshold = current_threshold(code)
+    if code == RejectionCode.CREDIT_SCORE_BELOW_MIN:
+        return f"Credit score {int(value)} is below minimum threshold of {int(threshold)}"
+    if code == RejectionCode.AGE_BELOW_MIN:
+        return f"Borrower age {int(value)} is below minimum of {int(threshold)} years"
+    if code == RejectionCode.AGE_ABOVE_MAX:
+        return f"Borrower age {int(value)} exceeds maximum of {int(threshold)} years"
+    if code == RejectionCode.INCOME_NOT_POSITIVE:
+        return "Monthly income must be positive"
+    if code == RejectionCode.DTI_ABOVE_MAX:
+        return f"DTI ratio {value:.0%} exceeds maximum of {threshold:.0%}"
+    raise ValueError(f"Unknown rejection code: {code!r}")
 
-@dataclass
+
+@dataclass(slots=True)
 class Borrower:
     aadhaar_id: str
     name: str
@@ -18,61 +87,123 @@ class Borrower:
     credit_score: int
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class EligibilityCertificate:
+    """
+    Outcome of the eligibility rules for one borrower.
+
+    Holds Rejection tuples; rejection_reasons renders their messages on
+    access. Callers that only have message strings may still pass
+    rejection_reasons=[...] to the constructor; those reasons are kept as
+    text-only rejections with no code.
+    """
     borrower_id: str
     is_eligible: bool
     issued_date: date
-    rejection_reasons: list[str]
+    rejections: list[Rejection]
 
+    def __init__(
+        self,
+        borrower_id: str,
+        is_eligible: bool,
+        issued_date: date,
+        rejections: list[Rejection] = None,
+        rejection_reasons: list[str] = None,
+    ):
+        if rejection_reasons is not None:
+            if rejections:
+                raise ValueError("Pass either rejections or rejection_reasons, not both")
+            rejections = [Rejection.from_text(reason) for reason in rejection_reasons]
+        self.borrower_id = borrower_id
+        self.is_eligible = is_eligible
+        self.issued_date = issued_date
+        self.rejections = rejections if rejections is not None else []
 
-def validate_credit_score(score: int) -> tuple[bool, Optional[str]]:
+    @property
+    def rejection_codes(self) -> RejectionCode:
+        codes = RejectionCode(0)
+        for rejection in self.rejections:
+            codes |= rejection.code
+        return codes
+
+    @property
+    def rejection_reasons(self) -> list[str]:
+        # Messages are rendered on access; most certificates are never displayed
+        return [rejection.message for rejection in self.rejections]
+
+
+def _credit_score_rejection(score: int) -> Optional[Rejection]:
     if score >= MIN_CREDIT_SCORE:
-        return True, None
-    return False, f"Credit score {score} is below minimum threshold of {MIN_CREDIT_SCORE}"
+        return None
+    return Rejection(RejectionCode.CREDIT_SCORE_BELOW_MIN, score, MIN_CREDIT_SCORE)
 
 
-def validate_age(dob: date, reference_date: date = None) -> tuple[bool, Optional[str]]:
-    from dateutil.relativedelta import relativedelta
-    if reference_date is None:
-        reference_date = date.today()
-    age = relativedelta(reference_date, dob).years
+def _age_rejection(age: int) -> Optional[Rejection]:
     if age < MIN_AGE:
-        return False, f"Borrower age {age} is below minimum of {MIN_AGE} years"
+        return Rejection(RejectionCode.AGE_BELOW_MIN, age, MIN_AGE)
     if age > MAX_AGE:
-        return False, f"Borrower age {age} exceeds maximum of {MAX_AGE} years"
-    return True, None
+        return Rejection(RejectionCode.AGE_ABOVE_MAX, age, MAX_AGE)
+    return None
 
 
-def calculate_dti(monthly_income: float, monthly_liabilities: float) -> tuple[float, bool, Optional[str]]:
+def _dti_rejection(monthly_income: float, monthly_liabilities: float) -> tuple[float, Optional[Rejection]]:
     if monthly_income <= 0:
-        return 0.0, False, "Monthly income must be positive"
+        return 0.0, Rejection(RejectionCode.INCOME_NOT_POSITIVE, monthly_income)
     dti = monthly_liabilities / monthly_income
     if dti <= MAX_DTI_RATIO:
+        return dti, None
+    return dti, Rejection(RejectionCode.DTI_ABOVE_MAX, dti, MAX_DTI_RATIO)
+
+
+def validate_credit_score(score: int) -> tuple[bool, Optional[str]]:
+    rejection = _credit_score_rejection(score)
+    if rejection is None:
+        return True, None
+    return False, rejection.message
+
+
+def validate_age(dob: date, reference_date: date = None) -> tuple[bool, Optional[str]]:
+    if reference_date is None:
+        reference_date = date.today()
+    rejection = _age_rejection(age_in_years(dob, reference_date))
+    if rejection is None:
+        return True, None
+    return False, rejection.message
+
+
+def calculate_dti(monthly_income: float, monthly_liabilities: float) -> tuple[float, bool, Optional[str]]:
+    dti, rejection = _dti_rejection(monthly_income, monthly_liabilities)
+    if rejection is None:
         return dti, True, None
-    return dti, False, f"DTI ratio {dti:.0%} exceeds maximum of {MAX_DTI_RATIO:.0%}"
-
-
-def issue_eligibility_certificate(borrower: Borrower) -> EligibilityCertificate:
-    rejection_reasons = []
-    
-    credit_valid, credit_reason = validate_credit_score(borrower.credit_score)
-    if not credit_valid:
-        rejection_reasons.append(credit_reason)
-    
-    age_valid, age_reason = validate_age(borrower.date_of_birth)
-    if not age_valid:
-        rejection_reasons.append(age_reason)
-    
-    _, dti_valid, dti_reason = calculate_dti(borrower.monthly_income, borrower.monthly_liabilities)
-    if not dti_valid:
-        rejection_reasons.append(dti_reason)
-    
-    is_eligible = len(rejection_reasons) == 0
-    
+    return dti, False, rejection.message
+
+
+def rules_fingerprint() -> tuple:
+    return (RULES_VERSION, MIN_CREDIT_SCORE, MIN_AGE, MAX_AGE, MAX_DTI_RATIO)
+
+
+def issue_eligibility_certificate(borrower: Borrower, reference_date: date = None) -> EligibilityCertificate:
+    if reference_date is None:
+        reference_date = date.today()
+    rejections = []
+
+    credit_rejection = _credit_score_rejection(borrower.credit_score)
+    if credit_rejection is not None:
+        rejections.append(credit_rejection)
+
+    age_rejection = _age_rejection(age_in_years(borrower.date_of_birth, reference_date))
+    if age_rejection is not None:
+        rejections.append(age_rejection)
+
+    _, dti_rejection = _dti_rejection(borrower.monthly_income, borrower.monthly_liabilities)
+    if dti_rejection is not None:
+        rejections.append(dti_rejection)
+
+    is_eligible = len(rejections) == 0
+
     return EligibilityCertificate(
         borrower_id=borrower.aadhaar_id,
         is_eligible=is_eligible,
-        issued_date=date.today(),
-        rejection_reasons=rejection_reasons,
+        issued_date=reference_date,
+        rejections=rejections,
     )
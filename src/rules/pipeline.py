@@ -0,0 +1,139 @@
+import csv
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Protocol, Union
+
+import numpy as np
+
+from src.rules.batch import BATCH_COLUMNS, EligibilityBatchResult, issue_eligibility_certificates_batch
+from src.rules.eligibility import EligibilityCertificate
+
+DEFAULT_CHUNK_SIZE = 100_000
+PIPELINE_COLUMNS = ("aadhaar_id",) + BATCH_COLUMNS
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+class EligibilitySink(Protocol):
+    def write_batch(self, borrower_ids: np.ndarray, result: EligibilityBatchResult) -> None: ...
+
+    def close(self) -> None: ...
+
+
+@dataclass
+class PipelineStats:
+    chunks: int = 0
+    rows: int = 0
+    eligible: int = 0
+
+
+class CertificateSink:
+    """Renders each row as an EligibilityCertificate and hands it to a callback."""
+
+    def __init__(self, on_certificate: Callable[[EligibilityCertificate], None], issued_date: date = None):
+        self.on_certificate = on_certificate
+        self.issued_date = issued_date
+
+    def write_batch(self, borrower_ids: np.ndarray, result: EligibilityBatchResult) -> None:
+        for certificate in result.to_certificates(borrower_ids, self.issued_date):
+            self.on_certificate(certificate)
+
+    def close(self) -> None:
+        pass
+
+
+class CsvCertificateSink:
+    """Appends certificate rows to a CSV file, one write per chunk."""
+
+    HEADER = ("borrower_id", "is_eligible", "reason_mask", "rejection_reasons")
+
+    def __init__(self, path: Union[str, Path]):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.HEADER)
+
+    def write_batch(self, borrower_ids: np.ndarray, result: EligibilityBatchResult) -> None:
+        self._writer.writerows(
+            (borrower_ids[i], bool(result.is_eligible[i]), int(result.reason_mask[i]), "; ".join(result.rejection_reasons(i)))
+            for i in range(len(result))
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_borrower_chunks(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Stream borrower columns from a CSV or Parquet file in fixed-size chunks.
+
+    Args:
+        path: Borrower file; Parquet is detected by the .parquet/.pq suffix
+        chunk_size: Maximum rows per chunk
+
+    Yields:
+        Mapping of PIPELINE_COLUMNS to arrays for each chunk
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    if Path(path).suffix.lower() in PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=list(PIPELINE_COLUMNS)):
+            yield {column: batch.column(column).to_numpy(zero_copy_only=False) for column in PIPELINE_COLUMNS}
+        return
+
+    import pandas as pd
+    reader = pd.read_csv(
+        path,
+        chunksize=chunk_size,
+        usecols=list(PIPELINE_COLUMNS),
+        dtype={"aadhaar_id": str},
+        parse_dates=["date_of_birth"],
+    )
+    with reader:
+        for frame in reader:
+            yield {column: frame[column].to_numpy() for column in PIPELINE_COLUMNS}
+
+
+def evaluate_chunks(chunks: Iterable, reference_date: date = None) -> Iterator[tuple[np.ndarray, EligibilityBatchResult]]:
+    if reference_date is None:
+        reference_date = date.today()
+    for chunk in chunks:
+        yield np.asarray(chunk["aadhaar_id"]), issue_eligibility_certificates_batch(chunk, reference_date)
+
+
+def run_eligibility_pipeline(
+    source: Union[str, Path, Iterable],
+    sink: EligibilitySink,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    reference_date: date = None,
+) -> PipelineStats:
+    """
+    Run the eligibility rules over a borrower file chunk by chunk.
+
+    Only one chunk is held in memory at a time, so memory stays bounded by
+    chunk_size regardless of input size.
+
+    Args:
+        source: CSV/Parquet path, or an iterable of column mappings
+        sink: Receives (borrower_ids, EligibilityBatchResult) for every chunk
+        chunk_size: Rows per chunk when reading from a path
+        reference_date: Date ages are measured against (defaults to today)
+
+    Returns:
+        PipelineStats with chunk, row and eligible counts
+    """
+    if isinstance(source, (str, Path)):
+        source = read_borrower_chunks(source, chunk_size)
+
+    stats = PipelineStats()
+    try:
+        for borrower_ids, result in evaluate_chunks(source, reference_date):
+            sink.write_batch(borrower_ids, result)
+            stats.chunks += 1
+            stats.rows += len(result)
+            stats.eligible += int(result.is_eligible.sum())
+    finally:
+        sink.close()
+    return stats
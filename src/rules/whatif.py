@@ -0,0 +1,144 @@
+from datetime import date
+from typing import Sequence
+
+import numpy as np
+
+import src.rules.eligibility as eligibility
+from src.rules.age import ages_in_years
+
+
+def _thresholds(values) -> tuple[np.ndarray, np.ndarray]:
+    values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+    order = np.argsort(values, kind="stable")
+    return values[order], order
+
+
+class EligibilityWhatIfIndex:
+    """
+    Sorted per-rule index over a borrower book for threshold what-if analysis.
+
+    Each rule (credit score, age, DTI) keeps its borrowers sorted by the rule's
+    metric, so the set passing any threshold is a binary-searched slice. A
+    combined query filters only the smallest passing slice against the other
+    rules. Borrowers with non-positive income carry an infinite DTI and never
+    pass the DTI rule, as in calculate_dti.
+    """
+
+    def __init__(self, aadhaar_ids: Sequence[str], credit_score, age, dti):
+        self.aadhaar_ids = np.asarray(aadhaar_ids)
+        self.credit_score = np.asarray(credit_score, dtype=np.int64)
+        self.age = np.asarray(age, dtype=np.int64)
+        self.dti = np.asarray(dti, dtype=np.float64)
+
+        self._score_order = np.argsort(self.credit_score, kind="stable")
+        self._sorted_scores = self.credit_score[self._score_order]
+        self._age_order = np.argsort(self.age, kind="stable")
+        self._sorted_ages = self.age[self._age_order]
+        self._dti_order = np.argsort(self.dti, kind="stable")
+        self._sorted_dti = self.dti[self._dti_order]
+
+    def __len__(self) -> int:
+        return len(self.credit_score)
+
+    @classmethod
+    def from_columns(cls, data, reference_date: date = None) -> "EligibilityWhatIfIndex":
+        """Build the index from the same columns issue_eligibility_certificates_batch takes, plus aadhaar_id."""
+        if reference_date is None:
+            reference_date = date.today()
+        income = np.asarray(data["monthly_income"], dtype=np.float64)
+        liabilities = np.asarray(data["monthly_liabilities"], dtype=np.float64)
+        income_positive = income > 0
+        dti = np.where(income_positive, liabilities / np.where(income_positive, income, 1.0), np.inf)
+        return cls(
+            aadhaar_ids=data["aadhaar_id"],
+            credit_score=data["credit_score"],
+            age=ages_in_years(data["date_of_birth"], reference_date),
+            dti=dti,
+        )
+
+    def eligible_positions(
+        self,
+        min_credit_score: int = None,
+        min_age: int = None,
+        max_age: int = None,
+        max_dti_ratio: float = None,
+    ) -> np.ndarray:
+        """Input-order positions of borrowers eligible under the given thresholds (module constants by default)."""
+        min_credit_score = eligibility.MIN_CREDIT_SCORE if min_credit_score is None else min_credit_score
+        min_age = eligibility.MIN_AGE if min_age is None else min_age
+        max_age = eligibility.MAX_AGE if max_age is None else max_age
+        max_dti_ratio = eligibility.MAX_DTI_RATIO if max_dti_ratio is None else max_dti_ratio
+
+        candidates = min(
+            self._score_order[np.searchsorted(self._sorted_scores, min_credit_score, side="left"):],
+            self._age_order[
+                np.searchsorted(self._sorted_ages, min_age, side="left"):
+                np.searchsorted(self._sorted_ages, max_age, side="right")
+            ],
+            self._dti_order[:np.searchsorted(self._sorted_dti, max_dti_ratio, side="right")],
+            key=len,
+        )
+        age = self.age[candidates]
+        passes = (
+            (self.credit_score[candidates] >= min_credit_score)
+            & (age >= min_age)
+            & (age <= max_age)
+            & (self.dti[candidates] <= max_dti_ratio)
+        )
+        return np.sort(candidates[passes])
+
+    def count(self, min_credit_score: int = None, min_age: int = None, max_age: int = None,
+              max_dti_ratio: float = None) -> int:
+        return len(self.eligible_positions(min_credit_score, min_age, max_age, max_dti_ratio))
+
+    def borrowers(self, min_credit_score: int = None, min_age: int = None, max_age: int = None,
+                  max_dti_ratio: float = None) -> np.ndarray:
+        return self.aadhaar_ids[self.eligible_positions(min_credit_score, min_age, max_age, max_dti_ratio)]
+
+    def sweep(
+        self,
+        min_credit_scores: Sequence[int] = None,
+        min_ages: Sequence[int] = None,
+        max_ages: Sequence[int] = None,
+        max_dti_ratios: Sequence[float] = None,
+    ) -> np.ndarray:
+        """
+        Eligible counts for every combination of the given thresholds in one pass.
+
+        Each borrower is binned by how many thresholds of each rule it passes,
+        and cumulative sums over the bin histogram turn the bins into counts,
+        so the cost is O(N log T + grid size) rather than one scan per grid point.
+
+        Args:
+            min_credit_scores: MIN_CREDIT_SCORE values (defaults to the current constant)
+            min_ages: MIN_AGE values (defaults to the current constant)
+            max_ages: MAX_AGE values (defaults to the current constant)
+            max_dti_ratios: MAX_DTI_RATIO values (defaults to the current constant)
+
+        Returns:
+            int64 array of shape (len(min_credit_scores), len(min_ages), len(max_ages), len(max_dti_ratios))
+            in the order the thresholds were given
+        """
+        scores, score_order = _thresholds(eligibility.MIN_CREDIT_SCORE if min_credit_scores is None else min_credit_scores)
+        low_ages, low_age_order = _thresholds(eligibility.MIN_AGE if min_ages is None else min_ages)
+        high_ages, high_age_order = _thresholds(eligibility.MAX_AGE if max_ages is None else max_ages)
+        dtis, dti_order = _thresholds(eligibility.MAX_DTI_RATIO if max_dti_ratios is None else max_dti_ratios)
+
+        # Sorted thresholds with index < bin are passed for ">=" rules, index >= bin for "<=" rules
+        score_bin = np.searchsorted(scores, self.credit_score, side="right")
+        low_age_bin = np.searchsorted(low_ages, self.age, side="right")
+        high_age_bin = np.searchsorted(high_ages, self.age, side="left")
+        dti_bin = np.searchsorted(dtis, self.dti, side="left")
+
+        shape = (len(scores) + 1, len(low_ages) + 1, len(high_ages) + 1, len(dtis) + 1)
+        flat = np.ravel_multi_index((score_bin, low_age_bin, high_age_bin, dti_bin), shape)
+        counts = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+
+        counts = np.flip(np.cumsum(np.flip(counts, axis=0), axis=0), axis=0)[1:]
+        counts = np.flip(np.cumsum(np.flip(counts, axis=1), axis=1), axis=1)[:, 1:]
+        counts = np.cumsum(counts, axis=2)[:, :, :-1]
+        counts = np.cumsum(counts, axis=3)[:, :, :, :-1]
+
+        grid = np.empty_like(counts)
+        grid[np.ix_(score_order, low_age_order, high_age_order, dti_order)] = counts
+        return grid
@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Optional
+
+from src.securitization.pooling import Loan
+
+
+@dataclass(slots=True)
+class PoolAggregate:
+    pool_id: str
+    loan_count: int = 0
+    total_value: float = 0.0
+    credit_score_sum: float = 0.0
+    weighted_rate_sum: float = 0.0
+
+    @property
+    def avg_credit_score(self) -> Optional[float]:
+        return self.credit_score_sum / self.loan_count if self.loan_count else None
+
+    @property
+    def weighted_avg_coupon(self) -> Optional[float]:
+        return self.weighted_rate_sum / self.total_value if self.total_value else None
+
+
+@dataclass
+class PoolDrift:
+    pool_id: str
+    expected: PoolAggregate
+    actual: PoolAggregate
+
+
+class PoolAggregates:
+    """
+    Running per-pool statistics updated by loan deltas.
+
+    Mirrors the LOAN_COUNT, TOTAL_VALUE, CREDIT_SCORE_SUM and WEIGHTED_RATE_SUM
+    columns that ASSIGN_LOANS_TO_POOLS maintains on RMBS_POOLS: assigning or
+    removing a loan adjusts only its pool, and verify() compares against a full
+    rebuild to catch drift (e.g. a borrower's score changing while pooled).
+    """
+
+    def __init__(self):
+        self._pools: dict[str, PoolAggregate] = {}
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def __iter__(self):
+        return iter(sorted(self._pools.values(), key=lambda aggregate: aggregate.pool_id))
+
+    def get(self, pool_id: str) -> PoolAggregate:
+        return self._pools.get(pool_id) or PoolAggregate(pool_id)
+
+    @classmethod
+    def from_pool_rows(cls, rows: Iterable[Mapping]) -> "PoolAggregates":
+        """Load the running aggregates stored on RMBS_POOLS rows."""
+        aggregates = cls()
+        for row in rows:
+            aggregates._pools[row["POOL_ID"]] = PoolAggregate(
+                pool_id=row["POOL_ID"],
+                loan_count=int(row["LOAN_COUNT"] or 0),
+                total_value=float(row["TOTAL_VALUE"] or 0),
+                credit_score_sum=float(row["CREDIT_SCORE_SUM"] or 0),
+                weighted_rate_sum=float(row["WEIGHTED_RATE_SUM"] or 0),
+            )
+        return aggregates
+
+    @classmethod
+    def from_session(cls, session, schema: str = "CORE") -> "PoolAggregates":
+        """Read the running aggregates straight off RMBS_POOLS; one row per pool, no loan scan."""
+        return cls.from_pool_rows(session.sql(
+            f"SELECT POOL_ID, LOAN_COUNT, TOTAL_VALUE, CREDIT_SCORE_SUM, WEIGHTED_RATE_SUM FROM {schema}.RMBS_POOLS"
+        ).collect())
+
+    def totals(self) -> PoolAggregate:
+        """Book-wide sums over every pool, as a PoolAggregate with pool_id "ALL"."""
+        total = PoolAggregate("ALL")
+        for aggregate in self._pools.values():
+            total.loan_count += aggregate.loan_count
+            total.total_value += aggregate.total_value
+            total.credit_score_sum += aggregate.credit_score_sum
+            total.weighted_rate_sum += aggregate.weighted_rate_sum
+        return total
+
+    @classmethod
+    def rebuild(cls, loans: Iterable[tuple[Loan, int]]) -> "PoolAggregates":
+        """Full recomputation from (loan, borrower credit score) pairs; unpooled loans are skipped."""
+        aggregates = cls()
+        for loan, credit_score in loans:
+            if loan.pool_id is not None:
+                aggregates.add_loan(loan.pool_id, loan, credit_score)
+        return aggregates
+
+    def add_loan(self, pool_id: str, loan: Loan, credit_score: int):
+        self._apply(pool_id, 1, loan.amount, credit_score, loan.amount * (loan.interest_rate or 0.0))
+
+    def remove_loan(self, pool_id: str, loan: Loan, credit_score: int):
+        self._apply(pool_id, -1, -loan.amount, -credit_score, -loan.amount * (loan.interest_rate or 0.0))
+
+    def verify(self, expected: "PoolAggregates", repair: bool = False, tolerance: float = 0.01) -> list[PoolDrift]:
+        """
+        Compare against a full rebuild.
+
+        Args:
+            expected: Aggregates from PoolAggregates.rebuild over the current loan book
+            repair: Replace drifted pools with the rebuilt values
+            tolerance: Allowed absolute difference on the summed amounts
+
+        Returns:
+            One PoolDrift per pool whose running values differ from the rebuild
+        """
+        drifts = []
+        for pool_id in sorted(self._pools.keys() | expected._pools.keys()):
+            actual_pool, expected_pool = self.get(pool_id), expected.get(pool_id)
+            if (
+                actual_pool.loan_count != expected_pool.loan_count
+                or abs(actual_pool.total_value - expected_pool.total_value) > tolerance
+                or abs(actual_pool.credit_score_sum - expected_pool.credit_score_sum) > tolerance
+                or abs(actual_pool.weighted_rate_sum - expected_pool.weighted_rate_sum) > tolerance
+            ):
+                drifts.append(PoolDrift(pool_id, expected_pool, actual_pool))
+        if repair:
+            for drift in drifts:
+                self._pools[drift.pool_id] = PoolAggregate(
+                    pool_id=drift.pool_id,
+                    loan_count=drift.expected.loan_count,
+                    total_value=drift.expected.total_value,
+                    credit_score_sum=drift.expected.credit_score_sum,
+                    weighted_rate_sum=drift.expected.weighted_rate_sum,
+                )
+        return drifts
+
+    def _apply(self, pool_id: str, count: int, value: float, credit_score: float, weighted_rate: float):
+        aggregate = self._pools.get(pool_id)
+        if aggregate is None:
+            aggregate = self._pools[pool_id] = PoolAggregate(pool_id)
+        aggregate.loan_count += count
+        aggregate.total_value += value
+        aggregate.credit_score_sum += credit_score
+        aggregate.weighted_rate_sum += weighted_rate
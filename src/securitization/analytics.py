@@ -0,0 +1,340 @@
+import threading
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+# Lower edges of the credit-score histogram bins (scores below 650 share the first bin)
+SCORE_BIN_EDGES = (650, 700, 750, 775, 800, 825, 850)
+SCORE_BIN_LABELS = ("<650", "650-699", "700-749", "750-774", "775-799", "800-824", "825-849", "850+")
+# Loan-size bucket edges in rupees: 25L, 50L, 75L, 1Cr, 2Cr
+SIZE_BUCKET_EDGES = (2_500_000, 5_000_000, 7_500_000, 10_000_000, 20_000_000)
+SIZE_BUCKET_LABELS = ("<25L", "25-50L", "50-75L", "75L-1Cr", "1-2Cr", "2Cr+")
+DEFAULT_CHECK_INTERVAL_SECONDS = 60.0
+# Object columns saved as fixed-width unicode plus a null mask, so load() never unpickles
+_STRING_COLUMNS = ("pool_id", "name", "status")
+
+
+@dataclass
+class PoolAnalyticsCube:
+    """
+    Per-pool analytics in columnar form; row i of every array describes pool_id[i].
+
+    score_histogram and size_histogram are (pools, bins) loan counts over
+    SCORE_BIN_LABELS and SIZE_BUCKET_LABELS. wac is the amount-weighted annual
+    rate and wam_months the amount-weighted remaining term; pools without loans
+    have zero counts and NaN extremes. version identifies the pool membership
+    and RMBS_POOLS state the cube was built from.
+    """
+    pool_id: np.ndarray
+    name: np.ndarray
+    aggregation_date: np.ndarray
+    status: np.ndarray
+    loan_count: np.ndarray
+    total_value: np.ndarray
+    avg_credit_score: np.ndarray
+    min_credit_score: np.ndarray
+    max_credit_score: np.ndarray
+    min_amount: np.ndarray
+    max_amount: np.ndarray
+    wac: np.ndarray
+    wam_months: np.ndarray
+    score_histogram: np.ndarray
+    size_histogram: np.ndarray
+    version: str = ""
+
+    def __len__(self) -> int:
+        return len(self.pool_id)
+
+    def to_frame(self):
+        """One row per pool for st.dataframe (histograms via histogram_frame)."""
+        import pandas as pd
+
+        return pd.DataFrame({
+            "POOL_ID": self.pool_id,
+            "NAME": self.name,
+            "AGGREGATION_DATE": self.aggregation_date,
+            "STATUS": self.status,
+            "LOAN_COUNT": self.loan_count,
+            "TOTAL_VALUE": self.total_value,
+            "AVG_CREDIT_SCORE": self.avg_credit_score.round(0),
+            "MIN_CREDIT_SCORE": self.min_credit_score,
+            "MAX_CREDIT_SCORE": self.max_credit_score,
+            "MIN_AMOUNT": self.min_amount,
+            "MAX_AMOUNT": self.max_amount,
+            "WAC_PCT": (self.wac * 100).round(2),
+            "WAM_MONTHS": self.wam_months.round(1),
+        })
+
+    def histogram_frame(self, kind: str = "score"):
+        """Pools x bins loan counts, kind "score" or "size"."""
+        import pandas as pd
+
+        if kind == "score":
+            counts, labels = self.score_histogram, SCORE_BIN_LABELS
+        elif kind == "size":
+            counts, labels = self.size_histogram, SIZE_BUCKET_LABELS
+        else:
+            raise ValueError(f"Unknown histogram kind: {kind}")
+        return pd.DataFrame(counts, index=self.pool_id, columns=list(labels))
+
+    def save(self, path) -> Path:
+        """Persist as a compressed .npz, one array per column, loadable without pickle."""
+        path = Path(path)
+        arrays = {}
+        for f in fields(self):
+            values = getattr(self, f.name)
+            if f.name in _STRING_COLUMNS:
+                arrays[f.name] = np.array(["" if value is None else str(value) for value in values], dtype=str)
+                arrays[f"{f.name}_null"] = np.array([value is None for value in values], dtype=bool)
+            elif f.name == "aggregation_date":
+                arrays[f.name] = np.array(
+                    [np.datetime64("NaT") if value is None else value for value in values], dtype="datetime64[D]"
+                )
+            elif f.name != "version":
+                arrays[f.name] = values
+        arrays["version"] = np.array(self.version, dtype=str)
+        with path.open("wb") as handle:
+            np.savez_compressed(handle, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path) -> "PoolAnalyticsCube":
+        with np.load(Path(path), allow_pickle=False) as data:
+            columns = {name: data[name] for name in data.files}
+        for name in _STRING_COLUMNS:
+            values = columns[name].astype(object)
+            values[columns.pop(f"{name}_null")] = None
+            columns[name] = values
+        # datetime64[D] -> datetime.date, with NaT back to None
+        columns["aggregation_date"] = columns["aggregation_date"].astype(object)
+        columns["version"] = str(columns["version"])
+        return cls(**columns)
+
+
+def _bucket(values: np.ndarray, edges: tuple) -> np.ndarray:
+    return np.searchsorted(np.asarray(edges), values, side="right")
+
+
+def _bucket_sql(column: str, edges: tuple) -> str:
+    """SQL CASE expression matching _bucket for the same edges."""
+    whens = " ".join(f"WHEN {column} < {edge} THEN {index}" for index, edge in enumerate(edges))
+    return f"CASE {whens} ELSE {len(edges)} END"
+
+
+def _assemble(cells: dict, pools: dict = None, version: str = "") -> PoolAnalyticsCube:
+    """
+    Roll (pool, score bin, size bucket) cells up to one row per pool.
+
+    Each cell carries a loan count plus amount, amount x rate and amount x
+    remaining-term sums and min/max extremes, so loan-level rows (one loan per
+    cell) and pre-grouped warehouse rows go through the same path. Every pool
+    in pools gets a row even when no cell references it.
+    """
+    pools = pools or {}
+    cell_pools = np.asarray(cells["pool_id"], dtype=str)
+    pool_ids = np.unique(np.concatenate([cell_pools, np.asarray(list(pools), dtype=str)]))
+    pool_index = np.searchsorted(pool_ids, cell_pools)
+    n_pools = len(pool_ids)
+    count = np.asarray(cells["loan_count"], dtype=np.int64)
+
+    def total(column):
+        return np.bincount(pool_index, weights=np.asarray(cells[column], dtype=np.float64), minlength=n_pools)
+
+    loan_count = np.bincount(pool_index, weights=count, minlength=n_pools).astype(np.int64)
+
+    def extreme(column, reducer, initial):
+        out = np.full(n_pools, initial, dtype=np.float64)
+        reducer.at(out, pool_index, np.asarray(cells[column], dtype=np.float64))
+        out[loan_count == 0] = np.nan
+        return out
+
+    total_value = total("amount_sum")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_score = np.nan_to_num(total("score_sum") / loan_count)
+        wac = np.nan_to_num(total("weighted_rate_sum") / total_value)
+        wam = np.nan_to_num(total("weighted_term_sum") / total_value)
+
+    score_histogram = np.bincount(
+        pool_index * len(SCORE_BIN_LABELS) + np.asarray(cells["score_bin"], dtype=np.int64),
+        weights=count, minlength=n_pools * len(SCORE_BIN_LABELS),
+    ).reshape(n_pools, len(SCORE_BIN_LABELS)).astype(np.int64)
+    size_histogram = np.bincount(
+        pool_index * len(SIZE_BUCKET_LABELS) + np.asarray(cells["size_bucket"], dtype=np.int64),
+        weights=count, minlength=n_pools * len(SIZE_BUCKET_LABELS),
+    ).reshape(n_pools, len(SIZE_BUCKET_LABELS)).astype(np.int64)
+
+    metadata = [pools.get(pool_id, {}) for pool_id in pool_ids.tolist()]
+    return PoolAnalyticsCube(
+        pool_id=pool_ids.astype(object),
+        name=np.array([m.get("name") for m in metadata], dtype=object),
+        aggregation_date=np.array([m.get("aggregation_date") for m in metadata], dtype=object),
+        status=np.array([m.get("status") for m in metadata], dtype=object),
+        loan_count=loan_count,
+        total_value=total_value,
+        avg_credit_score=avg_score,
+        min_credit_score=extreme("min_score", np.minimum, np.inf),
+        max_credit_score=extreme("max_score", np.maximum, -np.inf),
+        min_amount=extreme("min_amount", np.minimum, np.inf),
+        max_amount=extreme("max_amount", np.maximum, -np.inf),
+        wac=wac,
+        wam_months=wam,
+        score_histogram=score_histogram,
+        size_histogram=size_histogram,
+        version=version,
+    )
+
+
+def build_pool_analytics(pool_id, amount, interest_rate, credit_score, remaining_months,
+                         pools: dict = None, version: str = "") -> PoolAnalyticsCube:
+    """
+    Build the cube from loan-level columns.
+
+    Args:
+        pool_id: Pool of each loan
+        amount: Loan amounts
+        interest_rate: Annual rates as fractions
+        credit_score: Borrower credit scores
+        remaining_months: Months left to maturity
+        pools: Optional metadata by pool ID (name, aggregation_date, status)
+        version: Membership version to stamp on the cube
+    """
+    amount = np.asarray(amount, dtype=np.float64)
+    credit_score = np.asarray(credit_score, dtype=np.float64)
+    cells = {
+        "pool_id": pool_id,
+        "score_bin": _bucket(credit_score, SCORE_BIN_EDGES),
+        "size_bucket": _bucket(amount, SIZE_BUCKET_EDGES),
+        "loan_count": np.ones(len(amount), dtype=np.int64),
+        "amount_sum": amount,
+        "score_sum": credit_score,
+        "weighted_rate_sum": amount * np.asarray(interest_rate, dtype=np.float64),
+        "weighted_term_sum": amount * np.asarray(remaining_months, dtype=np.float64),
+        "min_score": credit_score,
+        "max_score": credit_score,
+        "min_amount": amount,
+        "max_amount": amount,
+    }
+    return _assemble(cells, pools, version)
+
+
+def membership_version(session, schema: str = "CORE") -> str:
+    """
+    Cheap fingerprint of the cube's inputs: which loans sit in which pools,
+    plus each pool's name, aggregation date and status on RMBS_POOLS, so a
+    status change (e.g. to SECURITIZED) or a new empty pool also moves it.
+    Borrower credit scores feed the score bins, and remaining terms are
+    measured from CURRENT_DATE(), so a re-scored borrower or a new day moves
+    it too.
+    """
+    row = session.sql(f"""
+        SELECT
+            CURRENT_DATE() AS AS_OF,
+            (SELECT COUNT(*) FROM {schema}.LOANS WHERE POOL_ID IS NOT NULL) AS LOANS,
+            (SELECT HASH_AGG(LOAN_ID, POOL_ID) FROM {schema}.LOANS WHERE POOL_ID IS NOT NULL) AS MEMBERSHIP_HASH,
+            (SELECT HASH_AGG(POOL_ID, NAME, AGGREGATION_DATE, STATUS) FROM {schema}.RMBS_POOLS) AS POOLS_HASH,
+            (SELECT HASH_AGG(AADHAAR_ID, CREDIT_SCORE, UPDATED_AT) FROM {schema}.BORROWERS) AS BORROWERS_HASH
+    """).collect()[0]
+    return (f"{row['AS_OF']}:{row['LOANS']}:{row['MEMBERSHIP_HASH']}:{row['POOLS_HASH']}:"
+            f"{row['BORROWERS_HASH']}")
+
+
+def load_pool_analytics(session, schema: str = "CORE", version: str = None) -> PoolAnalyticsCube:
+    """
+    Build the cube from the warehouse.
+
+    Loans are grouped by pool, score bin and size bucket in SQL, so only a few
+    rows per pool leave Snowflake however large the pools are. Pools come from
+    RMBS_POOLS, so a pool with no loans yet still gets an (empty) row.
+    """
+    if version is None:
+        version = membership_version(session, schema)
+    cell_rows = session.sql(f"""
+        SELECT
+            L.POOL_ID,
+            {_bucket_sql("B.CREDIT_SCORE", SCORE_BIN_EDGES)} AS SCORE_BIN,
+            {_bucket_sql("L.AMOUNT", SIZE_BUCKET_EDGES)} AS SIZE_BUCKET,
+            COUNT(*) AS LOAN_COUNT,
+            SUM(L.AMOUNT) AS AMOUNT_SUM,
+            SUM(B.CREDIT_SCORE) AS SCORE_SUM,
+            SUM(L.AMOUNT * L.INTEREST_RATE) AS WEIGHTED_RATE_SUM,
+            SUM(L.AMOUNT * GREATEST(L.TENURE_MONTHS - DATEDIFF(MONTH, L.DISBURSEMENT_DATE, CURRENT_DATE()), 0))
+                AS WEIGHTED_TERM_SUM,
+            MIN(B.CREDIT_SCORE) AS MIN_SCORE,
+            MAX(B.CREDIT_SCORE) AS MAX_SCORE,
+            MIN(L.AMOUNT) AS MIN_AMOUNT,
+            MAX(L.AMOUNT) AS MAX_AMOUNT
+        FROM {schema}.LOANS L
+        JOIN {schema}.BORROWERS B ON L.BORROWER_ID = B.AADHAAR_ID
+        WHERE L.POOL_ID IS NOT NULL
+        GROUP BY 1, 2, 3
+    """).collect()
+    pool_rows = session.sql(
+        f"SELECT POOL_ID, NAME, AGGREGATION_DATE, STATUS FROM {schema}.RMBS_POOLS"
+    ).collect()
+
+    columns = ("POOL_ID", "SCORE_BIN", "SIZE_BUCKET", "LOAN_COUNT", "AMOUNT_SUM", "SCORE_SUM",
+               "WEIGHTED_RATE_SUM", "WEIGHTED_TERM_SUM", "MIN_SCORE", "MAX_SCORE", "MIN_AMOUNT", "MAX_AMOUNT")
+    cells = {column.lower(): [row[column] for row in cell_rows] for column in columns}
+    pools = {
+        row["POOL_ID"]: {"name": row["NAME"], "aggregation_date": row["AGGREGATION_DATE"], "status": row["STATUS"]}
+        for row in pool_rows
+    }
+    return _assemble(cells, pools, version)
+
+
+class PoolAnalyticsCache:
+    """
+    Serves the pool analytics cube to page reruns without re-aggregating.
+
+    The membership version is re-checked at most every check_interval_seconds;
+    the cube is rebuilt only when it has changed or invalidate() was called.
+    With a path, the cube is also persisted there, so a fresh process can reuse
+    the last build if membership has not moved since.
+    """
+
+    def __init__(
+        self,
+        check_interval_seconds: float = DEFAULT_CHECK_INTERVAL_SECONDS,
+        path=None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.check_interval_seconds = check_interval_seconds
+        self.path = Path(path) if path is not None else None
+        self._clock = clock
+        self._cube: Optional[PoolAnalyticsCube] = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def get(self, session, schema: str = "CORE") -> PoolAnalyticsCube:
+        with self._lock:
+            now = self._clock()
+            if (self._cube is not None and self._checked_at is not None
+                    and now - self._checked_at < self.check_interval_seconds):
+                return self._cube
+
+            version = membership_version(session, schema)
+            self._checked_at = now
+            if self._cube is None and self.path is not None and self.path.exists():
+                self._cube = PoolAnalyticsCube.load(self.path)
+            if self._cube is None or self._cube.version != version:
+                self._cube = load_pool_analytics(session, schema, version)
+                self.builds += 1
+                if self.path is not None:
+                    self._cube.save(self.path)
+            return self._cube
+
+    def invalidate(self):
+        """Force a rebuild on the next get(), e.g. right after pools were reassigned."""
+        with self._lock:
+            self._cube = None
+            self._checked_at = None
+            if self.path is not None:
+                self.path.unlink(missing_ok=True)
+
+
+# Module-level cache shared by Streamlit reruns (the app script re-executes, imported modules do not)
+POOL_ANALYTICS_CACHE = PoolAnalyticsCache()
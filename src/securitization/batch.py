@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from src.securitization.pooling import MHP_MONTHS
+
+
+@dataclass
+class PoolAssignmentBatch:
+    eligible_date: np.ndarray
+    pool_year: np.ndarray
+    pool_quarter: np.ndarray
+    assigned: np.ndarray
+    pool_id: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.assigned)
+
+
+def add_months(dates, months: int) -> np.ndarray:
+    """
+    Vectorized date + relativedelta(months=months).
+
+    The day is clamped to the end of the target month, so 31 Aug + 6 months
+    is 28 Feb (29 Feb in leap years), as relativedelta does.
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    month_start = dates.astype("datetime64[M]")
+    day_offset = dates - month_start.astype("datetime64[D]")
+    target_month = month_start + months
+    target_start = target_month.astype("datetime64[D]")
+    last_day_offset = (target_month + 1).astype("datetime64[D]") - target_start - 1
+    return target_start + np.minimum(day_offset, last_day_offset)
+
+
+def format_pool_ids(pool_year: np.ndarray, pool_quarter: np.ndarray) -> np.ndarray:
+    """Pool ID strings (RMBS-{year}-Q{quarter}), formatting each distinct pool only once."""
+    keys = pool_year.astype(np.int64) * 4 + (pool_quarter.astype(np.int64) - 1)
+    if len(keys) == 0:
+        return np.empty(0, dtype=object)
+    # Quarter keys span a small contiguous range, so a direct lookup table beats np.unique
+    first = int(keys.min())
+    labels = np.array(
+        [f"RMBS-{key // 4}-Q{key % 4 + 1}" for key in range(first, int(keys.max()) + 1)],
+        dtype=object,
+    )
+    return labels[keys - first]
+
+
+def assign_rmbs_pools(disbursement_dates, reference_date: date = None) -> PoolAssignmentBatch:
+    """
+    Vectorized assign_rmbs_pool over many loans.
+
+    Args:
+        disbursement_dates: Array-like of disbursement dates
+        reference_date: Date the MHP is checked against (defaults to today)
+
+    Returns:
+        PoolAssignmentBatch with each loan's pool eligible date, quarter pool,
+        whether the MHP has been met, and the pool ID (None where not assigned)
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    eligible_date = add_months(disbursement_dates, MHP_MONTHS)
+    eligible_month = eligible_date.astype("datetime64[M]").astype(np.int64)
+    pool_year = eligible_month // 12 + 1970
+    pool_quarter = eligible_month % 12 // 3 + 1
+    assigned = eligible_date <= np.datetime64(reference_date, "D")
+
+    pool_id = np.full(len(eligible_date), None, dtype=object)
+    pool_id[assigned] = format_pool_ids(pool_year[assigned], pool_quarter[assigned])
+
+    return PoolAssignmentBatch(
+        eligible_date=eligible_date,
+        pool_year=pool_year,
+        pool_quarter=pool_quarter,
+        assigned=assigned,
+        pool_id=pool_id,
+    )
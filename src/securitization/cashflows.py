@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.securitization.catalog import parse_pool_id
+
+MAX_TENURE_MONTHS = 360
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+@dataclass
+class LoanCashFlows:
+    """Scheduled cash flows as loans x months matrices; column m is EMI number m + 1."""
+    principal: np.ndarray
+    interest: np.ndarray
+    balance: np.ndarray
+
+    @property
+    def payment(self) -> np.ndarray:
+        return self.principal + self.interest
+
+
+@dataclass
+class PoolCashFlows:
+    """Pool-level scheduled principal, interest and closing balance per month."""
+    month: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    balance: np.ndarray
+    loan_count: int
+
+    @property
+    def payment(self) -> np.ndarray:
+        return self.principal + self.interest
+
+
+def _as_loan_arrays(principal, annual_rate, tenure_months) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    principal = np.asarray(principal, dtype=np.float64)
+    monthly_rate = np.asarray(annual_rate, dtype=np.float64) / 12
+    tenure = np.asarray(tenure_months, dtype=np.int64)
+    if np.any(tenure <= 0) or np.any(tenure > MAX_TENURE_MONTHS):
+        raise ValueError(f"Tenure must be between 1 and {MAX_TENURE_MONTHS} months")
+    return principal, monthly_rate, tenure
+
+
+def monthly_payment(principal, annual_rate, tenure_months) -> np.ndarray:
+    """
+    Annuity EMI per loan, as in GENERATE_AMORTIZATION_SCHEDULE.
+
+    Args:
+        principal: Loan amounts
+        annual_rate: Annual interest rates as fractions (LOANS.INTEREST_RATE, e.g. 0.075)
+        tenure_months: Loan tenures in months
+
+    Returns:
+        float64 array of monthly payments (unrounded)
+    """
+    principal, r, n = _as_loan_arrays(principal, annual_rate, tenure_months)
+    growth = np.power(1 + r, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        emi = principal * r * growth / (growth - 1)
+    return np.where(r == 0, principal / n, emi)
+
+
+def project_loan_cash_flows(principal, annual_rate, tenure_months, horizon: int = None) -> LoanCashFlows:
+    """
+    Closed-form amortization of every loan over every month in one pass.
+
+    The closing balance after EMI k is P(1+r)^k - EMI((1+r)^k - 1)/r, so no
+    month-by-month loop is needed; months past a loan's tenure are zero.
+
+    Args:
+        principal: Loan amounts
+        annual_rate: Annual interest rates as fractions
+        tenure_months: Loan tenures in months (at most MAX_TENURE_MONTHS)
+        horizon: Months to project (defaults to the longest tenure)
+
+    Returns:
+        LoanCashFlows with loans x horizon matrices
+    """
+    principal, r, n = _as_loan_arrays(principal, annual_rate, tenure_months)
+    if horizon is None:
+        horizon = int(n.max()) if len(n) else 0
+    emi = monthly_payment(principal, annual_rate, tenure_months)
+
+    k = np.arange(0, horizon + 1, dtype=np.float64)[None, :]
+    rate = r[:, None]
+    growth = np.power(1 + rate, k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity_factor = np.where(rate == 0, k, (growth - 1) / rate)
+    balance = principal[:, None] * growth - emi[:, None] * annuity_factor
+    balance = np.where(k >= n[:, None], 0.0, np.maximum(balance, 0.0))
+
+    opening = balance[:, :-1]
+    closing = balance[:, 1:]
+    interest = opening * rate
+    principal_paid = opening - closing
+    return LoanCashFlows(principal=principal_paid, interest=interest, balance=closing)
+
+
+def project_pool_cash_flows(
+    principal,
+    annual_rate,
+    tenure_months,
+    horizon: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> PoolCashFlows:
+    """
+    Pool-level monthly principal, interest and balance, built chunk by chunk.
+
+    Only chunk_size x horizon matrices are materialized at a time, so pools of
+    hundreds of thousands of loans project in bounded memory.
+    """
+    principal, r, n = _as_loan_arrays(principal, annual_rate, tenure_months)
+    if horizon is None:
+        horizon = int(n.max()) if len(n) else 0
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    totals = {name: np.zeros(horizon) for name in ("principal", "interest", "balance")}
+    for start in range(0, len(principal), chunk_size):
+        stop = start + chunk_size
+        flows = project_loan_cash_flows(principal[start:stop], r[start:stop] * 12, n[start:stop], horizon)
+        totals["principal"] += flows.principal.sum(axis=0)
+        totals["interest"] += flows.interest.sum(axis=0)
+        totals["balance"] += flows.balance.sum(axis=0)
+
+    return PoolCashFlows(month=np.arange(1, horizon + 1), loan_count=len(principal), **totals)
+
+
+def load_pool_loans(session, pool_id: str, schema: str = "CORE") -> dict:
+    """Loan amount, rate and tenure columns for one pool from LOANS."""
+    parse_pool_id(pool_id)  # only well-formed pool IDs reach the query text
+    rows = session.sql(
+        f"SELECT AMOUNT, INTEREST_RATE, TENURE_MONTHS FROM {schema}.LOANS WHERE POOL_ID = '{pool_id}'"
+    ).collect()
+    return {
+        "principal": np.array([float(row["AMOUNT"]) for row in rows]),
+        "annual_rate": np.array([float(row["INTEREST_RATE"]) for row in rows]),
+        "tenure_months": np.array([int(row["TENURE_MONTHS"]) for row in rows], dtype=np.int64),
+    }
@@ -0,0 +1,97 @@
+import threading
+from datetime import date
+from typing import Iterable, Iterator, Mapping
+
+from src.securitization.pooling import DEFAULT_TRUSTEE, RMBSPool
+
+# Index 1-12 -> quarter; index 0 unused so months index directly
+QUARTER_BY_MONTH = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
+
+def parse_pool_id(pool_id: str) -> tuple[int, int]:
+    """Split an RMBS-{year}-Q{quarter} pool ID into (year, quarter)."""
+    prefix, year, quarter = pool_id.split("-")
+    if prefix != "RMBS" or not quarter.startswith("Q"):
+        raise ValueError(f"Not a quarterly RMBS pool ID: {pool_id}")
+    return int(year), int(quarter[1:])
+
+
+class PoolCatalog:
+    """
+    Interned RMBSPool per (year, quarter).
+
+    Dates resolve to pools through QUARTER_BY_MONTH and a dict lookup, so the
+    same pool object is returned for every loan in a quarter instead of a new
+    RMBSPool and two formatted strings per call. A pool first seen through
+    pool_for_date takes that date as its aggregation date, the same way
+    ASSIGN_LOANS_TO_POOLS inserts new RMBS_POOLS rows. The catalog is
+    thread-safe and meant to be shared across batch runs.
+
+    RMBS_POOLS rows whose POOL_ID is not RMBS-{year}-Q{quarter} (legacy or
+    manually created pools) never receive loans by date; they are kept in
+    other_pools instead of being rejected.
+    """
+
+    def __init__(self, trustee: str = DEFAULT_TRUSTEE):
+        self.trustee = trustee
+        self._pools: dict[tuple[int, int], RMBSPool] = {}
+        self.other_pools: dict[str, RMBSPool] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping], trustee: str = DEFAULT_TRUSTEE) -> "PoolCatalog":
+        """Seed from RMBS_POOLS rows (dicts or Snowpark Rows with POOL_ID, NAME, AGGREGATION_DATE, TRUSTEE)."""
+        catalog = cls(trustee)
+        for row in rows:
+            pool = RMBSPool(
+                pool_id=row["POOL_ID"],
+                name=row["NAME"],
+                aggregation_date=row["AGGREGATION_DATE"],
+                trustee=row["TRUSTEE"],
+            )
+            try:
+                key = parse_pool_id(pool.pool_id)
+            except ValueError:
+                catalog.other_pools[pool.pool_id] = pool
+                continue
+            catalog._pools[key] = pool
+        return catalog
+
+    @classmethod
+    def from_session(cls, session, trustee: str = DEFAULT_TRUSTEE, schema: str = "CORE") -> "PoolCatalog":
+        rows = session.sql(f"SELECT POOL_ID, NAME, AGGREGATION_DATE, TRUSTEE FROM {schema}.RMBS_POOLS").collect()
+        return cls.from_rows(rows, trustee)
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def __iter__(self) -> Iterator[RMBSPool]:
+        return iter(sorted(self._pools.values(), key=lambda pool: parse_pool_id(pool.pool_id)))
+
+    def __contains__(self, pool_id: str) -> bool:
+        try:
+            return parse_pool_id(pool_id) in self._pools
+        except ValueError:
+            return pool_id in self.other_pools
+
+    def pool(self, year: int, quarter: int, aggregation_date: date = None) -> RMBSPool:
+        key = (year, quarter)
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = RMBSPool(
+                    pool_id=f"RMBS-{year}-Q{quarter}",
+                    name=f"Housing Pool {year} Q{quarter}",
+                    aggregation_date=aggregation_date or date(year, quarter * 3 - 2, 1),
+                    trustee=self.trustee,
+                )
+            return pool
+
+    def pool_for_date(self, eligible_date: date) -> RMBSPool:
+        pool = self._pools.get((eligible_date.year, QUARTER_BY_MONTH[eligible_date.month]))
+        if pool is not None:
+            return pool
+        return self.pool(eligible_date.year, QUARTER_BY_MONTH[eligible_date.month], eligible_date)
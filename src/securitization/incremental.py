@@ -0,0 +1,164 @@
+import heapq
+import itertools
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from src.rules import eligibility
+from src.securitization.catalog import PoolCatalog
+from src.securitization.pooling import Loan, RMBSPool, calculate_pool_eligible_date
+
+# JOB_NAME of the watermark row shared with the ASSIGN_LOANS_TO_POOLS procedure
+WATERMARK_JOB = "ASSIGN_LOANS_TO_POOLS"
+# Pool eligible date of a loan row, derived from the disbursement date until the loan is pooled
+ELIGIBLE_DATE_SQL = "COALESCE(L.POOL_ELIGIBLE_DATE, DATEADD(MONTH, 6, L.DISBURSEMENT_DATE))"
+
+
+def load_watermark(session, schema: str = "CORE") -> tuple[Optional[date], Optional[datetime], datetime]:
+    """(watermark, last run start, warehouse time now) from POOL_ASSIGNMENT_WATERMARK."""
+    row = session.sql(
+        f"SELECT MAX(WATERMARK) AS WATERMARK, MAX(LAST_RUN_AT) AS LAST_RUN_AT, "
+        f"CURRENT_TIMESTAMP()::TIMESTAMP_NTZ AS NOW FROM {schema}.POOL_ASSIGNMENT_WATERMARK "
+        f"WHERE JOB_NAME = '{WATERMARK_JOB}'"
+    ).collect()[0]
+    return row["WATERMARK"], row["LAST_RUN_AT"], row["NOW"]
+
+
+def save_watermark(session, watermark: date, run_started_at: datetime, schema: str = "CORE"):
+    """Persist a completed run so the next run (Python or the SQL task) starts after it."""
+    session.sql(
+        f"MERGE INTO {schema}.POOL_ASSIGNMENT_WATERMARK W "
+        f"USING (SELECT '{WATERMARK_JOB}' AS JOB_NAME) S ON W.JOB_NAME = S.JOB_NAME "
+        f"WHEN MATCHED THEN UPDATE SET W.WATERMARK = '{watermark}', W.LAST_RUN_AT = '{run_started_at}', "
+        f"W.UPDATED_AT = CURRENT_TIMESTAMP() "
+        f"WHEN NOT MATCHED THEN INSERT (JOB_NAME, WATERMARK, LAST_RUN_AT) "
+        f"VALUES (S.JOB_NAME, '{watermark}', '{run_started_at}')"
+    ).collect()
+
+
+class IncrementalPoolAssigner:
+    """
+    Assigns loans to pools as they cross the MHP, without re-scanning unpooled loans.
+
+    Unpooled loans sit in a min-heap keyed by pool eligible date. Each run pops
+    only loans whose eligible date is on or before the run date, i.e. those that
+    crossed the MHP since the previous watermark (or arrived late with an
+    earlier eligible date), so a daily run costs O(k log n) for k assignments.
+    """
+
+    def __init__(self, catalog: PoolCatalog = None, watermark: date = None):
+        self.catalog = catalog if catalog is not None else PoolCatalog()
+        self.watermark = watermark
+        # Warehouse time the pending loans were read, persisted as LAST_RUN_AT by save_watermark
+        self.loaded_at: Optional[datetime] = None
+        self._heap: list[tuple[date, int, Loan]] = []
+        self._sequence = itertools.count()
+        # Sequence number of each pending loan's live heap entry; stale entries are skipped
+        self._live: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    @classmethod
+    def from_session(
+        cls, session, catalog: PoolCatalog = None, reference_date: date = None, schema: str = "CORE"
+    ) -> "IncrementalPoolAssigner":
+        """
+        Load the unpooled active loans that crossed the MHP since the persisted watermark.
+
+        Only loans whose eligible date falls after the stored watermark and on
+        or before reference_date are read, plus loans or borrowers updated
+        since the last run (approvals, back-dated loans, re-scored borrowers);
+        with no stored watermark every unpooled loan due by reference_date is
+        read. As in ASSIGN_LOANS_TO_POOLS, borrowers below the minimum credit
+        score are left out. Call save_watermark after
+        run() so the next run, here or in ASSIGN_LOANS_TO_POOLS, starts after it.
+        """
+        if reference_date is None:
+            reference_date = date.today()
+        watermark, last_run_at, now = load_watermark(session, schema)
+        if catalog is None:
+            catalog = PoolCatalog.from_session(session, schema=schema)
+        assigner = cls(catalog, watermark)
+        assigner.loaded_at = now
+
+        query = (
+            f"SELECT L.LOAN_ID, L.BORROWER_ID, L.AMOUNT, L.DISBURSEMENT_DATE, L.POOL_ELIGIBLE_DATE "
+            f"FROM {schema}.LOANS L JOIN {schema}.BORROWERS B ON L.BORROWER_ID = B.AADHAAR_ID "
+            f"WHERE L.POOL_ID IS NULL AND L.STATUS = 'ACTIVE' "
+            f"AND B.CREDIT_SCORE >= {eligibility.MIN_CREDIT_SCORE} AND {ELIGIBLE_DATE_SQL} <= '{reference_date}'"
+        )
+        if watermark is not None:
+            query += f" AND ({ELIGIBLE_DATE_SQL} > '{watermark}'"
+            if last_run_at is not None:
+                query += f" OR L.UPDATED_AT >= '{last_run_at}' OR B.UPDATED_AT >= '{last_run_at}'"
+            query += ")"
+        assigner.add_many(
+            Loan(
+                loan_id=row["LOAN_ID"],
+                borrower_id=row["BORROWER_ID"],
+                amount=float(row["AMOUNT"]),
+                disbursement_date=row["DISBURSEMENT_DATE"],
+                pool_eligible_date=row["POOL_ELIGIBLE_DATE"],
+            )
+            for row in session.sql(query).collect()
+        )
+        return assigner
+
+    def save_watermark(self, session, schema: str = "CORE"):
+        """Persist the watermark of the last run() to POOL_ASSIGNMENT_WATERMARK."""
+        if self.watermark is None:
+            raise ValueError("run() must complete before the watermark can be saved")
+        save_watermark(session, self.watermark, self.loaded_at or datetime.now(), schema)
+
+    def add(self, loan: Loan):
+        if loan.pool_id is not None:
+            return
+        if loan.pool_eligible_date is None:
+            loan.pool_eligible_date = calculate_pool_eligible_date(loan.disbursement_date)
+        sequence = next(self._sequence)
+        self._live[loan.loan_id] = sequence
+        heapq.heappush(self._heap, (loan.pool_eligible_date, sequence, loan))
+
+    def add_many(self, loans: Iterable[Loan]):
+        for loan in loans:
+            self.add(loan)
+
+    def remove(self, loan_id: str):
+        """Drop a pending loan (e.g. closed or cancelled); the heap entry is skipped lazily."""
+        self._live.pop(loan_id, None)
+
+    def next_eligible_date(self) -> Optional[date]:
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def run(self, reference_date: date = None) -> list[tuple[Loan, RMBSPool]]:
+        """
+        Assign every pending loan whose MHP has been met by reference_date.
+
+        Args:
+            reference_date: Run date (defaults to today); must not precede the watermark
+
+        Returns:
+            (loan, pool) pairs for the loans assigned in this run, in eligible-date order
+        """
+        if reference_date is None:
+            reference_date = date.today()
+        if self.watermark is not None and reference_date < self.watermark:
+            raise ValueError(f"Run date {reference_date} is before watermark {self.watermark}")
+
+        assigned = []
+        while self._heap and self._heap[0][0] <= reference_date:
+            eligible_date, sequence, loan = heapq.heappop(self._heap)
+            if self._live.get(loan.loan_id) != sequence:
+                continue
+            del self._live[loan.loan_id]
+            pool = self.catalog.pool_for_date(eligible_date)
+            loan.pool_id = pool.pool_id
+            assigned.append((loan, pool))
+
+        self.watermark = reference_date
+        return assigned
+
+    def _discard_stale(self):
+        while self._heap and self._live.get(self._heap[0][2].loan_id) != self._heap[0][1]:
+            heapq.heappop(self._heap)
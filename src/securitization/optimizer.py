@@ -0,0 +1,312 @@
+import heapq
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from src.rules import eligibility
+from src.securitization.batch import add_months
+from src.securitization.pooling import MHP_MONTHS
+
+# Lowest/highest-scoring loans considered per pool in each local-search swap
+SWAP_CANDIDATES = 64
+
+
+@dataclass
+class PoolConstraints:
+    """
+    Targets for constructed pools.
+
+    target_size: Outstanding amount each pool aims for
+    size_tolerance: Allowed relative deviation from target_size
+    max_borrower_share: Largest share of target_size one borrower may hold in a pool
+    min_avg_credit_score: Minimum amount-weighted average credit score per pool
+    """
+    target_size: float
+    size_tolerance: float = 0.05
+    max_borrower_share: float = 0.02
+    min_avg_credit_score: float = 770.0
+
+    @property
+    def min_size(self) -> float:
+        return self.target_size * (1 - self.size_tolerance)
+
+    @property
+    def max_size(self) -> float:
+        return self.target_size * (1 + self.size_tolerance)
+
+
+@dataclass
+class PlannedPool:
+    pool_number: int
+    loan_count: int
+    total_amount: float
+    avg_credit_score: float
+    max_borrower_share: float
+
+
+@dataclass
+class PoolPlan:
+    """pool_number per input loan (-1 where unassigned), per-pool summaries and constraint violations."""
+    pool_number: np.ndarray
+    pools: list[PlannedPool]
+    violations: list[str]
+    swaps: int
+
+    @property
+    def unassigned(self) -> np.ndarray:
+        return np.flatnonzero(self.pool_number < 0)
+
+
+def eligible_loan_mask(credit_score, disbursement_date, status, pool_id, reference_date: date = None) -> np.ndarray:
+    """The CORE.RMBS_ELIGIBLE_LOANS filter on loan columns: active, unpooled, MHP met, score >= MIN_CREDIT_SCORE."""
+    if reference_date is None:
+        reference_date = date.today()
+    mhp_met = add_months(disbursement_date, MHP_MONTHS) <= np.datetime64(reference_date, "D")
+    pool_id = np.asarray(pool_id, dtype=object)
+    return (
+        (np.asarray(status) == "ACTIVE")
+        & (np.asarray(credit_score) >= eligibility.MIN_CREDIT_SCORE)
+        & mhp_met
+        & np.equal(pool_id, None)
+    )
+
+
+class _PoolState:
+    """
+    Running pool totals. Borrower holdings are only tracked for borrowers whose
+    loans add up to more than the concentration limit, since nobody else can
+    ever breach it.
+    """
+    __slots__ = ("amount", "score_sum", "holdings", "risky_borrowers")
+
+    def __init__(self, n_pools: int, risky_borrowers: set):
+        self.amount = np.zeros(n_pools)
+        self.score_sum = np.zeros(n_pools)
+        self.holdings: dict[tuple[int, int], float] = {}
+        self.risky_borrowers = risky_borrowers
+
+    def holding(self, number: int, borrower: int) -> float:
+        return self.holdings.get((number, borrower), 0.0)
+
+    def move(self, index: int, source: int, target: int, amount, credit_score, borrower_code):
+        loan_amount = float(amount[index])
+        weighted_score = loan_amount * float(credit_score[index])
+        self.amount[source] -= loan_amount
+        self.score_sum[source] -= weighted_score
+        self.amount[target] += loan_amount
+        self.score_sum[target] += weighted_score
+        borrower = borrower_code[index]
+        if borrower in self.risky_borrowers:
+            self.holdings[(source, borrower)] = self.holding(source, borrower) - loan_amount
+            self.holdings[(target, borrower)] = self.holding(target, borrower) + loan_amount
+
+
+def _risky_borrowers(amount, borrower_code, limit: float) -> set:
+    totals = np.bincount(borrower_code, weights=amount)
+    return set(np.flatnonzero(totals > limit).tolist())
+
+
+def _greedy_pack(amount, credit_score, borrower_code, n_pools: int, constraints: PoolConstraints):
+    """Largest loan first into the least-filled pool that can take it (LPT packing on a min-heap)."""
+    borrower_limit = constraints.target_size * constraints.max_borrower_share
+    state = _PoolState(n_pools, _risky_borrowers(amount, borrower_code, borrower_limit))
+    risky = state.risky_borrowers
+    holdings = state.holdings
+    max_size = constraints.max_size
+
+    pool_number = np.full(len(amount), -1, dtype=np.int64)
+    heap = [(0.0, number) for number in range(n_pools)]
+    order = np.argsort(-amount, kind="stable")
+    amounts = amount[order].tolist()
+    borrowers = borrower_code[order].tolist()
+    assigned = [-1] * len(amounts)
+
+    for position, loan_amount in enumerate(amounts):
+        filled, number = heap[0]
+        if filled + loan_amount > max_size:
+            # Least-filled pool is too full for this loan, so every other pool is as well
+            continue
+        borrower = borrowers[position]
+        if borrower not in risky:
+            assigned[position] = number
+            heapq.heapreplace(heap, (filled + loan_amount, number))
+            continue
+        skipped = []
+        while heap:
+            filled, number = heapq.heappop(heap)
+            if filled + loan_amount > max_size:
+                skipped.append((filled, number))
+                break
+            key = (number, borrower)
+            if holdings.get(key, 0.0) + loan_amount > borrower_limit:
+                skipped.append((filled, number))
+                continue
+            holdings[key] = holdings.get(key, 0.0) + loan_amount
+            assigned[position] = number
+            heapq.heappush(heap, (filled + loan_amount, number))
+            break
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+
+    pool_number[order] = assigned
+    placed = pool_number >= 0
+    state.amount = np.bincount(pool_number[placed], weights=amount[placed], minlength=n_pools)
+    state.score_sum = np.bincount(pool_number[placed], weights=(amount * credit_score)[placed], minlength=n_pools)
+    return pool_number, state
+
+
+def _lowest(values: np.ndarray, k: int) -> np.ndarray:
+    if len(values) <= k:
+        return np.arange(len(values))
+    return np.argpartition(values, k)[:k]
+
+
+def _refine_scores(amount, credit_score, borrower_code, pool_number, state: _PoolState, constraints: PoolConstraints,
+                   max_iterations: int) -> int:
+    """
+    Local search: swap low-score loans out of pools below the score floor for
+    high-score loans of similar size from the pool with the largest surplus.
+    """
+    n_pools = len(state.amount)
+    order = np.argsort(pool_number, kind="stable")
+    bounds = np.searchsorted(pool_number[order], np.arange(n_pools + 1))
+    members = [order[bounds[n]:bounds[n + 1]].tolist() for n in range(n_pools)]
+    floor = constraints.min_avg_credit_score
+    borrower_limit = constraints.target_size * constraints.max_borrower_share
+    exhausted = np.zeros(n_pools, dtype=bool)
+    swaps = 0
+
+    for _ in range(max_iterations):
+        surplus = state.score_sum - floor * state.amount
+        candidates = np.where((surplus < 0) & ~exhausted, surplus, np.inf)
+        worst = int(np.argmin(candidates))
+        if not np.isfinite(candidates[worst]):
+            break
+        donor = int(np.argmax(surplus))
+        if surplus[donor] <= 0:
+            break
+
+        worst_loans = np.array(members[worst])
+        donor_loans = np.array(members[donor])
+        out = worst_loans[_lowest(credit_score[worst_loans], SWAP_CANDIDATES)]
+        into = donor_loans[_lowest(-credit_score[donor_loans], SWAP_CANDIDATES)]
+
+        delta = amount[into][None, :] - amount[out][:, None]
+        score_delta = (amount[into] * credit_score[into])[None, :] - (amount[out] * credit_score[out])[:, None]
+        worst_amount = state.amount[worst] + delta
+        donor_amount = state.amount[donor] - delta
+        worst_surplus = state.score_sum[worst] + score_delta - floor * worst_amount
+        donor_surplus = state.score_sum[donor] - score_delta - floor * donor_amount
+        feasible = (
+            (worst_amount >= constraints.min_size) & (worst_amount <= constraints.max_size)
+            & (donor_amount >= constraints.min_size) & (donor_amount <= constraints.max_size)
+            & (donor_surplus >= 0) & (worst_surplus > surplus[worst])
+        )
+        gain = np.where(feasible, worst_surplus, -np.inf)
+
+        swapped = False
+        for flat in np.argsort(-gain, axis=None)[:SWAP_CANDIDATES].tolist():
+            if not np.isfinite(gain.flat[flat]):
+                break
+            i, j = divmod(flat, len(into))
+            a, b = int(out[i]), int(into[j])
+            if (state.holding(donor, borrower_code[a]) + amount[a] > borrower_limit
+                    or state.holding(worst, borrower_code[b]) + amount[b] > borrower_limit):
+                continue
+            state.move(a, worst, donor, amount, credit_score, borrower_code)
+            state.move(b, donor, worst, amount, credit_score, borrower_code)
+            members[worst].remove(a)
+            members[donor].append(a)
+            members[donor].remove(b)
+            members[worst].append(b)
+            pool_number[a], pool_number[b] = donor, worst
+            swaps += 1
+            swapped = True
+            break
+        if not swapped:
+            exhausted[worst] = True
+
+    return swaps
+
+
+def _top_borrower_holding(amount, borrower_code, pool_number, n_pools: int) -> np.ndarray:
+    """Largest single-borrower amount in each pool."""
+    stride = int(borrower_code.max(initial=0)) + 1
+    pairs, pair_index = np.unique(pool_number * stride + borrower_code, return_inverse=True)
+    pair_totals = np.bincount(pair_index, weights=amount, minlength=len(pairs))
+    top = np.zeros(n_pools)
+    np.maximum.at(top, pairs // stride, pair_totals)
+    return top
+
+
+def build_pools(
+    amount,
+    credit_score,
+    borrower_id,
+    constraints: PoolConstraints,
+    n_pools: int = None,
+    max_iterations: int = 10_000,
+) -> PoolPlan:
+    """
+    Assign eligible loans to pools that meet size, concentration and score constraints.
+
+    Loans are packed largest first into the least-filled pool (a min-heap on
+    pool size), then a swap-based local search lifts pools below the score
+    floor. Loans that fit no pool stay unassigned; constraints still unmet after
+    refinement are reported in PoolPlan.violations rather than raised.
+
+    Args:
+        amount: Loan amounts (already filtered, e.g. with eligible_loan_mask)
+        credit_score: Borrower credit score per loan
+        borrower_id: Borrower per loan, for concentration limits
+        constraints: Pool size, concentration and score targets
+        n_pools: Number of pools (defaults to total amount // target_size)
+        max_iterations: Upper bound on local-search swaps
+
+    Returns:
+        PoolPlan
+    """
+    amount = np.asarray(amount, dtype=np.float64)
+    credit_score = np.asarray(credit_score, dtype=np.float64)
+    # Borrowers are handled as dense integer codes from here on
+    _, borrower_code = np.unique(np.asarray(borrower_id).astype(str), return_inverse=True)
+    if n_pools is None:
+        n_pools = max(1, int(amount.sum() // constraints.target_size))
+
+    pool_number, state = _greedy_pack(amount, credit_score, borrower_code, n_pools, constraints)
+    swaps = _refine_scores(amount, credit_score, borrower_code, pool_number, state, constraints, max_iterations)
+
+    placed = pool_number >= 0
+    loan_count = np.bincount(pool_number[placed], minlength=n_pools)
+    top_holding = _top_borrower_holding(amount[placed], borrower_code[placed], pool_number[placed], n_pools)
+    pools, violations = [], []
+    for number in range(n_pools):
+        total = float(state.amount[number])
+        avg_score = float(state.score_sum[number] / total) if total else 0.0
+        pools.append(PlannedPool(
+            pool_number=number,
+            loan_count=int(loan_count[number]),
+            total_amount=total,
+            avg_credit_score=avg_score,
+            max_borrower_share=float(top_holding[number]) / constraints.target_size,
+        ))
+        if not constraints.min_size <= total <= constraints.max_size:
+            violations.append(f"Pool {number} size {total:,.0f} outside target range")
+        if avg_score < constraints.min_avg_credit_score:
+            violations.append(f"Pool {number} average credit score {avg_score:.1f} below {constraints.min_avg_credit_score}")
+
+    return PoolPlan(pool_number=pool_number, pools=pools, violations=violations, swaps=swaps)
+
+
+def load_eligible_loans(session) -> dict:
+    """Loan columns from CORE.RMBS_ELIGIBLE_LOANS, the optimizer's input set."""
+    rows = session.sql(
+        "SELECT LOAN_ID, BORROWER_ID, AMOUNT, CREDIT_SCORE FROM CORE.RMBS_ELIGIBLE_LOANS"
+    ).collect()
+    return {
+        "loan_id": np.array([row["LOAN_ID"] for row in rows], dtype=object),
+        "borrower_id": np.array([row["BORROWER_ID"] for row in rows], dtype=object),
+        "amount": np.array([float(row["AMOUNT"]) for row in rows]),
+        "credit_score": np.array([int(row["CREDIT_SCORE"]) for row in rows], dtype=np.int64),
+    }
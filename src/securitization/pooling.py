@@ -4,6 +4,7 @@ from dateutil.relativedelta import relativedelta
 from typing import Optional
 
 MHP_MONTHS = 6
+DEFAULT_TRUSTEE = "India Housing Trust"
 
 
 @dataclass
@@ -14,6 +15,8 @@ class Loan:
     disbursement_date: date
     pool_id: Optional[str] = None
     pool_eligible_date: Optional[date] = None
+    interest_rate: Optional[float] = None
+    tenure_months: Optional[int] = None
 
 
 @dataclass
@@ -24,7 +27,7 @@ class RMBSPool:
     trustee: str
 
 
-def assign_rmbs_pool(loan: Loan, reference_date: date = None) -> tuple[Loan, Optional[str]]:
+def assign_rmbs_pool(loan: Loan, reference_date: date = None, catalog=None) -> tuple[Loan, Optional[str]]:
     if reference_date is None:
         reference_date = date.today()
     
@@ -33,7 +36,7 @@ def assign_rmbs_pool(loan: Loan, reference_date: date = None) -> tuple[Loan, Opt
     
     # Check if MHP has been met
     if reference_date >= eligible_date:
-        pool = get_pool_for_date(eligible_date)
+        pool = catalog.pool_for_date(eligible_date) if catalog is not None else get_pool_for_date(eligible_date)
         loan.pool_id = pool.pool_id
         return loan, pool.name
     
@@ -53,5 +56,5 @@ def get_pool_for_date(eligible_date: date) -> RMBSPool:
         pool_id=pool_id,
         name=f"Housing Pool {eligible_date.year} Q{quarter}",
         aggregation_date=eligible_date,
-        trustee="India Housing Trust",
+        trustee=DEFAULT_TRUSTEE,
     )
@@ -0,0 +1,198 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.securitization.cashflows import PoolCashFlows, load_pool_loans, project_pool_cash_flows
+
+DEFAULT_BLOCK_SIZE = 1_000
+
+
+@dataclass
+class ScenarioAssumptions:
+    """Base annual CPR/CDR and the annualized volatility of their log paths."""
+    base_cpr: float = 0.08
+    base_cdr: float = 0.01
+    cpr_volatility: float = 0.30
+    cdr_volatility: float = 0.50
+    loss_severity: float = 0.35
+
+
+@dataclass
+class SimulationResult:
+    """Per-path pool outcomes; every array has one entry per simulated path."""
+    losses: np.ndarray
+    wal_years: np.ndarray
+    interest: np.ndarray
+    principal_collected: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.losses)
+
+    def summary(self, percentiles=(5, 50, 95)) -> dict:
+        """Mean and percentiles of each metric, keyed by metric name."""
+        summary = {}
+        for name in ("losses", "wal_years", "interest", "principal_collected"):
+            values = getattr(self, name)
+            summary[name] = {"mean": float(values.mean()),
+                             **{f"p{q}": float(np.percentile(values, q)) for q in percentiles}}
+        return summary
+
+
+def simulate_rate_paths(rng: np.random.Generator, n_paths: int, months: int, base: float, volatility: float) -> np.ndarray:
+    """
+    Annual rate paths as a mean-preserving lognormal random walk around base.
+
+    Returns:
+        (n_paths, months) array of annual rates clipped to [0, 0.99]
+    """
+    if base <= 0:
+        return np.zeros((n_paths, months))
+    t = np.arange(1, months + 1) / 12
+    shocks = rng.standard_normal((n_paths, months)) * volatility * np.sqrt(1 / 12)
+    log_rates = np.log(base) + np.cumsum(shocks, axis=1) - 0.5 * volatility ** 2 * t
+    return np.clip(np.exp(log_rates), 0.0, 0.99)
+
+
+def _monthly_rate(annual_rate: np.ndarray) -> np.ndarray:
+    return 1 - (1 - annual_rate) ** (1 / 12)
+
+
+@dataclass
+class PathCashFlows:
+    """Monthly pool collections per path, each shaped (paths, months); principal includes recoveries."""
+    principal: np.ndarray
+    interest: np.ndarray
+    losses: np.ndarray
+
+
+def simulate_path_cash_flows(
+    schedule: PoolCashFlows,
+    n_paths: int,
+    rng: np.random.Generator,
+    assumptions: ScenarioAssumptions = None,
+) -> PathCashFlows:
+    """
+    Apply simulated prepayment and default paths to a pool's scheduled cash flows.
+
+    Prepayments and defaults remove balance pro rata, so the surviving share of
+    the pool is a running product over months and every path is evaluated with
+    whole-array operations. Within a month defaults are taken first (they pay no
+    interest), then scheduled principal, then prepayment of the remaining balance.
+    """
+    if assumptions is None:
+        assumptions = ScenarioAssumptions()
+    months = len(schedule.month)
+    smm = _monthly_rate(simulate_rate_paths(rng, n_paths, months, assumptions.base_cpr, assumptions.cpr_volatility))
+    mdr = _monthly_rate(simulate_rate_paths(rng, n_paths, months, assumptions.base_cdr, assumptions.cdr_volatility))
+
+    closing = schedule.balance[None, :]
+    opening = closing + schedule.principal[None, :]
+
+    surviving = np.cumprod((1 - mdr) * (1 - smm), axis=1)
+    surviving_at_open = np.hstack([np.ones((n_paths, 1)), surviving[:, :-1]])
+    surviving_after_default = surviving_at_open * (1 - mdr)
+
+    defaulted = surviving_at_open * mdr * opening
+    scheduled_principal = surviving_after_default * schedule.principal[None, :]
+    prepaid = surviving_after_default * smm * closing
+    losses = defaulted * assumptions.loss_severity
+
+    return PathCashFlows(
+        principal=scheduled_principal + prepaid + defaulted - losses,
+        interest=surviving_after_default * schedule.interest[None, :],
+        losses=losses,
+    )
+
+
+def simulate_paths(
+    schedule: PoolCashFlows,
+    n_paths: int,
+    rng: np.random.Generator,
+    assumptions: ScenarioAssumptions = None,
+) -> SimulationResult:
+    """Per-path totals and WAL of simulate_path_cash_flows."""
+    flows = simulate_path_cash_flows(schedule, n_paths, rng, assumptions)
+    balance_reduction = flows.principal + flows.losses
+    total_reduction = balance_reduction.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wal_years = (balance_reduction @ schedule.month.astype(np.float64)) / total_reduction / 12
+
+    return SimulationResult(
+        losses=flows.losses.sum(axis=1),
+        wal_years=np.nan_to_num(wal_years),
+        interest=flows.interest.sum(axis=1),
+        principal_collected=flows.principal.sum(axis=1),
+    )
+
+
+def _simulate_block(schedule: PoolCashFlows, n_paths: int, seed: np.random.SeedSequence,
+                    assumptions: ScenarioAssumptions) -> SimulationResult:
+    return simulate_paths(schedule, n_paths, np.random.default_rng(seed), assumptions)
+
+
+def run_monte_carlo(
+    schedule: PoolCashFlows,
+    n_paths: int,
+    seed: int = 0,
+    assumptions: ScenarioAssumptions = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_workers: int = None,
+    executor: Executor = None,
+) -> SimulationResult:
+    """
+    Simulate n_paths CPR/CDR scenarios across worker processes.
+
+    Paths are split into blocks of block_size, each with its own child of
+    SeedSequence(seed), so results depend only on seed and block_size and not
+    on how many workers ran them or in which order they finished.
+
+    Args:
+        schedule: Scheduled pool cash flows (see project_pool_cash_flows)
+        n_paths: Number of scenario paths
+        seed: Root seed
+        assumptions: CPR/CDR and severity assumptions (defaults to ScenarioAssumptions())
+        block_size: Paths per worker task
+        max_workers: Worker processes when no executor is given (defaults to CPU count)
+        executor: Optional executor to reuse instead of a fresh ProcessPoolExecutor
+
+    Returns:
+        SimulationResult with one entry per path, in block order
+    """
+    if assumptions is None:
+        assumptions = ScenarioAssumptions()
+    if n_paths <= 0 or block_size <= 0:
+        raise ValueError("n_paths and block_size must be positive")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    sizes = [min(block_size, n_paths - start) for start in range(0, n_paths, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(_simulate_block, schedule, size, block_seed, assumptions)
+                   for size, block_seed in zip(sizes, seeds)]
+        blocks = [future.result() for future in futures]
+    finally:
+        if owns_executor:
+            executor.shutdown()
+
+    return SimulationResult(
+        losses=np.concatenate([block.losses for block in blocks]),
+        wal_years=np.concatenate([block.wal_years for block in blocks]),
+        interest=np.concatenate([block.interest for block in blocks]),
+        principal_collected=np.concatenate([block.principal_collected for block in blocks]),
+    )
+
+
+def simulate_pool(
+    session, pool_id: str, n_paths: int, seed: int = 0, schema: str = "CORE", **kwargs
+) -> SimulationResult:
+    """Run the Monte Carlo simulation for one pool's loans in LOANS."""
+    loans = load_pool_loans(session, pool_id, schema=schema)
+    schedule = project_pool_cash_flows(loans["principal"], loans["annual_rate"], loans["tenure_months"])
+    return run_monte_carlo(schedule, n_paths, seed, **kwargs)
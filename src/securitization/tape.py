@@ -0,0 +1,262 @@
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+from src.securitization.batch import assign_rmbs_pools
+from src.securitization.catalog import parse_pool_id
+from src.securitization.pooling import Loan
+
+DEFAULT_CHUNK_SIZE = 100_000
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+# Column name -> numpy dtype of the tape; strings stay object arrays until Arrow encodes them
+TAPE_COLUMNS = {
+    "loan_id": object,
+    "borrower_id": object,
+    "pool_id": object,
+    "amount": np.float64,
+    "interest_rate": np.float64,
+    "tenure_months": np.int32,
+    "disbursement_date": "datetime64[D]",
+    "pool_eligible_date": "datetime64[D]",
+}
+# Integer columns with no in-band null; chunks carry "<name>_valid" boolean masks beside them
+# (a missing mask means every row is valid), since 0 is a real value, not a sentinel
+MASKED_COLUMNS = ("tenure_months",)
+
+
+@dataclass
+class TapeStats:
+    chunks: int = 0
+    rows: int = 0
+
+
+def _tape_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("loan_id", pa.string()),
+        ("borrower_id", pa.string()),
+        ("pool_id", pa.string()),
+        ("amount", pa.float64()),
+        ("interest_rate", pa.float64()),
+        ("tenure_months", pa.int32()),
+        ("disbursement_date", pa.date32()),
+        ("pool_eligible_date", pa.date32()),
+    ])
+
+
+def loan_chunks(loans: Iterable[Loan], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """Group Loan records into column chunks without building a DataFrame."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    buffer: list[Loan] = []
+    for loan in loans:
+        buffer.append(loan)
+        if len(buffer) == chunk_size:
+            yield _loan_columns(buffer)
+            buffer = []
+    if buffer:
+        yield _loan_columns(buffer)
+
+
+def _loan_columns(loans: list[Loan]) -> dict:
+    return {
+        "loan_id": np.array([loan.loan_id for loan in loans], dtype=object),
+        "borrower_id": np.array([loan.borrower_id for loan in loans], dtype=object),
+        "pool_id": np.array([loan.pool_id for loan in loans], dtype=object),
+        "amount": np.array([loan.amount for loan in loans], dtype=np.float64),
+        "interest_rate": np.array([np.nan if loan.interest_rate is None else loan.interest_rate for loan in loans]),
+        "tenure_months": np.array([loan.tenure_months or 0 for loan in loans], dtype=np.int32),
+        "tenure_months_valid": np.array([loan.tenure_months is not None for loan in loans], dtype=bool),
+        "disbursement_date": np.array([loan.disbursement_date for loan in loans], dtype="datetime64[D]"),
+        "pool_eligible_date": np.array(
+            [loan.pool_eligible_date or np.datetime64("NaT") for loan in loans], dtype="datetime64[D]"
+        ),
+    }
+
+
+def assign_pool_chunks(chunks: Iterable, reference_date: date = None, include_unassigned: bool = False) -> Iterator[dict]:
+    """
+    Run assign_rmbs_pools over each chunk of loan columns and yield tape chunks.
+
+    Each chunk needs loan_id, borrower_id, amount and disbursement_date;
+    interest_rate and tenure_months (with tenure_months_valid, if given) are
+    carried through when present. Loans that have not met the MHP are
+    dropped unless include_unassigned is set.
+    """
+    if reference_date is None:
+        reference_date = date.today()
+    for chunk in chunks:
+        disbursement_date = np.asarray(chunk["disbursement_date"], dtype="datetime64[D]")
+        assignment = assign_rmbs_pools(disbursement_date, reference_date)
+        rows = len(disbursement_date)
+        columns = {
+            "loan_id": np.asarray(chunk["loan_id"], dtype=object),
+            "borrower_id": np.asarray(chunk["borrower_id"], dtype=object),
+            "pool_id": assignment.pool_id,
+            "amount": np.asarray(chunk["amount"], dtype=np.float64),
+            "interest_rate": np.asarray(chunk["interest_rate"], dtype=np.float64)
+            if "interest_rate" in chunk else np.full(rows, np.nan),
+            "tenure_months": np.asarray(chunk["tenure_months"], dtype=np.int32)
+            if "tenure_months" in chunk else np.zeros(rows, dtype=np.int32),
+            "tenure_months_valid": _validity(chunk, "tenure_months", rows),
+            "disbursement_date": disbursement_date,
+            "pool_eligible_date": assignment.eligible_date,
+        }
+        if not include_unassigned:
+            columns = {name: values[assignment.assigned] for name, values in columns.items()}
+        yield columns
+
+
+def _validity(chunk: dict, name: str, rows: int) -> np.ndarray:
+    """The chunk's validity mask for a MASKED_COLUMNS column; absent columns are all null."""
+    if name not in chunk:
+        return np.zeros(rows, dtype=bool)
+    valid = chunk.get(f"{name}_valid")
+    return np.ones(rows, dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+
+
+class LoanTapeWriter:
+    """
+    Streams tape chunks to one Arrow IPC (.arrow) or Parquet (.parquet) file.
+
+    Arrow IPC files can be reopened memory-mapped with zero copies; Parquet is
+    compressed and is the format to hand to trustees and rating agencies.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        import pyarrow as pa
+
+        self.path = Path(path)
+        self.schema = _tape_schema()
+        self.stats = TapeStats()
+        if self.path.suffix.lower() in PARQUET_SUFFIXES:
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.path, self.schema)
+            self._sink = None
+        else:
+            self._sink = pa.OSFile(str(self.path), "wb")
+            self._writer = pa.ipc.new_file(self._sink, self.schema)
+
+    def __enter__(self) -> "LoanTapeWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write_chunk(self, columns: dict) -> None:
+        import pyarrow as pa
+
+        arrays = []
+        for field in self.schema:
+            values = np.asarray(columns[field.name], dtype=TAPE_COLUMNS[field.name])
+            mask = None
+            if field.name == "interest_rate":
+                mask = np.isnan(values)
+            elif field.name == "pool_eligible_date":
+                mask = np.isnat(values)
+            elif field.name in MASKED_COLUMNS:
+                valid = columns.get(f"{field.name}_valid")
+                mask = None if valid is None else ~np.asarray(valid, dtype=bool)
+            arrays.append(pa.array(values, type=field.type, mask=mask, from_pandas=True))
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        self._writer.write_batch(batch)
+        self.stats.chunks += 1
+        self.stats.rows += batch.num_rows
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+
+def write_loan_tape(path: Union[str, Path], chunks: Iterable[dict]) -> TapeStats:
+    """Write already-assigned tape chunks (e.g. from loan_chunks) to path."""
+    with LoanTapeWriter(path) as writer:
+        for chunk in chunks:
+            writer.write_chunk(chunk)
+    return writer.stats
+
+
+def write_pool_tape(
+    path: Union[str, Path],
+    chunks: Iterable[dict],
+    reference_date: date = None,
+    include_unassigned: bool = False,
+) -> TapeStats:
+    """
+    Assign pools chunk by chunk and stream the result straight to a tape.
+
+    Only one chunk of loans is in memory at a time, so multi-million-row pools
+    are written without materializing Loan objects or DataFrames.
+    """
+    return write_loan_tape(path, assign_pool_chunks(chunks, reference_date, include_unassigned))
+
+
+def open_loan_tape(path: Union[str, Path]):
+    """
+    Open a tape as a pyarrow Table.
+
+    Arrow IPC tapes are memory-mapped, so columns are views over the page
+    cache and nothing is copied until a column is touched. Parquet tapes are
+    decoded through a memory map.
+    """
+    import pyarrow as pa
+
+    path = Path(path)
+    if path.suffix.lower() in PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+        return pq.read_table(path, memory_map=True)
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def tape_column(table, name: str) -> np.ndarray:
+    """One tape column as NumPy; numeric columns without nulls in a single chunk are zero-copy views."""
+    column = table.column(name)
+    if column.num_chunks == 1:
+        return column.chunk(0).to_numpy(zero_copy_only=False)
+    return column.to_numpy()
+
+
+def _arrow_columns(table) -> dict:
+    """Tape chunk columns from one Arrow batch of CORE.LOANS, nulls kept as NaN, NaT or validity masks."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = {}
+    for name in table.column_names:
+        key = name.lower()
+        column = table.column(name)
+        if key in MASKED_COLUMNS:
+            columns[f"{key}_valid"] = column.is_valid().to_numpy()
+            column = pc.cast(column.fill_null(0), pa.int32())
+        elif key in ("amount", "interest_rate"):
+            # NUMBER(p, s) arrives as decimal128; nulls become NaN in the float column
+            column = pc.cast(column, pa.float64())
+        columns[key] = np.asarray(column.to_numpy(), dtype=TAPE_COLUMNS.get(key, object))
+    return columns
+
+
+def session_loan_chunks(session, pool_id: str = None) -> Iterator[dict]:
+    """
+    Stream loan columns from CORE.LOANS (one pool, or all loans) in the
+    warehouse's own result batches, fetched as Arrow through the connector
+    rather than converted to pandas first.
+    """
+    query = (
+        "SELECT LOAN_ID, BORROWER_ID, POOL_ID, AMOUNT, INTEREST_RATE, TENURE_MONTHS, "
+        "DISBURSEMENT_DATE, POOL_ELIGIBLE_DATE FROM CORE.LOANS"
+    )
+    if pool_id is not None:
+        parse_pool_id(pool_id)
+        query += f" WHERE POOL_ID = '{pool_id}'"
+    cursor = session.connection.cursor()
+    try:
+        cursor.execute(query)
+        for table in cursor.fetch_arrow_batches():
+            yield _arrow_columns(table)
+    finally:
+        cursor.close()
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Tranche:
+    """A note class; lower priority numbers are paid first and absorb losses last."""
+    name: str
+    balance: float
+    coupon: float
+    priority: int
+
+
+@dataclass
+class WaterfallResult:
+    """
+    Tranche cash flows shaped (tranches, paths, periods), tranches in priority order.
+
+    residual holds what is left after every tranche is paid (excess interest and
+    principal beyond the notes, i.e. overcollateralization release), per path and period.
+    """
+    tranches: list[Tranche]
+    interest_paid: np.ndarray
+    interest_shortfall: np.ndarray
+    principal_paid: np.ndarray
+    writedown: np.ndarray
+    balance: np.ndarray
+    credit_enhancement: np.ndarray
+    residual: np.ndarray
+
+    def index(self, name: str) -> int:
+        for position, tranche in enumerate(self.tranches):
+            if tranche.name == name:
+                return position
+        raise KeyError(name)
+
+    def loss_rate(self) -> np.ndarray:
+        """Written-down share of each tranche's original balance, shaped (tranches, paths)."""
+        original = np.array([tranche.balance for tranche in self.tranches])[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.nan_to_num(self.writedown.sum(axis=2) / original)
+
+
+def tranches_from_enhancement(
+    pool_balance: float,
+    senior_enhancement: float = 0.10,
+    mezzanine_enhancement: float = 0.04,
+    senior_coupon: float = 0.070,
+    mezzanine_coupon: float = 0.095,
+) -> list[Tranche]:
+    """
+    Senior/mezzanine/equity structure sized by credit enhancement.
+
+    Each enhancement is the share of the pool subordinate to that tranche, so
+    with the defaults the senior note is 90% of the pool, mezzanine 6% and
+    equity (no coupon, paid from the residual) the bottom 4%.
+    """
+    if not 0 <= mezzanine_enhancement <= senior_enhancement <= 1:
+        raise ValueError("Credit enhancement must satisfy 0 <= mezzanine <= senior <= 1")
+    return [
+        Tranche("SENIOR", pool_balance * (1 - senior_enhancement), senior_coupon, 1),
+        Tranche("MEZZANINE", pool_balance * (senior_enhancement - mezzanine_enhancement), mezzanine_coupon, 2),
+        Tranche("EQUITY", pool_balance * mezzanine_enhancement, 0.0, 3),
+    ]
+
+
+def run_waterfall(
+    tranches: list[Tranche],
+    principal,
+    interest,
+    losses,
+    pool_balance: float = None,
+) -> WaterfallResult:
+    """
+    Distribute pool collections to tranches for every path and period at once.
+
+    Principal is paid sequentially by priority and losses are written down in
+    reverse priority, after any overcollateralization (pool_balance above the
+    sum of tranche balances). Both depend only on cumulative collections, so
+    each tranche's balance path is a clip of a running sum, with no loop over
+    periods. Interest collections then pay each tranche's coupon on its opening
+    balance in priority order; unpaid coupon is reported as a shortfall.
+
+    Args:
+        tranches: Tranche definitions, in any order
+        principal: Principal collected (including recoveries), shaped (periods,) or (paths, periods)
+        interest: Interest collected, same shape
+        losses: Realized losses, same shape
+        pool_balance: Opening pool balance (defaults to the sum of tranche balances)
+
+    Returns:
+        WaterfallResult
+    """
+    tranches = sorted(tranches, key=lambda tranche: tranche.priority)
+    principal, interest, losses = (np.atleast_2d(np.asarray(a, dtype=np.float64)) for a in (principal, interest, losses))
+    original = np.array([tranche.balance for tranche in tranches])[:, None, None]
+    coupon = np.array([tranche.coupon for tranche in tranches])[:, None, None]
+    note_total = float(original.sum())
+    if pool_balance is None:
+        pool_balance = note_total
+    overcollateralization = pool_balance - note_total
+    if overcollateralization < 0:
+        raise ValueError("Tranche balances exceed the pool balance")
+
+    # Notes senior to each tranche (principal attaches after them) and junior to it (losses hit those first)
+    senior = np.cumsum(original, axis=0) - original
+    junior = note_total - senior - original + overcollateralization
+
+    cumulative_principal = np.cumsum(principal, axis=-1)
+    cumulative_losses = np.cumsum(losses, axis=-1)
+    paid_to_date = np.clip(cumulative_principal[None] - senior, 0, original)
+    written_to_date = np.clip(cumulative_losses[None] - junior, 0, original)
+    balance = original - paid_to_date - written_to_date
+    opening = np.concatenate([np.broadcast_to(original, balance.shape[:2] + (1,)), balance[..., :-1]], axis=-1)
+
+    principal_paid = np.diff(paid_to_date, axis=-1, prepend=0)
+    writedown = np.diff(written_to_date, axis=-1, prepend=0)
+
+    interest_due = opening * coupon / 12
+    due_before = np.cumsum(interest_due, axis=0) - interest_due
+    interest_paid = np.clip(interest[None] - due_before, 0, interest_due)
+
+    residual = interest - interest_paid.sum(axis=0) + principal - principal_paid.sum(axis=0)
+
+    pool_outstanding = pool_balance - cumulative_principal - cumulative_losses
+    subordinate = pool_outstanding[None] - np.cumsum(balance, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        credit_enhancement = np.where(pool_outstanding[None] > 0, subordinate / pool_outstanding[None], 0.0)
+
+    return WaterfallResult(
+        tranches=tranches,
+        interest_paid=interest_paid,
+        interest_shortfall=interest_due - interest_paid,
+        principal_paid=principal_paid,
+        writedown=writedown,
+        balance=balance,
+        credit_enhancement=credit_enhancement,
+        residual=residual,
+    )
@@ -2,6 +2,14 @@ import streamlit as st
 from snowflake.snowpark.context import get_active_session
 import pandas as pd
 import json
+from dataclasses import asdict
+
+from src.kyc.cache import KYC_RESULT_CACHE
+from src.marketplace.emi import calculate_emi
+from src.rules.cache import ELIGIBILITY_CERTIFICATE_CACHE
+from src.rules.eligibility import Borrower
+from src.securitization.aggregates import PoolAggregates
+from src.securitization.analytics import POOL_ANALYTICS_CACHE
 
 # Database configuration
 DB_SCHEMA = "HOUSING_PLATFORM.CORE"
@@ -42,7 +50,7 @@ def ekyc_verification_page():
     st.header("eKYC Verification")
     st.markdown("Verify your identity using Aadhaar and fetch documents from DigiLocker")
     
-    aadhaar_id = st.text_input("Enter Aadhaar Number", max_chars=12, placeholder="123456789012")
+    aadhaar_id = st.text_input("Enter Aadhaar Number", max_chars=12, placeholder="123456789010")
     
     col1, col2 = st.columns(2)
     
@@ -54,70 +62,63 @@ def ekyc_verification_page():
     if verify_clicked and aadhaar_id:
         with st.spinner("Verifying with UIDAI..."):
             try:
-                result = session.sql(f"CALL {DB_SCHEMA}.VERIFY_AADHAAR('{aadhaar_id}')").collect()[0][0]
-                import json
-                data = json.loads(result) if isinstance(result, str) else result
+                verification = KYC_RESULT_CACHE.validate_aadhaar(session, aadhaar_id)
                 
-                if data.get("success"):
+                if verification.is_valid:
                     st.success("Aadhaar Verified Successfully")
                     
                     col1, col2, col3 = st.columns(3)
-                    col1.metric("Name", data.get("name", "N/A"))
-                    col2.metric("Date of Birth", str(data.get("date_of_birth", "N/A")))
-                    col3.metric("Gender", data.get("gender", "N/A"))
+                    col1.metric("Name", verification.name or "N/A")
+                    col2.metric("Date of Birth", verification.date_of_birth or "N/A")
+                    col3.metric("Gender", verification.gender or "N/A")
                     
                     # Store in session state for later use
-                    st.session_state["verified_aadhaar"] = data
+                    st.session_state["verified_aadhaar"] = asdict(verification)
                 else:
-                    st.error(f"Verification Failed: {data.get('error_message')}")
+                    st.error(f"Verification Failed: {verification.error_message}")
             except Exception as e:
                 st.error(f"Error: {e}")
     
     if full_kyc_clicked and aadhaar_id:
         with st.spinner("Performing complete KYC check..."):
             try:
-                result = session.sql(f"CALL {DB_SCHEMA}.PERFORM_KYC_CHECK('{aadhaar_id}')").collect()[0][0]
-                import json
-                data = json.loads(result) if isinstance(result, str) else result
+                kyc = KYC_RESULT_CACHE.perform_kyc_check(session, aadhaar_id)
                 
-                kyc_status = data.get("kyc_status")
-                
-                if kyc_status == "PASSED":
+                if kyc.kyc_status == "PASSED":
                     st.success("KYC Verification Passed")
-                elif kyc_status == "INCOMPLETE":
+                elif kyc.kyc_status == "INCOMPLETE":
                     st.warning("KYC Incomplete - Missing Documents")
                 else:
-                    st.error(f"KYC Failed: {data.get('error')}")
+                    st.error(f"KYC Failed: {kyc.error_message}")
                     return
                 
+                docs = KYC_RESULT_CACHE.fetch_digilocker_documents(session, aadhaar_id)
+                
                 # Display KYC results
                 st.subheader("KYC Summary")
                 
                 col1, col2 = st.columns(2)
                 with col1:
                     st.markdown("**Identity Verification**")
-                    st.write(f"- Name: {data.get('holder_name', 'N/A')}")
-                    st.write(f"- Date of Birth: {data.get('date_of_birth', 'N/A')}")
-                    st.write(f"- Aadhaar Verified: {'Yes' if data.get('aadhaar_verified') else 'No'}")
+                    st.write(f"- Name: {kyc.holder_name or 'N/A'}")
+                    st.write(f"- Date of Birth: {kyc.date_of_birth or 'N/A'}")
+                    st.write(f"- Aadhaar Verified: {'Yes' if kyc.aadhaar_verified else 'No'}")
                 
                 with col2:
                     st.markdown("**Document Status**")
-                    st.write(f"- PAN Card: {'Available' if data.get('has_pan') else 'Missing'}")
-                    st.write(f"- Income Proof: {'Available' if data.get('has_income_proof') else 'Missing'}")
-                    st.write(f"- Documents Found: {data.get('documents_found', 0)}")
+                    st.write(f"- PAN Card: {'Available' if kyc.has_pan else 'Missing'}")
+                    st.write(f"- Income Proof: {'Available' if kyc.has_income_proof else 'Missing'}")
+                    st.write(f"- Documents Found: {len(docs.documents)}")
                 
-                if data.get("missing_documents"):
+                if kyc.missing_documents:
                     st.warning("Missing Documents:")
-                    for doc in data["missing_documents"]:
+                    for doc in kyc.missing_documents:
                         st.write(f"  - {doc}")
                 
-                # Fetch and display DigiLocker documents
+                # Display DigiLocker documents
                 st.subheader("DigiLocker Documents")
-                docs_result = session.sql(f"CALL {DB_SCHEMA}.FETCH_DIGILOCKER_DOCUMENTS('{aadhaar_id}', NULL)").collect()[0][0]
-                docs_data = json.loads(docs_result) if isinstance(docs_result, str) else docs_result
-                
-                if docs_data.get("documents"):
-                    docs_df = pd.DataFrame(docs_data["documents"])
+                if docs.documents:
+                    docs_df = pd.DataFrame([asdict(doc) for doc in docs.documents])
                     docs_df = docs_df[["doc_type", "doc_number", "issuer", "status"]]
                     docs_df.columns = ["Document Type", "Number", "Issuer", "Status"]
                     st.dataframe(docs_df, use_container_width=True)
@@ -125,7 +126,7 @@ def ekyc_verification_page():
                     st.info("No documents found in DigiLocker")
                 
                 # Store KYC result in session
-                st.session_state["kyc_result"] = data
+                st.session_state["kyc_result"] = asdict(kyc)
                 
             except Exception as e:
                 st.error(f"Error: {e}")
@@ -135,10 +136,10 @@ def ekyc_verification_page():
         st.markdown("""
         | Aadhaar | Name | Has PAN | Has Income Proof |
         |---------|------|---------|------------------|
-        | 123456789012 | Priya Sharma | Yes | Yes (Form 16) |
-        | 234567890123 | Rahul Verma | Yes | Yes (ITR) |
-        | 345678901234 | Anita Patel | Yes | No |
-        | 567890123456 | Meera Reddy | No | No |
+        | 123456789010 | Priya Sharma | Yes | Yes (Form 16) |
+        | 234567890124 | Rahul Verma | Yes | Yes (ITR) |
+        | 345678901238 | Anita Patel | Yes | No |
+        | 567890123458 | Meera Reddy | No | No |
         """)
 
 
@@ -153,7 +154,7 @@ def eligibility_check_page():
     
     with col1:
         default_aadhaar = verified_aadhaar.get("aadhaar_id", "")
-        aadhaar_id = st.text_input("Aadhaar Number", value=default_aadhaar, max_chars=12, placeholder="123456789012")
+        aadhaar_id = st.text_input("Aadhaar Number", value=default_aadhaar, max_chars=12, placeholder="123456789010")
         
         default_name = kyc_data.get("holder_name") or verified_aadhaar.get("name", "")
         name = st.text_input("Full Name", value=default_name)
@@ -190,22 +191,11 @@ def eligibility_check_page():
             st.error("Please enter your full name")
             return
         
-        # Calculate eligibility
-        from datetime import date
-        from dateutil.relativedelta import relativedelta
+        # Evaluate with the shared rules; unchanged financials are served from the certificate cache
+        borrower = Borrower(aadhaar_id, name, dob, monthly_income, monthly_liabilities, int(credit_score))
+        certificate = ELIGIBILITY_CERTIFICATE_CACHE.get_certificate(borrower)
         
-        age = relativedelta(date.today(), dob).years
-        dti = monthly_liabilities / monthly_income if monthly_income > 0 else 1.0
-        
-        issues = []
-        if credit_score < 750:
-            issues.append(f"Credit score {credit_score} is below minimum 750")
-        if age < 25 or age > 50:
-            issues.append(f"Age {age} is outside 25-50 year range")
-        if dti > 0.50:
-            issues.append(f"DTI ratio {dti:.0%} exceeds 50%")
-        
-        if not issues:
+        if certificate.is_eligible:
             st.success("Congratulations! You are eligible for housing finance.")
             
             # Show eligible rates
@@ -238,6 +228,8 @@ def eligibility_check_page():
                     reg_data = json.loads(result) if isinstance(result, str) else result
                     
                     if reg_data.get("success"):
+                        # The borrower record was just written; drop the result cached for it
+                        ELIGIBILITY_CERTIFICATE_CACHE.invalidate_borrower(aadhaar_id)
                         # Issue certificate
                         session.sql(f"CALL {DB_SCHEMA}.ISSUE_ELIGIBILITY_CERTIFICATE('{aadhaar_id}')").collect()
                         st.success(f"Borrower {reg_data.get('name')} registered successfully!")
@@ -248,8 +240,8 @@ def eligibility_check_page():
                     st.error(f"Registration error: {e}")
         else:
             st.error("Not Eligible")
-            for issue in issues:
-                st.warning(issue)
+            for reason in certificate.rejection_reasons:
+                st.warning(reason)
 
 
 def rate_comparison_page():
@@ -357,17 +349,11 @@ def apply_for_loan_page():
         st.error(f"Error loading borrowers: {e}")
 
 
-def calculate_emi(principal, annual_rate, tenure_months):
-    r = annual_rate / (12 * 100)
-    emi = principal * r * ((1 + r) ** tenure_months) / (((1 + r) ** tenure_months) - 1)
-    return round(emi, 0)
-
-
 def applications_page():
     st.header("My Applications")
     
     # Borrower lookup
-    aadhaar_lookup = st.text_input("Enter Aadhaar to view dashboard", max_chars=12, placeholder="123456789012")
+    aadhaar_lookup = st.text_input("Enter Aadhaar to view dashboard", max_chars=12, placeholder="123456789010")
     
     if aadhaar_lookup and len(aadhaar_lookup) == 12:
         try:
@@ -444,23 +430,23 @@ def rmbs_dashboard_page():
     st.header("RMBS Pool Dashboard")
     
     try:
-        pools_df = session.sql(f"""
-            SELECT 
-                POOL_ID,
-                NAME,
-                AGGREGATION_DATE,
-                LOAN_COUNT,
-                TOTAL_VALUE,
-                STATUS
-            FROM {DB_SCHEMA}.RMBS_POOLS
-            ORDER BY AGGREGATION_DATE DESC
-        """).to_pandas()
+        cube = POOL_ANALYTICS_CACHE.get(session, DB_SCHEMA)
+        pools_df = cube.to_frame()[
+            ["POOL_ID", "NAME", "AGGREGATION_DATE", "LOAN_COUNT", "TOTAL_VALUE",
+             "AVG_CREDIT_SCORE", "WAC_PCT", "WAM_MONTHS", "STATUS"]
+        ].sort_values("AGGREGATION_DATE", ascending=False)
         
         if not pools_df.empty:
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Total Pools", len(pools_df))
-            col2.metric("Total Loans", pools_df["LOAN_COUNT"].sum())
-            col3.metric("Total Value", f"₹{pools_df['TOTAL_VALUE'].sum() / 10000000:.1f}Cr")
+            # Headline figures from the running sums on RMBS_POOLS: one row per pool and
+            # current as of the last assignment run, while the cube refreshes on its interval
+            running = PoolAggregates.from_session(session, DB_SCHEMA)
+            totals = running.totals()
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Total Pools", len(running))
+            col2.metric("Total Loans", totals.loan_count)
+            col3.metric("Total Value", f"₹{totals.total_value / 10000000:.1f}Cr")
+            if totals.weighted_avg_coupon is not None:
+                col4.metric("Weighted Avg Coupon", f"{totals.weighted_avg_coupon * 100:.2f}%")
             
             st.subheader("Pool Details")
             st.dataframe(pools_df, use_container_width=True)
@@ -491,7 +477,7 @@ def document_upload_page():
     st.header("Document Upload")
     st.markdown("Upload additional documents for loan processing")
     
-    aadhaar_id = st.text_input("Your Aadhaar Number", max_chars=12, placeholder="123456789012")
+    aadhaar_id = st.text_input("Your Aadhaar Number", max_chars=12, placeholder="123456789010")
     
     if aadhaar_id and len(aadhaar_id) == 12:
         doc_type = st.selectbox("Document Type", [
@@ -517,6 +503,8 @@ def document_upload_page():
                 
                 data = json.loads(result) if isinstance(result, str) else result
                 if data.get("success"):
+                    # Cached KYC answers for this ID may now list documents as missing
+                    KYC_RESULT_CACHE.invalidate(aadhaar_id)
                     st.success(f"Document uploaded successfully! ID: {data.get('doc_id')}")
                 else:
                     st.error(data.get("error"))
@@ -834,35 +822,35 @@ def pool_analytics_page():
     st.header("Pool Analytics")
     
     try:
-        # Pool performance
-        pools_df = session.sql(f"""
-            SELECT 
-                POOL_ID, NAME, LOAN_COUNT, 
-                TOTAL_VALUE / 10000000 AS VALUE_CR,
-                STATUS
-            FROM {DB_SCHEMA}.RMBS_POOLS
-            ORDER BY POOL_ID DESC
-        """).to_pandas()
+        cube = POOL_ANALYTICS_CACHE.get(session, DB_SCHEMA)
+        pools_df = cube.to_frame().sort_values("POOL_ID", ascending=False)
+        pools_df["VALUE_CR"] = pools_df["TOTAL_VALUE"] / 10000000
         
         st.subheader("Pool Overview")
-        st.dataframe(pools_df, use_container_width=True)
+        st.dataframe(
+            pools_df[["POOL_ID", "NAME", "LOAN_COUNT", "VALUE_CR", "WAC_PCT", "WAM_MONTHS", "STATUS"]],
+            use_container_width=True,
+        )
         
         # Loan quality in pools
         st.subheader("Loan Quality Analysis")
-        quality_df = session.sql(f"""
-            SELECT 
-                ASSIGNED_POOL_ID AS POOL,
-                COUNT(*) AS LOANS,
-                ROUND(AVG(CREDIT_SCORE), 0) AS AVG_SCORE,
-                SUM(AMOUNT) / 100000 AS TOTAL_LAKHS
-            FROM {DB_SCHEMA}.RMBS_ELIGIBLE_LOANS
-            WHERE ASSIGNED_POOL_ID IS NOT NULL
-            GROUP BY ASSIGNED_POOL_ID
-            ORDER BY ASSIGNED_POOL_ID
-        """).to_pandas()
-        
-        if not quality_df.empty:
-            st.dataframe(quality_df, use_container_width=True)
+        if len(cube):
+            st.dataframe(
+                pools_df[["POOL_ID", "AVG_CREDIT_SCORE", "MIN_CREDIT_SCORE", "MAX_CREDIT_SCORE",
+                          "MIN_AMOUNT", "MAX_AMOUNT"]],
+                use_container_width=True,
+            )
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**Credit Score Distribution**")
+                st.bar_chart(cube.histogram_frame("score").sum())
+            with col2:
+                st.markdown("**Loan Size Distribution**")
+                st.bar_chart(cube.histogram_frame("size").sum())
+            
+            st.markdown("**Credit Score Bins by Pool**")
+            st.dataframe(cube.histogram_frame("score"), use_container_width=True)
             
     except Exception as e:
         st.error(f"Error: {e}")
@@ -944,7 +932,7 @@ def emi_payments_page():
     """EMI payment tracking for borrowers."""
     st.header("EMI Payments")
     
-    aadhaar_id = st.text_input("Your Aadhaar Number", max_chars=12, placeholder="123456789012")
+    aadhaar_id = st.text_input("Your Aadhaar Number", max_chars=12, placeholder="123456789010")
     
     if aadhaar_id and len(aadhaar_id) == 12:
         try:
@@ -1038,7 +1026,7 @@ def notifications_page():
     """Notifications for borrowers."""
     st.header("Notifications")
     
-    aadhaar_id = st.text_input("Your Aadhaar Number", max_chars=12, placeholder="123456789012", key="notif_aadhaar")
+    aadhaar_id = st.text_input("Your Aadhaar Number", max_chars=12, placeholder="123456789010", key="notif_aadhaar")
     
     if aadhaar_id and len(aadhaar_id) == 12:
         try:
@@ -0,0 +1,50 @@
+import pytest
+from datetime import date, timedelta
+import numpy as np
+from dateutil.relativedelta import relativedelta
+from src.rules.age import age_in_years, ages_in_years
+
+REFERENCE_DATES = [
+    date(2023, 2, 28),
+    date(2023, 3, 1),
+    date(2024, 2, 28),
+    date(2024, 2, 29),
+    date(2024, 12, 31),
+    date(2026, 1, 19),
+]
+
+
+def dob_range() -> list[date]:
+    start = date(1995, 1, 1)
+    return [start + timedelta(days=n) for n in range(0, 365 * 40, 3)] + [date(2000, 2, 29), date(2004, 2, 29)]
+
+
+class TestAgeInYears:
+    def test_matches_relativedelta(self):
+        for reference_date in REFERENCE_DATES:
+            for dob in dob_range():
+                assert age_in_years(dob, reference_date) == relativedelta(reference_date, dob).years
+
+    def test_accepts_year_month_day_tuples(self):
+        assert age_in_years((1990, 5, 15), (2026, 5, 14)) == 35
+        assert age_in_years((1990, 5, 15), (2026, 5, 15)) == 36
+
+    def test_leap_day_birthday_reached_on_feb_28(self):
+        assert age_in_years(date(2000, 2, 29), date(2023, 2, 27)) == 22
+        assert age_in_years(date(2000, 2, 29), date(2023, 2, 28)) == 23
+
+    def test_future_dob_truncates_towards_zero(self):
+        assert age_in_years(date(2027, 6, 1), date(2026, 1, 1)) == -1
+
+
+class TestAgesInYears:
+    def test_matches_scalar_kernel(self):
+        dobs = dob_range()
+        for reference_date in REFERENCE_DATES:
+            ages = ages_in_years(np.array(dobs, dtype="datetime64[D]"), reference_date)
+            assert ages.tolist() == [age_in_years(dob, reference_date) for dob in dobs]
+
+    def test_array_of_reference_dates(self):
+        dobs = np.array([date(2000, 2, 29)] * len(REFERENCE_DATES), dtype="datetime64[D]")
+        ages = ages_in_years(dobs, np.array(REFERENCE_DATES, dtype="datetime64[D]"))
+        assert ages.tolist() == [relativedelta(ref, date(2000, 2, 29)).years for ref in REFERENCE_DATES]
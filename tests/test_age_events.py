@@ -0,0 +1,62 @@
+import pytest
+import random
+from datetime import date, timedelta
+from src.rules.eligibility import Borrower, issue_eligibility_certificate
+from src.rules.age_events import AgeEventCalendar, IncrementalEligibilityRefresher
+
+
+def make_borrower(aadhaar_id: str, dob: date, credit_score: int = 800) -> Borrower:
+    return Borrower(aadhaar_id, "Test User", dob, 100000, 30000, credit_score)
+
+
+class TestAgeEventCalendar:
+    def test_events_on_turning_min_and_max_plus_one(self):
+        calendar = AgeEventCalendar.from_borrowers([make_borrower("1", date(2000, 2, 29))])
+        assert calendar.events_for("1") == (date(2025, 2, 28), date(2051, 2, 28))
+        assert calendar.due(date(2025, 2, 28)) == {"1"}
+        assert calendar.due(date(2025, 3, 1)) == set()
+
+    def test_due_between_and_remove(self):
+        calendar = AgeEventCalendar.from_borrowers([
+            make_borrower("1", date(2001, 1, 20)),
+            make_borrower("2", date(1975, 1, 25)),
+        ])
+        assert calendar.due_between(date(2026, 1, 19), date(2026, 1, 31)) == {"1", "2"}
+        calendar.remove("1")
+        assert calendar.due_between(date(2026, 1, 19), date(2026, 1, 31)) == {"2"}
+
+
+class TestIncrementalEligibilityRefresher:
+    def test_daily_refresh_matches_full_recompute(self):
+        rng = random.Random(5)
+        start = date(2026, 1, 1)
+        borrowers = {
+            str(i): make_borrower(str(i), date(1970, 1, 1) + timedelta(days=rng.randrange(0, 12000)))
+            for i in range(400)
+        }
+        refresher = IncrementalEligibilityRefresher()
+        refresher.rebuild(borrowers.values(), on=start)
+
+        for day in range(1, 400, 7):
+            on = start + timedelta(days=day)
+            changed = set()
+            if day % 3 == 0:
+                changed.add("7")
+                borrowers["7"] = make_borrower("7", borrowers["7"].date_of_birth, credit_score=rng.randrange(700, 800))
+            updated = refresher.refresh(borrowers, changed, on=on)
+
+            assert len(updated) < len(borrowers)
+            for aadhaar_id, borrower in borrowers.items():
+                expected = issue_eligibility_certificate(borrower, on)
+                assert refresher.certificates[aadhaar_id].is_eligible == expected.is_eligible
+
+    def test_deleted_borrower_dropped(self):
+        refresher = IncrementalEligibilityRefresher()
+        refresher.rebuild([make_borrower("1", date(1990, 5, 15))], on=date(2026, 1, 19))
+        refresher.refresh({}, {"1"}, on=date(2026, 1, 20))
+        assert refresher.certificates == {}
+        assert len(refresher.calendar) == 0
+
+    def test_refresh_requires_rebuild(self):
+        with pytest.raises(RuntimeError):
+            IncrementalEligibilityRefresher().refresh({}, on=date(2026, 1, 19))
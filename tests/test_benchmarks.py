@@ -0,0 +1,63 @@
+import pytest
+from benchmarks.generators import (
+    LatencySession,
+    make_borrower_columns,
+    make_borrowers,
+    make_kyc_payloads,
+    make_loans,
+)
+from benchmarks import suite
+from benchmarks.suite import BenchmarkCase, build_cases, compare_to_baseline, missing_from_baseline, run_cases
+from src.kyc.aadhaar import perform_kyc_check
+from src.marketplace.emi import calculate_emi
+
+
+class TestGenerators:
+    def test_seeded_generators_are_reproducible(self):
+        assert make_borrowers(50, seed=1) == make_borrowers(50, seed=1)
+        assert make_loans(50, seed=1) == make_loans(50, seed=1)
+        assert make_borrowers(50, seed=1) != make_borrowers(50, seed=2)
+
+    def test_kyc_payloads_drive_wrappers(self):
+        ids = make_borrower_columns(20)["aadhaar_id"].tolist()
+        session = LatencySession(make_kyc_payloads(ids, not_found_rate=0.0), latency_seconds=0)
+        result = perform_kyc_check(session, ids[0])
+        assert result.kyc_status in ("PASSED", "INCOMPLETE")
+        assert session.calls == 1
+
+
+class TestSuite:
+    def test_cases_run(self):
+        results = run_cases(build_cases(200, kyc_latency_seconds=0), repeat=1)
+        assert results["issue_eligibility_certificate"]["rows"] == 200
+        assert results["perform_kyc_check"]["rows"] == 2
+        assert results["decode_kyc"]["rows"] == results["kyc_from_payload"]["rows"] == 20
+
+    def test_regression_beyond_tolerance_is_reported(self):
+        baseline = {"fast": {"rows": 10, "seconds": 1.0}, "slow": {"rows": 10, "seconds": 1.0}}
+        results = {"fast": {"rows": 10, "seconds": 1.1}, "slow": {"rows": 10, "seconds": 1.5},
+                   "new": {"rows": 10, "seconds": 9.0}}
+        assert compare_to_baseline(results, baseline, tolerance=0.25) == ["slow"]
+        assert missing_from_baseline(results, baseline) == ["new"]
+        assert missing_from_baseline({"fast": {"rows": 20, "seconds": 1.0}}, baseline) == ["fast"]
+
+    def test_missing_baseline_fails_unless_updating(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(suite, "BASELINE_DIR", tmp_path)
+        monkeypatch.setattr(suite, "build_cases", lambda count, seed: [BenchmarkCase("noop", 1, lambda: None)])
+
+        assert suite.main(["--scale", "100k", "--repeat", "1"]) == 1
+        assert suite.main(["--scale", "100k", "--repeat", "1", "--update-baseline"]) == 0
+        assert (tmp_path / "100k.json").exists()
+
+        monkeypatch.setattr(suite, "build_cases", lambda count, seed: [
+            BenchmarkCase("noop", 1, lambda: None), BenchmarkCase("added", 1, lambda: None),
+        ])
+        assert suite.main(["--scale", "100k", "--repeat", "1"]) == 1
+
+
+class TestCalculateEMI:
+    def test_emi_for_standard_loan(self):
+        assert calculate_emi(5000000, 7.5, 240) == 40280
+
+    def test_zero_rate_spreads_principal(self):
+        assert calculate_emi(1200000, 0, 120) == 10000
@@ -1,11 +1,16 @@
 import pytest
 from datetime import date
+from src.rules import eligibility
+from src.rules.batch import issue_eligibility_certificates_batch
 from src.rules.eligibility import (
     validate_credit_score,
     validate_age,
     calculate_dti,
     issue_eligibility_certificate,
     Borrower,
+    EligibilityCertificate,
+    Rejection,
+    RejectionCode,
     MIN_CREDIT_SCORE,
     MIN_AGE,
     MAX_AGE,
@@ -67,7 +72,7 @@ class TestCalculateDTI:
 class TestIssueEligibilityCertificate:
     def test_eligible_borrower_gets_certificate(self):
         borrower = Borrower(
-            aadhaar_id="123456789012",
+            aadhaar_id="123456789010",
             name="Test User",
             date_of_birth=date(1990, 5, 15),
             monthly_income=100000,
@@ -80,7 +85,7 @@ class TestIssueEligibilityCertificate:
 
     def test_ineligible_borrower_gets_rejection(self):
         borrower = Borrower(
-            aadhaar_id="123456789012",
+            aadhaar_id="123456789010",
             name="Test User",
             date_of_birth=date(1990, 5, 15),
             monthly_income=100000,
@@ -90,3 +95,77 @@ class TestIssueEligibilityCertificate:
         cert = issue_eligibility_certificate(borrower)
         assert cert.is_eligible is False
         assert len(cert.rejection_reasons) > 0
+
+
+class TestRejectionCodes:
+    def test_certificate_stores_codes_and_values(self):
+        borrower = Borrower(
+            aadhaar_id="123456789010",
+            name="Test User",
+            date_of_birth=date(2005, 1, 1),
+            monthly_income=100000,
+            monthly_liabilities=60000,
+            credit_score=700,
+        )
+        cert = issue_eligibility_certificate(borrower, reference_date=date(2026, 1, 19))
+        assert cert.rejections == [
+            Rejection(RejectionCode.CREDIT_SCORE_BELOW_MIN, 700, 750),
+            Rejection(RejectionCode.AGE_BELOW_MIN, 21, 25),
+            Rejection(RejectionCode.DTI_ABOVE_MAX, 0.60, 0.50),
+        ]
+        assert cert.rejection_codes == (
+            RejectionCode.CREDIT_SCORE_BELOW_MIN | RejectionCode.AGE_BELOW_MIN | RejectionCode.DTI_ABOVE_MAX
+        )
+
+    def test_messages_rendered_on_demand(self):
+        cert = EligibilityCertificate(
+            borrower_id="123456789010",
+            is_eligible=False,
+            issued_date=date(2026, 1, 19),
+            rejections=[Rejection(RejectionCode.CREDIT_SCORE_BELOW_MIN, 700)],
+        )
+        assert cert.rejection_reasons == ["Credit score 700 is below minimum threshold of 750"]
+        assert cert.rejection_reasons == [validate_credit_score(700)[1]]
+
+    def test_messages_keep_thresholds_from_evaluation(self, monkeypatch):
+        borrower = Borrower("123456789010", "Test User", date(1990, 5, 15), 100000, 30000, 700)
+        cert = issue_eligibility_certificate(borrower, reference_date=date(2026, 1, 19))
+        batch = issue_eligibility_certificates_batch(
+            {"credit_score": [700], "date_of_birth": [date(1990, 5, 15)],
+             "monthly_income": [100000], "monthly_liabilities": [30000]},
+            reference_date=date(2026, 1, 19),
+        )
+
+        monkeypatch.setattr(eligibility, "MIN_CREDIT_SCORE", 720)
+        expected = ["Credit score 700 is below minimum threshold of 750"]
+        assert cert.rejection_reasons == expected
+        assert batch.rejection_reasons(0) == expected
+
+    def test_batch_reads_thresholds_when_run(self, monkeypatch):
+        monkeypatch.setattr(eligibility, "MIN_CREDIT_SCORE", 680)
+        batch = issue_eligibility_certificates_batch(
+            {"credit_score": [700], "date_of_birth": [date(1990, 5, 15)],
+             "monthly_income": [100000], "monthly_liabilities": [30000]},
+            reference_date=date(2026, 1, 19),
+        )
+        assert batch.is_eligible.tolist() == [True]
+        assert batch.thresholds[RejectionCode.CREDIT_SCORE_BELOW_MIN] == 680
+
+    def test_rejection_reasons_keyword_still_accepted(self):
+        cert = EligibilityCertificate(
+            borrower_id="123456789010",
+            is_eligible=False,
+            issued_date=date(2026, 1, 19),
+            rejection_reasons=["Manual review: income proof unreadable"],
+        )
+        assert cert.rejection_reasons == ["Manual review: income proof unreadable"]
+        assert cert.rejection_codes == RejectionCode(0)
+        with pytest.raises(ValueError):
+            EligibilityCertificate("123456789010", False, date(2026, 1, 19),
+                                   rejections=[Rejection(RejectionCode.AGE_BELOW_MIN, 21)],
+                                   rejection_reasons=["Too young"])
+
+    def test_models_use_slots(self):
+        borrower = Borrower("123456789010", "Test User", date(1990, 5, 15), 100000, 30000, 800)
+        assert not hasattr(borrower, "__dict__")
+        assert not hasattr(issue_eligibility_certificate(borrower), "__dict__")
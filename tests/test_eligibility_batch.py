@@ -0,0 +1,119 @@
+import pytest
+import random
+from datetime import date, timedelta
+from src.rules.eligibility import (
+    validate_credit_score,
+    validate_age,
+    calculate_dti,
+    Borrower,
+)
+from src.rules.batch import (
+    issue_eligibility_certificates_batch,
+    REASON_CREDIT_SCORE,
+    REASON_AGE_BELOW_MIN,
+    REASON_AGE_ABOVE_MAX,
+    REASON_INCOME_NOT_POSITIVE,
+    REASON_DTI_EXCEEDED,
+)
+
+REFERENCE_DATE = date(2026, 1, 19)
+
+
+def scalar_reasons(borrower: Borrower, reference_date: date) -> list[str]:
+    reasons = []
+    _, reason = validate_credit_score(borrower.credit_score)
+    if reason:
+        reasons.append(reason)
+    _, reason = validate_age(borrower.date_of_birth, reference_date=reference_date)
+    if reason:
+        reasons.append(reason)
+    _, _, reason = calculate_dti(borrower.monthly_income, borrower.monthly_liabilities)
+    if reason:
+        reasons.append(reason)
+    return reasons
+
+
+def to_columns(borrowers: list[Borrower]) -> dict:
+    return {
+        "credit_score": [b.credit_score for b in borrowers],
+        "date_of_birth": [b.date_of_birth for b in borrowers],
+        "monthly_income": [b.monthly_income for b in borrowers],
+        "monthly_liabilities": [b.monthly_liabilities for b in borrowers],
+    }
+
+
+def make_borrower(dob: date, credit_score: int = 800, income: float = 100000, liabilities: float = 30000) -> Borrower:
+    return Borrower(
+        aadhaar_id="123456789010",
+        name="Test User",
+        date_of_birth=dob,
+        monthly_income=income,
+        monthly_liabilities=liabilities,
+        credit_score=credit_score,
+    )
+
+
+class TestEligibilityBatchReasonMask:
+    def test_reason_bits_per_rule(self):
+        borrowers = [
+            make_borrower(date(1990, 5, 15)),
+            make_borrower(date(1990, 5, 15), credit_score=700),
+            make_borrower(date(2005, 1, 1)),
+            make_borrower(date(1970, 1, 1)),
+            make_borrower(date(1990, 5, 15), income=0),
+            make_borrower(date(1990, 5, 15), liabilities=60000),
+        ]
+        result = issue_eligibility_certificates_batch(to_columns(borrowers), reference_date=REFERENCE_DATE)
+
+        assert result.is_eligible.tolist() == [True, False, False, False, False, False]
+        assert result.reason_mask.tolist() == [
+            0,
+            REASON_CREDIT_SCORE,
+            REASON_AGE_BELOW_MIN,
+            REASON_AGE_ABOVE_MAX,
+            REASON_INCOME_NOT_POSITIVE,
+            REASON_DTI_EXCEEDED,
+        ]
+
+    def test_missing_column_raises(self):
+        with pytest.raises(ValueError):
+            issue_eligibility_certificates_batch({"credit_score": [800]})
+
+
+class TestEligibilityBatchMatchesScalar:
+    def test_leap_day_and_birthday_boundaries(self):
+        reference_dates = [date(2023, 2, 28), date(2024, 2, 28), date(2024, 2, 29), date(2026, 1, 19)]
+        dobs = [date(1999, 2, 28), date(2000, 2, 29), date(1998, 3, 1), date(2001, 1, 19), date(2001, 1, 20),
+                date(1975, 1, 19), date(1975, 1, 20), date(2030, 6, 1)]
+        borrowers = [make_borrower(dob) for dob in dobs]
+        for reference_date in reference_dates:
+            result = issue_eligibility_certificates_batch(to_columns(borrowers), reference_date=reference_date)
+            for i, borrower in enumerate(borrowers):
+                assert result.rejection_reasons(i) == scalar_reasons(borrower, reference_date)
+
+    def test_random_borrowers_match_scalar_rules(self):
+        rng = random.Random(7)
+        borrowers = [
+            make_borrower(
+                dob=date(1960, 1, 1) + timedelta(days=rng.randrange(0, 18000)),
+                credit_score=rng.randrange(600, 900),
+                income=rng.choice([0, -5000, rng.uniform(10000, 300000)]),
+                liabilities=rng.uniform(0, 150000),
+            )
+            for _ in range(2000)
+        ]
+        result = issue_eligibility_certificates_batch(to_columns(borrowers), reference_date=REFERENCE_DATE)
+        certificates = result.to_certificates([b.aadhaar_id for b in borrowers], issued_date=REFERENCE_DATE)
+
+        for borrower, certificate in zip(borrowers, certificates):
+            expected = scalar_reasons(borrower, REFERENCE_DATE)
+            assert certificate.rejection_reasons == expected
+            assert certificate.is_eligible is (len(expected) == 0)
+
+    def test_accepts_pandas_dataframe(self):
+        pd = pytest.importorskip("pandas")
+        borrowers = [make_borrower(date(1990, 5, 15)), make_borrower(date(1990, 5, 15), credit_score=600)]
+        frame = pd.DataFrame(to_columns(borrowers))
+        frame["date_of_birth"] = pd.to_datetime(frame["date_of_birth"])
+        result = issue_eligibility_certificates_batch(frame, reference_date=REFERENCE_DATE)
+        assert result.is_eligible.tolist() == [True, False]
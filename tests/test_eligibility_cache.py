@@ -0,0 +1,92 @@
+import pytest
+from datetime import date
+import src.rules.eligibility as eligibility
+from src.rules.eligibility import Borrower, issue_eligibility_certificate
+from src.rules.cache import EligibilityCertificateCache
+
+REFERENCE_DATE = date(2026, 1, 19)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_borrower(aadhaar_id: str = "123456789010", credit_score: int = 800) -> Borrower:
+    return Borrower(
+        aadhaar_id=aadhaar_id,
+        name="Test User",
+        date_of_birth=date(1990, 5, 15),
+        monthly_income=100000,
+        monthly_liabilities=30000,
+        credit_score=credit_score,
+    )
+
+
+class TestEligibilityCertificateCache:
+    def test_repeat_lookup_hits(self):
+        cache = EligibilityCertificateCache()
+        first = cache.get_certificate(make_borrower(), REFERENCE_DATE)
+        second = cache.get_certificate(make_borrower(), REFERENCE_DATE)
+
+        assert first == second == issue_eligibility_certificate(make_borrower(), REFERENCE_DATE)
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_identical_financials_share_entry(self):
+        cache = EligibilityCertificateCache()
+        cache.get_certificate(make_borrower("111111111111", credit_score=600), REFERENCE_DATE)
+        cert = cache.get_certificate(make_borrower("222222222222", credit_score=600), REFERENCE_DATE)
+
+        assert cert.borrower_id == "222222222222"
+        assert cert.is_eligible is False
+        assert cache.stats.hits == 1
+
+    def test_changed_financials_miss(self):
+        cache = EligibilityCertificateCache()
+        cache.get_certificate(make_borrower(credit_score=800), REFERENCE_DATE)
+        cert = cache.get_certificate(make_borrower(credit_score=700), REFERENCE_DATE)
+
+        assert cert.is_eligible is False
+        assert cache.stats.misses == 2
+
+    def test_rule_change_misses(self, monkeypatch):
+        cache = EligibilityCertificateCache()
+        assert cache.get_certificate(make_borrower(), REFERENCE_DATE).is_eligible is True
+        monkeypatch.setattr(eligibility, "MIN_CREDIT_SCORE", 850)
+        assert cache.get_certificate(make_borrower(), REFERENCE_DATE).is_eligible is False
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = EligibilityCertificateCache(ttl_seconds=60, clock=clock)
+        cache.get_certificate(make_borrower(), REFERENCE_DATE)
+        clock.now = 61
+        cache.get_certificate(make_borrower(), REFERENCE_DATE)
+
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 2
+
+    def test_lru_eviction(self):
+        cache = EligibilityCertificateCache(max_entries=2)
+        cache.get_certificate(make_borrower(credit_score=700), REFERENCE_DATE)
+        cache.get_certificate(make_borrower(credit_score=800), REFERENCE_DATE)
+        cache.get_certificate(make_borrower(credit_score=700), REFERENCE_DATE)
+        cache.get_certificate(make_borrower(credit_score=900), REFERENCE_DATE)
+
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        cache.get_certificate(make_borrower(credit_score=700), REFERENCE_DATE)
+        assert cache.stats.hits == 2
+
+    def test_invalidate_borrower(self):
+        cache = EligibilityCertificateCache()
+        cache.get_certificate(make_borrower(), REFERENCE_DATE)
+
+        assert cache.invalidate_borrower("123456789010") is True
+        assert cache.invalidate_borrower("123456789010") is False
+        cache.get_certificate(make_borrower(), REFERENCE_DATE)
+        assert cache.stats.misses == 2
+        assert cache.stats.invalidations == 1
@@ -0,0 +1,47 @@
+import pytest
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from src.rules.batch import issue_eligibility_certificates_batch
+from src.rules.parallel import run_sharded_eligibility, shard_for_ids
+
+REFERENCE_DATE = date(2026, 1, 19)
+
+
+def make_columns(count: int, seed: int = 11) -> dict:
+    rng = random.Random(seed)
+    return {
+        "aadhaar_id": [f"{rng.randrange(10**11, 10**12)}" for _ in range(count)],
+        "credit_score": [rng.randrange(600, 900) for _ in range(count)],
+        "date_of_birth": [date(1960, 1, 1) + timedelta(days=rng.randrange(0, 18000)) for _ in range(count)],
+        "monthly_income": [rng.uniform(0, 300000) for _ in range(count)],
+        "monthly_liabilities": [rng.uniform(0, 150000) for _ in range(count)],
+    }
+
+
+class TestShardForIds:
+    def test_shards_are_stable_and_in_range(self):
+        ids = ["123456789010", "234567890124", "345678901238"]
+        first = shard_for_ids(ids, 4)
+        assert first.tolist() == shard_for_ids(ids, 4).tolist()
+        assert all(0 <= shard < 4 for shard in first)
+
+
+class TestRunShardedEligibility:
+    def test_matches_single_pass_in_input_order(self):
+        columns = make_columns(500)
+        expected = issue_eligibility_certificates_batch(columns, REFERENCE_DATE)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            sharded = run_sharded_eligibility(columns, n_shards=7, reference_date=REFERENCE_DATE, executor=executor)
+
+        assert sharded.result.reason_mask.tolist() == expected.reason_mask.tolist()
+        assert sharded.result.age.tolist() == expected.age.tolist()
+        assert sum(t.rows for t in sharded.shard_timings) == 500
+
+    def test_process_pool(self):
+        columns = make_columns(200)
+        expected = issue_eligibility_certificates_batch(columns, REFERENCE_DATE)
+        sharded = run_sharded_eligibility(columns, n_shards=4, max_workers=2, reference_date=REFERENCE_DATE)
+
+        assert sharded.result.is_eligible.tolist() == expected.is_eligible.tolist()
+        assert sorted(t.shard for t in sharded.shard_timings) == [0, 1, 2, 3]
@@ -0,0 +1,82 @@
+import pytest
+import csv
+from datetime import date
+from src.rules.eligibility import Borrower, issue_eligibility_certificate
+from src.rules.pipeline import (
+    CertificateSink,
+    CsvCertificateSink,
+    read_borrower_chunks,
+    run_eligibility_pipeline,
+    PIPELINE_COLUMNS,
+)
+
+REFERENCE_DATE = date(2026, 1, 19)
+
+BORROWERS = [
+    Borrower("123456789010", "Priya Sharma", date(1990, 5, 15), 100000.0, 25000.0, 785),
+    Borrower("234567890124", "Rahul Verma", date(1985, 8, 22), 150000.0, 40000.0, 810),
+    Borrower("345678901238", "Anita Patel", date(2003, 3, 10), 85000.0, 30000.0, 760),
+    Borrower("456789012341", "Vijay Kumar", date(1988, 11, 28), 120000.0, 65000.0, 720),
+    Borrower("567890123458", "Meera Reddy", date(1970, 2, 1), 0.0, 1000.0, 790),
+]
+
+
+def write_csv(path):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("aadhaar_id", "name") + PIPELINE_COLUMNS[1:])
+        for b in BORROWERS:
+            writer.writerow((b.aadhaar_id, b.name, b.credit_score, b.date_of_birth.isoformat(),
+                             b.monthly_income, b.monthly_liabilities))
+
+
+class TestEligibilityPipeline:
+    def test_csv_streams_in_chunks(self, tmp_path):
+        pytest.importorskip("pandas")
+        path = tmp_path / "borrowers.csv"
+        write_csv(path)
+
+        chunks = list(read_borrower_chunks(path, chunk_size=2))
+        assert [len(chunk["aadhaar_id"]) for chunk in chunks] == [2, 2, 1]
+
+    def test_certificates_match_scalar_rules(self, tmp_path):
+        pytest.importorskip("pandas")
+        path = tmp_path / "borrowers.csv"
+        write_csv(path)
+
+        certificates = []
+        stats = run_eligibility_pipeline(path, CertificateSink(certificates.append, REFERENCE_DATE),
+                                         chunk_size=2, reference_date=REFERENCE_DATE)
+
+        assert stats.chunks == 3
+        assert stats.rows == len(BORROWERS)
+        assert certificates == [issue_eligibility_certificate(b, REFERENCE_DATE) for b in BORROWERS]
+        assert stats.eligible == sum(c.is_eligible for c in certificates)
+
+    def test_parquet_source(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+        path = tmp_path / "borrowers.parquet"
+        table = pa.table({
+            "aadhaar_id": [b.aadhaar_id for b in BORROWERS],
+            "credit_score": [b.credit_score for b in BORROWERS],
+            "date_of_birth": [b.date_of_birth for b in BORROWERS],
+            "monthly_income": [b.monthly_income for b in BORROWERS],
+            "monthly_liabilities": [b.monthly_liabilities for b in BORROWERS],
+        })
+        pq.write_table(table, path)
+
+        certificates = []
+        run_eligibility_pipeline(path, CertificateSink(certificates.append, REFERENCE_DATE),
+                                 chunk_size=3, reference_date=REFERENCE_DATE)
+        assert certificates == [issue_eligibility_certificate(b, REFERENCE_DATE) for b in BORROWERS]
+
+    def test_csv_sink_writes_rows(self, tmp_path):
+        out = tmp_path / "certificates.csv"
+        chunk = {column: [getattr(b, column) for b in BORROWERS] for column in PIPELINE_COLUMNS}
+        run_eligibility_pipeline([chunk], CsvCertificateSink(out), reference_date=REFERENCE_DATE)
+
+        with open(out, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["borrower_id"] for row in rows] == [b.aadhaar_id for b in BORROWERS]
+        assert rows[3]["rejection_reasons"].startswith("Credit score 720")
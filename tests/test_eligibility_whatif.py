@@ -0,0 +1,67 @@
+import pytest
+import random
+from datetime import date, timedelta
+import numpy as np
+import src.rules.eligibility as eligibility
+from src.rules.age import age_in_years
+from src.rules.whatif import EligibilityWhatIfIndex
+
+REFERENCE_DATE = date(2026, 1, 19)
+
+
+def make_columns(count: int = 1500, seed: int = 3) -> dict:
+    rng = random.Random(seed)
+    return {
+        "aadhaar_id": [f"{100000000000 + i}" for i in range(count)],
+        "credit_score": [rng.randrange(650, 850) for _ in range(count)],
+        "date_of_birth": [date(1965, 1, 1) + timedelta(days=rng.randrange(0, 15000)) for _ in range(count)],
+        "monthly_income": [rng.choice([0.0, rng.uniform(20000, 200000)]) for _ in range(count)],
+        "monthly_liabilities": [rng.uniform(0, 100000) for _ in range(count)],
+    }
+
+
+def brute_force(columns: dict, min_score: int, min_age: int, max_age: int, max_dti: float) -> list[str]:
+    eligible = []
+    for i, aadhaar_id in enumerate(columns["aadhaar_id"]):
+        age = age_in_years(columns["date_of_birth"][i], REFERENCE_DATE)
+        income = columns["monthly_income"][i]
+        if (columns["credit_score"][i] >= min_score and min_age <= age <= max_age
+                and income > 0 and columns["monthly_liabilities"][i] / income <= max_dti):
+            eligible.append(aadhaar_id)
+    return eligible
+
+
+@pytest.fixture(scope="module")
+def columns():
+    return make_columns()
+
+
+@pytest.fixture(scope="module")
+def index(columns):
+    return EligibilityWhatIfIndex.from_columns(columns, reference_date=REFERENCE_DATE)
+
+
+class TestEligibilityWhatIfIndex:
+    def test_defaults_match_current_rules(self, columns, index):
+        expected = brute_force(columns, eligibility.MIN_CREDIT_SCORE, eligibility.MIN_AGE,
+                               eligibility.MAX_AGE, eligibility.MAX_DTI_RATIO)
+        assert index.borrowers().tolist() == expected
+        assert index.count() == len(expected)
+
+    def test_relaxed_thresholds(self, columns, index):
+        expected = brute_force(columns, 720, 25, 50, 0.55)
+        assert index.borrowers(min_credit_score=720, max_dti_ratio=0.55).tolist() == expected
+
+    def test_sweep_matches_point_queries(self, columns, index):
+        scores = [780, 700, 750]
+        min_ages = [21, 25]
+        max_ages = [50, 60, 45]
+        dtis = [0.55, 0.40, 0.50]
+        grid = index.sweep(scores, min_ages, max_ages, dtis)
+
+        assert grid.shape == (3, 2, 3, 3)
+        for i, score in enumerate(scores):
+            for j, min_age in enumerate(min_ages):
+                for k, max_age in enumerate(max_ages):
+                    for m, dti in enumerate(dtis):
+                        assert grid[i, j, k, m] == len(brute_force(columns, score, min_age, max_age, dti))
@@ -39,18 +39,18 @@ class TestValidateAadhaar:
         session = MockSession(responses={
             "CORE.VERIFY_AADHAAR": {
                 "success": True,
-                "aadhaar_id": "123456789012",
+                "aadhaar_id": "123456789010",
                 "name": "Priya Sharma",
                 "date_of_birth": "1990-05-15",
                 "gender": "F",
             }
         })
-        result = validate_aadhaar(session, "123456789012")
+        result = validate_aadhaar(session, "123456789010")
         
         assert result.is_valid is True
         assert result.name == "Priya Sharma"
         assert result.gender == "F"
-        assert ("CORE.VERIFY_AADHAAR", ("123456789012",)) in session.calls
+        assert ("CORE.VERIFY_AADHAAR", ("123456789010",)) in session.calls
 
     def test_aadhaar_not_found(self):
         session = MockSession(responses={
@@ -60,7 +60,7 @@ class TestValidateAadhaar:
                 "error_message": "Aadhaar not found in registry",
             }
         })
-        result = validate_aadhaar(session, "999888777666")
+        result = validate_aadhaar(session, "999888777668")
         
         assert result.is_valid is False
         assert "not found" in result.error_message
@@ -71,17 +71,17 @@ class TestFetchDigilockerDocuments:
         session = MockSession(responses={
             "CORE.FETCH_DIGILOCKER_DOCUMENTS": {
                 "success": True,
-                "aadhaar_id": "123456789012",
+                "aadhaar_id": "123456789010",
                 "holder_name": "Priya Sharma",
                 "document_count": 3,
                 "documents": [
-                    {"doc_type": "AADHAAR", "doc_number": "123456789012", "issuer": "UIDAI", "status": "VERIFIED", "metadata": {}},
+                    {"doc_type": "AADHAAR", "doc_number": "123456789010", "issuer": "UIDAI", "status": "VERIFIED", "metadata": {}},
                     {"doc_type": "PAN", "doc_number": "ABCDE1234F", "issuer": "Income Tax Dept", "status": "VERIFIED", "metadata": {}},
                     {"doc_type": "FORM_16", "doc_number": "F16-2024", "issuer": "TCS Ltd", "status": "VERIFIED", "metadata": {}},
                 ],
             }
         })
-        result = fetch_digilocker_documents(session, "123456789012")
+        result = fetch_digilocker_documents(session, "123456789010")
         
         assert result.error_message is None
         assert result.holder_name == "Priya Sharma"
@@ -96,7 +96,7 @@ class TestFetchDigilockerDocuments:
                 "error_message": "Aadhaar not found in registry",
             }
         })
-        result = fetch_digilocker_documents(session, "999888777666")
+        result = fetch_digilocker_documents(session, "999888777668")
         
         assert result.error_message is not None
         assert len(result.documents) == 0
@@ -115,7 +115,7 @@ class TestPerformKYCCheck:
                 "missing_documents": [],
             }
         })
-        result = perform_kyc_check(session, "123456789012")
+        result = perform_kyc_check(session, "123456789010")
         
         assert result.kyc_status == "PASSED"
         assert result.aadhaar_verified is True
@@ -135,7 +135,7 @@ class TestPerformKYCCheck:
                 "missing_documents": ["PAN", "Income Proof (Form 16 or ITR)"],
             }
         })
-        result = perform_kyc_check(session, "567890123456")
+        result = perform_kyc_check(session, "567890123458")
         
         assert result.kyc_status == "INCOMPLETE"
         assert result.has_pan is False
@@ -149,7 +149,7 @@ class TestPerformKYCCheck:
                 "error": "Aadhaar not found in registry",
             }
         })
-        result = perform_kyc_check(session, "999888777666")
+        result = perform_kyc_check(session, "999888777668")
         
         assert result.kyc_status == "FAILED"
         assert result.aadhaar_verified is False
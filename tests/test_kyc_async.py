@@ -0,0 +1,175 @@
+import asyncio
+import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.kyc.aadhaar import perform_kyc_check
+from src.kyc.async_client import AsyncKYCClient, run_kyc_lookups
+from src.kyc.verhoeff import verhoeff_check_digit
+
+VERIFIED = {"success": True, "aadhaar_id": "123456789010", "name": "Priya Sharma",
+            "date_of_birth": "1990-05-15", "gender": "F"}
+KYC_PASSED = {"kyc_status": "PASSED", "aadhaar_verified": True, "holder_name": "Priya Sharma",
+              "date_of_birth": "1990-05-15", "has_pan": True, "has_income_proof": True, "missing_documents": []}
+
+
+class SlowSession:
+    """Thread-safe mock session that sleeps per call and tracks peak concurrency."""
+
+    def __init__(self, latency: dict = None, default_latency: float = 0.02):
+        self.latency = latency or {}
+        self.default_latency = default_latency
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def call(self, procedure: str, *args):
+        with self._lock:
+            self.calls.append((procedure, args))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.latency.get(args[0], self.default_latency))
+        with self._lock:
+            self.in_flight -= 1
+        if procedure == "CORE.VERIFY_AADHAAR":
+            return {**VERIFIED, "aadhaar_id": args[0]}
+        if procedure == "CORE.PERFORM_KYC_CHECK":
+            return KYC_PASSED
+        return {"success": True, "aadhaar_id": args[0], "holder_name": "Priya Sharma", "documents": []}
+
+
+IDS = [f"{10000000000 + n}" + verhoeff_check_digit(f"{10000000000 + n}") for n in range(24)]
+
+
+class TestAsyncKYCClient:
+    def test_concurrency_is_bounded(self):
+        session = SlowSession()
+
+        async def drive():
+            async with AsyncKYCClient(session, max_concurrency=4) as client:
+                return await asyncio.gather(*(client.validate_aadhaar(i) for i in IDS))
+
+        results = asyncio.run(drive())
+        assert [r.aadhaar_id for r in results] == IDS
+        assert all(r.is_valid for r in results)
+        assert 1 < session.peak <= 4
+
+    def test_runs_faster_than_sequential(self):
+        session = SlowSession(default_latency=0.05)
+        started = time.perf_counter()
+        run_kyc_lookups(session, IDS[:16], max_concurrency=16)
+        assert time.perf_counter() - started < 16 * 0.05 / 2
+
+    def test_yields_results_as_they_complete(self):
+        session = SlowSession(latency={IDS[0]: 0.2, IDS[1]: 0.01, IDS[2]: 0.05})
+
+        async def drive():
+            async with AsyncKYCClient(session, max_concurrency=3) as client:
+                return [aadhaar_id async for aadhaar_id, _ in client.as_completed(IDS[:3])]
+
+        assert asyncio.run(drive()) == [IDS[1], IDS[2], IDS[0]]
+
+    def test_closing_early_cancels_pending_lookups(self):
+        session = SlowSession(latency={IDS[0]: 0.01}, default_latency=0.2)
+
+        async def drive():
+            async with AsyncKYCClient(session, max_concurrency=4) as client:
+                async with contextlib.aclosing(client.as_completed(IDS[:8])) as results:
+                    async for aadhaar_id, _ in results:
+                        break
+                return aadhaar_id, asyncio.all_tasks() - {asyncio.current_task()}
+
+        first, pending = asyncio.run(drive())
+        assert first == IDS[0]
+        assert pending == set()
+
+    def test_timeout_returns_failed_result(self):
+        session = SlowSession(latency={IDS[0]: 0.5})
+
+        async def drive():
+            async with AsyncKYCClient(session, timeout_seconds=0.05) as client:
+                slow = await client.perform_kyc_check(IDS[0])
+                fast = await client.perform_kyc_check(IDS[1])
+                return client, slow, fast
+
+        client, slow, fast = asyncio.run(drive())
+        assert slow.kyc_status == "FAILED"
+        assert "timed out" in slow.error_message
+        assert fast.kyc_status == "PASSED"
+        assert client.timeouts == 1
+
+    def test_timeouts_do_not_fail_queued_fast_lookups(self):
+        slow_ids, fast_ids = IDS[:2], IDS[2:4]
+        session = SlowSession(latency={i: 0.5 for i in slow_ids}, default_latency=0.01)
+
+        async def drive():
+            async with AsyncKYCClient(session, max_concurrency=2, timeout_seconds=0.1) as client:
+                results = dict([item async for item in client.as_completed(slow_ids + fast_ids)])
+                return client, results
+
+        client, results = asyncio.run(drive())
+        assert all("timed out" in results[i].error_message for i in slow_ids)
+        assert all(results[i].kyc_status == "PASSED" for i in fast_ids)
+        assert client.timeouts == 2
+        assert sorted(args[0] for _, args in session.calls) == sorted(slow_ids + fast_ids)
+
+    def test_timeout_starts_when_call_runs(self):
+        # Two workers stay busy with abandoned slow calls; the fast lookups wait for a
+        # worker longer than the timeout but must not be reported as timed out
+        slow_ids, fast_ids = IDS[:2], IDS[2:4]
+        session = SlowSession(latency={i: 0.3 for i in slow_ids}, default_latency=0.01)
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        async def drive():
+            async with AsyncKYCClient(session, max_concurrency=4, timeout_seconds=0.1, executor=executor) as client:
+                return dict([item async for item in client.as_completed(slow_ids + fast_ids)])
+
+        results = asyncio.run(drive())
+        executor.shutdown()
+        assert all("timed out" in results[i].error_message for i in slow_ids)
+        assert all(results[i].kyc_status == "PASSED" for i in fast_ids)
+
+    def test_owned_executor_has_spare_workers(self):
+        client = AsyncKYCClient(SlowSession(), max_concurrency=3)
+        assert client._executor._max_workers == 6
+        client.close()
+        with pytest.raises(ValueError):
+            AsyncKYCClient(SlowSession(), spare_workers=-1)
+
+    def test_digilocker_with_doc_type(self):
+        session = SlowSession(default_latency=0)
+
+        async def drive():
+            async with AsyncKYCClient(session) as client:
+                return await client.fetch_digilocker_documents(IDS[0], "PAN")
+
+        assert asyncio.run(drive()).holder_name == "Priya Sharma"
+        assert session.calls == [("CORE.FETCH_DIGILOCKER_DOCUMENTS", (IDS[0], "PAN"))]
+
+    def test_invalid_format_skips_call(self):
+        session = SlowSession()
+        results = run_kyc_lookups(session, ["12345"], operation="validate_aadhaar")
+        assert "12 digits" in results["12345"].error_message
+        assert session.calls == []
+
+    def test_unknown_operation(self):
+        async def drive():
+            async with AsyncKYCClient(SlowSession()) as client:
+                async for _ in client.as_completed(IDS, "delete_everything"):
+                    pass
+
+        with pytest.raises(ValueError):
+            asyncio.run(drive())
+
+
+class TestRunKYCLookups:
+    def test_matches_sync_wrapper(self):
+        seen = []
+        results = run_kyc_lookups(SlowSession(default_latency=0), IDS[:5] + IDS[:2],
+                                  on_result=lambda i, r: seen.append(i))
+
+        assert sorted(results) == sorted(IDS[:5])
+        assert sorted(seen) == sorted(IDS[:5])
+        assert results[IDS[0]] == perform_kyc_check(SlowSession(default_latency=0), IDS[0])
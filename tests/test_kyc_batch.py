@@ -0,0 +1,138 @@
+import json
+import pytest
+from src.kyc.aadhaar import fetch_digilocker_documents, perform_kyc_check, validate_aadhaar
+from src.kyc.batch import fetch_digilocker_documents_batch, perform_kyc_check_batch, validate_aadhaar_batch
+
+PAYLOADS = {
+    "123456789010": {
+        "CORE.VERIFY_AADHAAR": {"success": True, "aadhaar_id": "123456789010", "name": "Priya Sharma",
+                                "date_of_birth": "1990-05-15", "gender": "F"},
+        "CORE.FETCH_DIGILOCKER_DOCUMENTS": {"success": True, "aadhaar_id": "123456789010",
+                                            "holder_name": "Priya Sharma", "document_count": 1,
+                                            "documents": [{"doc_type": "PAN", "doc_number": "ABCDE1234F",
+                                                           "issuer": "Income Tax Dept", "status": "VERIFIED",
+                                                           "metadata": {}}]},
+        "CORE.PERFORM_KYC_CHECK": {"kyc_status": "PASSED", "aadhaar_verified": True, "holder_name": "Priya Sharma",
+                                   "date_of_birth": "1990-05-15", "has_pan": True, "has_income_proof": False,
+                                   "missing_documents": ["Income Proof (Form 16 or ITR)"]},
+    },
+    "999888777668": {
+        "CORE.VERIFY_AADHAAR": {"success": False, "error_code": "NOT_FOUND",
+                                "error_message": "Aadhaar not found in registry"},
+        "CORE.FETCH_DIGILOCKER_DOCUMENTS": {"success": False, "error_code": "AADHAAR_INVALID",
+                                            "error_message": "Aadhaar not found in registry"},
+        "CORE.PERFORM_KYC_CHECK": {"kyc_status": "FAILED", "stage": "AADHAAR_VERIFICATION",
+                                   "error": "Aadhaar not found in registry"},
+    },
+}
+
+
+class BatchSession:
+    """Answers single-ID procedures and their _BATCH variants from the same payloads."""
+
+    def __init__(self, as_json: bool = False):
+        self.as_json = as_json
+        self.calls = []
+
+    def call(self, procedure: str, *args):
+        self.calls.append((procedure, args))
+        if procedure.endswith("_BATCH"):
+            single = procedure[:-len("_BATCH")]
+            response = {i: PAYLOADS[i][single] for i in args[0] if i in PAYLOADS}
+        else:
+            response = PAYLOADS[args[0]][procedure]
+        return json.dumps(response) if self.as_json else response
+
+
+IDS = ["123456789010", "12345", "999888777668", "123456789010"]
+
+
+class TestValidateAadhaarBatch:
+    @pytest.mark.parametrize("as_json", [False, True])
+    def test_matches_single_calls(self, as_json):
+        session = BatchSession(as_json)
+        results = validate_aadhaar_batch(session, IDS)
+
+        assert list(results) == ["123456789010", "12345", "999888777668"]
+        for aadhaar_id, result in results.items():
+            assert result == validate_aadhaar(BatchSession(), aadhaar_id)
+
+    def test_format_rejects_are_not_sent(self):
+        session = BatchSession()
+        validate_aadhaar_batch(session, IDS)
+        assert session.calls == [("CORE.VERIFY_AADHAAR_BATCH", (["123456789010", "999888777668"],))]
+
+    def test_all_invalid_makes_no_call(self):
+        session = BatchSession()
+        results = validate_aadhaar_batch(session, ["", "abc"])
+        assert session.calls == []
+        assert all("12 digits" in r.error_message for r in results.values())
+
+    def test_chunking(self):
+        session = BatchSession()
+        validate_aadhaar_batch(session, ["123456789010", "999888777668", "111122223333"], chunk_size=2)
+        assert [len(args[0]) for _, args in session.calls] == [2, 1]
+
+    def test_missing_id_in_response(self):
+        results = validate_aadhaar_batch(BatchSession(), ["111122223333"])
+        assert results["111122223333"].is_valid is False
+        assert results["111122223333"].error_message == "Verification failed"
+
+    def test_rejects_non_positive_chunk_size(self):
+        with pytest.raises(ValueError):
+            validate_aadhaar_batch(BatchSession(), IDS, chunk_size=0)
+
+
+class MalformedEntrySession(BatchSession):
+    """Batch responses where 111122223333's entry has a string DOC_METADATA."""
+
+    def call(self, procedure: str, *args):
+        response = dict(super().call(procedure, *args))
+        if "111122223333" in args[0]:
+            documents = [{"doc_type": "PAN", "doc_number": None, "issuer": None, "status": "VERIFIED",
+                          "metadata": "not an object"}]
+            response["111122223333"] = {"success": True, "holder_name": "Bad Metadata", "documents": documents}
+        return response
+
+
+class TestMalformedEntries:
+    def test_bad_entry_fails_only_its_own_id(self):
+        results = fetch_digilocker_documents_batch(
+            MalformedEntrySession(), ["123456789010", "111122223333", "999888777668"]
+        )
+
+        assert results["123456789010"] == fetch_digilocker_documents(BatchSession(), "123456789010")
+        assert results["999888777668"].error_message == "Aadhaar not found in registry"
+        bad = results["111122223333"]
+        assert (bad.aadhaar_id, bad.documents) == ("111122223333", [])
+        assert "111122223333" in bad.error_message
+        assert "$.documents[0].metadata" in bad.error_message
+
+    def test_bad_kyc_entry_is_a_failed_result(self):
+        session = BatchSession()
+        session.call = lambda procedure, *args: {"123456789010": {"kyc_status": 7}}
+        result = perform_kyc_check_batch(session, ["123456789010"])["123456789010"]
+
+        assert result.kyc_status == "FAILED"
+        assert "123456789010" in result.error_message and "$.kyc_status" in result.error_message
+
+
+class TestFetchDigiLockerBatch:
+    def test_matches_single_calls(self):
+        session = BatchSession()
+        results = fetch_digilocker_documents_batch(session, IDS, doc_type="PAN")
+
+        assert session.calls[0] == ("CORE.FETCH_DIGILOCKER_DOCUMENTS_BATCH", (["123456789010", "999888777668"], "PAN"))
+        assert results["123456789010"] == fetch_digilocker_documents(BatchSession(), "123456789010")
+        assert results["999888777668"].error_message == "Aadhaar not found in registry"
+        assert "12 digits" in results["12345"].error_message
+
+
+class TestPerformKYCCheckBatch:
+    def test_matches_single_calls(self):
+        results = perform_kyc_check_batch(BatchSession(), IDS)
+
+        assert results["123456789010"] == perform_kyc_check(BatchSession(), "123456789010")
+        assert results["999888777668"] == perform_kyc_check(BatchSession(), "999888777668")
+        assert results["12345"].kyc_status == "FAILED"
+        assert "12 digits" in results["12345"].error_message
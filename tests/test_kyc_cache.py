@@ -0,0 +1,159 @@
+import pytest
+from src.kyc.cache import KYCResultCache, classify_result
+from src.kyc.aadhaar import INVALID_CHECKSUM_MESSAGE, AadhaarVerificationResult, KYCResult
+
+PRIYA = "123456789010"
+# PRIYA's old demo ID, whose last digit is not its Verhoeff check digit
+LEGACY = "123456789012"
+MISSING = "999888777668"
+INACTIVE = "555566667770"
+
+RESPONSES = {
+    PRIYA: {
+        "CORE.VERIFY_AADHAAR": {"success": True, "aadhaar_id": PRIYA, "name": "Priya Sharma",
+                                "date_of_birth": "1990-05-15", "gender": "F"},
+        "CORE.FETCH_DIGILOCKER_DOCUMENTS": {"success": True, "aadhaar_id": PRIYA, "holder_name": "Priya Sharma",
+                                            "documents": [{"doc_type": "PAN", "status": "VERIFIED"}]},
+        "CORE.PERFORM_KYC_CHECK": {"kyc_status": "PASSED", "aadhaar_verified": True, "holder_name": "Priya Sharma",
+                                   "has_pan": True, "has_income_proof": True, "missing_documents": []},
+    },
+    MISSING: {
+        "CORE.VERIFY_AADHAAR": {"success": False, "error_code": "NOT_FOUND",
+                                "error_message": "Aadhaar not found in registry"},
+        "CORE.FETCH_DIGILOCKER_DOCUMENTS": {"success": False, "error_code": "AADHAAR_INVALID",
+                                            "error_message": "Aadhaar not found in registry"},
+        "CORE.PERFORM_KYC_CHECK": {"kyc_status": "FAILED", "error": "Aadhaar not found in registry"},
+    },
+    INACTIVE: {
+        "CORE.VERIFY_AADHAAR": {"success": False, "error_code": "INACTIVE", "error_message": "Aadhaar is deactivated"},
+    },
+}
+
+
+RESPONSES[LEGACY] = RESPONSES[PRIYA]
+
+
+class CountingSession:
+    def __init__(self):
+        self.calls = []
+
+    def call(self, procedure: str, *args):
+        self.calls.append((procedure, args))
+        return RESPONSES[args[0]][procedure]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return KYCResultCache(max_entries=100, ttl_seconds=600, not_found_ttl_seconds=30, clock=clock)
+
+
+class TestKYCResultCache:
+    def test_repeat_lookups_hit_cache(self, cache):
+        session = CountingSession()
+        first = cache.validate_aadhaar(session, PRIYA)
+        cache.perform_kyc_check(session, PRIYA)
+        cache.fetch_digilocker_documents(session, PRIYA)
+
+        assert cache.validate_aadhaar(session, PRIYA) is first
+        cache.perform_kyc_check(session, PRIYA)
+        cache.fetch_digilocker_documents(session, PRIYA)
+
+        assert len(session.calls) == 3
+        assert (cache.stats.hits, cache.stats.misses) == (3, 3)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_doc_type_is_part_of_the_key(self, cache):
+        session = CountingSession()
+        cache.fetch_digilocker_documents(session, PRIYA)
+        cache.fetch_digilocker_documents(session, PRIYA, "PAN")
+        assert len(session.calls) == 2
+
+    def test_not_found_uses_shorter_ttl(self, cache, clock):
+        session = CountingSession()
+        cache.validate_aadhaar(session, PRIYA)
+        cache.validate_aadhaar(session, MISSING)
+
+        clock.now = 20
+        assert cache.validate_aadhaar(session, MISSING).error_message == "Aadhaar not found in registry"
+        assert cache.stats.not_found_hits == 1
+
+        clock.now = 31
+        cache.validate_aadhaar(session, MISSING)
+        cache.validate_aadhaar(session, PRIYA)
+        assert [args[0] for _, args in session.calls] == [PRIYA, MISSING, MISSING]
+        assert cache.stats.expirations == 1
+
+        clock.now = 601
+        cache.validate_aadhaar(session, PRIYA)
+        assert len(session.calls) == 4
+
+    def test_other_failures_are_not_cached(self, cache):
+        session = CountingSession()
+        cache.validate_aadhaar(session, INACTIVE)
+        cache.validate_aadhaar(session, INACTIVE)
+        cache.validate_aadhaar(session, "12345")
+        assert len(session.calls) == 2
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, clock):
+        cache = KYCResultCache(max_entries=2, clock=clock)
+        session = CountingSession()
+        cache.validate_aadhaar(session, PRIYA)
+        cache.validate_aadhaar(session, MISSING)
+        cache.validate_aadhaar(session, PRIYA)
+        cache.perform_kyc_check(session, PRIYA)
+
+        assert cache.stats.evictions == 1
+        cache.validate_aadhaar(session, PRIYA)
+        cache.validate_aadhaar(session, MISSING)
+        assert len(session.calls) == 4
+
+    def test_invalidate_drops_every_lookup_for_id(self, cache):
+        session = CountingSession()
+        cache.validate_aadhaar(session, PRIYA)
+        cache.perform_kyc_check(session, PRIYA)
+        cache.validate_aadhaar(session, MISSING)
+
+        assert cache.invalidate(PRIYA) == 2
+        assert cache.invalidate(PRIYA) == 0
+        assert len(cache) == 1
+        cache.validate_aadhaar(session, PRIYA)
+        assert len(session.calls) == 4
+        assert cache.stats.invalidations == 2
+
+    def test_rejects_non_positive_size(self):
+        with pytest.raises(ValueError):
+            KYCResultCache(max_entries=0)
+
+    def test_checksum_is_checked_before_the_cache(self, cache):
+        session = CountingSession()
+        cache.validate_aadhaar(session, LEGACY, verify_checksum=False)
+        cache.fetch_digilocker_documents(session, LEGACY, verify_checksum=False)
+        cache.perform_kyc_check(session, LEGACY, verify_checksum=False)
+
+        # Callers that verify the check digit (the default) never see the cached answers
+        assert cache.validate_aadhaar(session, LEGACY).error_message == INVALID_CHECKSUM_MESSAGE
+        assert cache.fetch_digilocker_documents(session, LEGACY).documents == []
+        assert cache.perform_kyc_check(session, LEGACY).kyc_status == "FAILED"
+        assert len(session.calls) == 3
+        assert cache.stats.hits == 0
+
+
+def test_classify_result():
+    assert classify_result(AadhaarVerificationResult(PRIYA, True, "P", None, None, None)) is False
+    assert classify_result(KYCResult("FAILED", False, None, None, False, False, [],
+                                     "Aadhaar not found in registry")) is True
+    assert classify_result(KYCResult("FAILED", False, None, None, False, False, [], "timeout")) is None
@@ -0,0 +1,89 @@
+import json
+from datetime import date
+import pytest
+import src.kyc.decode as decode
+from benchmarks.generators import make_borrower_columns, make_kyc_payloads
+from src.kyc.aadhaar import digilocker_from_payload, kyc_from_payload, verification_from_payload
+from src.kyc.decode import decode_digilocker, decode_kyc, decode_verification, loads_payload
+
+IDS = make_borrower_columns(200)["aadhaar_id"].tolist()
+PAYLOADS = make_kyc_payloads(IDS, seed=3, not_found_rate=0.2)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(decode, "orjson", None)
+    elif decode.orjson is None:
+        pytest.skip("orjson not installed")
+
+
+@pytest.mark.parametrize("encode", [lambda p: p, json.dumps, lambda p: json.dumps(p).encode()])
+class TestMatchesParseThenCopy:
+    def test_verification(self, encode, json_backend):
+        for aadhaar_id in IDS:
+            payload = PAYLOADS[aadhaar_id]["CORE.VERIFY_AADHAAR"]
+            assert decode_verification(aadhaar_id, encode(payload)) == verification_from_payload(aadhaar_id, payload)
+
+    def test_digilocker(self, encode, json_backend):
+        for aadhaar_id in IDS:
+            payload = PAYLOADS[aadhaar_id]["CORE.FETCH_DIGILOCKER_DOCUMENTS"]
+            assert decode_digilocker(aadhaar_id, encode(payload)) == digilocker_from_payload(aadhaar_id, payload)
+
+    def test_kyc(self, encode, json_backend):
+        for aadhaar_id in IDS:
+            payload = PAYLOADS[aadhaar_id]["CORE.PERFORM_KYC_CHECK"]
+            assert decode_kyc(encode(payload)) == kyc_from_payload(payload)
+
+
+class TestFallbackPath:
+    def test_missing_optional_fields_get_defaults(self):
+        payload = {"success": True, "documents": [{"doc_type": "PAN", "status": "VERIFIED"}]}
+        assert decode_digilocker("123456789010", payload) == digilocker_from_payload("123456789010", payload)
+
+        kyc = {"kyc_status": "INCOMPLETE", "holder_name": "Priya Sharma"}
+        assert decode_kyc(kyc) == kyc_from_payload(kyc)
+
+    def test_date_values_are_stringified(self):
+        kyc = {"kyc_status": "PASSED", "date_of_birth": date(1990, 5, 15)}
+        assert decode_kyc(kyc).date_of_birth == "1990-05-15"
+        verified = decode_verification("123456789010", {"success": True, "date_of_birth": date(1990, 5, 15)})
+        assert verified.date_of_birth == "1990-05-15"
+
+    def test_failed_kyc(self):
+        assert decode_kyc('{"kyc_status": "FAILED", "error": "Aadhaar not found in registry"}').error_message \
+            == "Aadhaar not found in registry"
+
+
+class TestValidation:
+    @pytest.mark.parametrize("payload, message", [
+        ({"success": "yes"}, r"\$\.success: expected bool, got str"),
+        ({"success": True, "name": 42}, r"\$\.name: expected str or null, got int"),
+        ({"success": False, "error_message": ["bad"]}, r"\$\.error_message"),
+    ])
+    def test_verification_types(self, payload, message):
+        with pytest.raises(ValueError, match=message):
+            decode_verification("123456789010", payload)
+
+    def test_document_errors_name_the_index(self):
+        payload = {"success": True, "documents": [
+            {"doc_type": "PAN", "doc_number": None, "issuer": None, "status": "VERIFIED", "metadata": None},
+            {"doc_type": "FORM_16", "status": 7},
+        ]}
+        with pytest.raises(ValueError, match=r"\$\.documents\[1\]\.status: expected str, got int"):
+            decode_digilocker("123456789010", payload)
+        with pytest.raises(ValueError, match=r"\$\.documents\[0\]: expected object"):
+            decode_digilocker("123456789010", {"success": True, "documents": ["PAN"]})
+
+    def test_kyc_types(self):
+        with pytest.raises(ValueError, match=r"\$\.kyc_status: required field is missing"):
+            decode_kyc({"has_pan": True})
+        with pytest.raises(ValueError, match=r"\$\.has_pan: expected bool, got int"):
+            decode_kyc({"kyc_status": "PASSED", "has_pan": 1})
+        with pytest.raises(ValueError, match=r"\$\.missing_documents\[1\]"):
+            decode_kyc({"kyc_status": "INCOMPLETE", "missing_documents": ["PAN", None]})
+
+    @pytest.mark.parametrize("payload", ["[1, 2]", b"null", 42])
+    def test_non_object_payload(self, payload):
+        with pytest.raises(ValueError, match="Expected a JSON object payload"):
+            loads_payload(payload)
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.kyc.async_client import AsyncKYCClient
+from src.kyc.singleflight import KYCSingleFlight
+
+PRIYA = "123456789010"
+RAHUL = "234567890124"
+
+
+class GatedSession:
+    """Mock session whose calls block until released, so callers pile up on one in-flight call."""
+
+    def __init__(self, fail: bool = False):
+        self.release = threading.Event()
+        self.fail = fail
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def call(self, procedure: str, *args):
+        with self._lock:
+            self.calls.append((procedure, args))
+        self.release.wait(timeout=5)
+        if self.fail:
+            raise RuntimeError("warehouse unavailable")
+        if procedure == "CORE.VERIFY_AADHAAR":
+            return {"success": True, "aadhaar_id": args[0], "name": "Priya Sharma"}
+        if procedure == "CORE.PERFORM_KYC_CHECK":
+            return {"kyc_status": "PASSED", "aadhaar_verified": True, "holder_name": "Priya Sharma",
+                    "has_pan": True, "has_income_proof": True, "missing_documents": []}
+        return {"success": True, "aadhaar_id": args[0], "holder_name": "Priya Sharma", "documents": []}
+
+
+def wait_for_calls(session, count):
+    deadline = time.monotonic() + 5
+    while len(session.calls) < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class TestThreaded:
+    def test_concurrent_callers_share_one_call(self):
+        flight = KYCSingleFlight()
+        session = GatedSession()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(flight.validate_aadhaar, session, PRIYA) for _ in range(8)]
+            wait_for_calls(session, 1)
+            while flight.stats.collapsed < 7:
+                time.sleep(0.005)
+            session.release.set()
+            results = [future.result() for future in futures]
+
+        assert len(session.calls) == 1
+        assert all(result is results[0] for result in results)
+        assert (flight.stats.calls, flight.stats.collapsed) == (1, 7)
+        assert flight.stats.collapse_rate == pytest.approx(7 / 8)
+        assert flight.in_flight() == 0
+
+    def test_distinct_keys_are_not_collapsed(self):
+        flight = KYCSingleFlight()
+        session = GatedSession()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(flight.validate_aadhaar, session, PRIYA),
+                pool.submit(flight.validate_aadhaar, session, RAHUL),
+                pool.submit(flight.perform_kyc_check, session, PRIYA),
+                pool.submit(flight.fetch_digilocker_documents, session, PRIYA, "PAN"),
+            ]
+            wait_for_calls(session, 4)
+            session.release.set()
+            [future.result() for future in futures]
+        assert len(session.calls) == 4
+        assert flight.stats.collapsed == 0
+
+    def test_key_released_after_completion(self):
+        flight = KYCSingleFlight()
+        session = GatedSession()
+        session.release.set()
+        flight.validate_aadhaar(session, PRIYA)
+        flight.validate_aadhaar(session, PRIYA)
+        assert len(session.calls) == 2
+
+    def test_exception_reaches_every_waiter(self):
+        flight = KYCSingleFlight()
+        session = GatedSession(fail=True)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(flight.perform_kyc_check, session, PRIYA) for _ in range(3)]
+            wait_for_calls(session, 1)
+            while flight.stats.collapsed < 2:
+                time.sleep(0.005)
+            session.release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError):
+                    future.result()
+        assert flight.in_flight() == 0
+
+
+class TestAsync:
+    def test_coroutines_share_one_call(self):
+        flight = KYCSingleFlight()
+        session = GatedSession()
+
+        async def drive():
+            tasks = [asyncio.ensure_future(flight.validate_aadhaar_async(session, PRIYA)) for _ in range(5)]
+            await asyncio.sleep(0.05)
+            session.release.set()
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(drive())
+        assert len(session.calls) == 1
+        assert {result.name for result in results} == {"Priya Sharma"}
+        assert flight.stats.collapsed == 4
+
+    def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flight = KYCSingleFlight()
+        session = GatedSession()
+
+        async def drive():
+            leader = asyncio.ensure_future(flight.perform_kyc_check_async(session, PRIYA))
+            follower = asyncio.ensure_future(flight.perform_kyc_check_async(session, PRIYA))
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            session.release.set()
+            return await follower
+
+        assert asyncio.run(drive()).kyc_status == "PASSED"
+        assert len(session.calls) == 1
+
+    def test_clients_coalesce_through_shared_single_flight(self):
+        flight = KYCSingleFlight()
+        session = GatedSession()
+
+        async def drive():
+            async with AsyncKYCClient(session, single_flight=flight) as first, \
+                    AsyncKYCClient(session, single_flight=flight) as second:
+                tasks = [asyncio.ensure_future(first.validate_aadhaar(PRIYA)),
+                         asyncio.ensure_future(second.validate_aadhaar(PRIYA))]
+                await asyncio.sleep(0.05)
+                session.release.set()
+                return await asyncio.gather(*tasks)
+
+        results = asyncio.run(drive())
+        assert all(result.is_valid for result in results)
+        assert len(session.calls) == 1
+        assert flight.stats.collapsed == 1
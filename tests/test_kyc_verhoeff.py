@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from src.kyc.aadhaar import INVALID_CHECKSUM_MESSAGE, fetch_digilocker_documents, perform_kyc_check, validate_aadhaar
+from src.kyc.batch import perform_kyc_check_batch, validate_aadhaar_batch
+from src.kyc.verhoeff import is_valid_verhoeff, verhoeff_check_digit, verhoeff_valid_array
+
+rng = np.random.default_rng(24)
+VALID = [f"{n}" + verhoeff_check_digit(f"{n}") for n in rng.integers(10**10, 10**11, 200)]
+VALID_ID = VALID[0]
+# Same payload with the check digit bumped by one
+BAD_CHECK_ID = VALID_ID[:-1] + str((int(VALID_ID[-1]) + 1) % 10)
+
+
+class RecordingSession:
+    def __init__(self):
+        self.calls = []
+
+    def call(self, procedure: str, *args):
+        self.calls.append((procedure, args))
+        if procedure.endswith("_BATCH"):
+            return {aadhaar_id: {"success": True, "kyc_status": "PASSED", "name": "Priya Sharma"}
+                    for aadhaar_id in args[0]}
+        return {"success": True, "kyc_status": "PASSED", "name": "Priya Sharma", "documents": []}
+
+
+class TestScalar:
+    def test_known_values(self):
+        assert verhoeff_check_digit("236") == "3"
+        assert is_valid_verhoeff("2363")
+        assert not is_valid_verhoeff("2364")
+
+    def test_generated_ids_are_valid(self):
+        assert all(is_valid_verhoeff(aadhaar_id) for aadhaar_id in VALID)
+
+    def test_detects_single_digit_errors(self):
+        for aadhaar_id in VALID[:20]:
+            for position in range(12):
+                for delta in range(1, 10):
+                    digit = (int(aadhaar_id[position]) + delta) % 10
+                    assert not is_valid_verhoeff(aadhaar_id[:position] + str(digit) + aadhaar_id[position + 1:])
+
+    def test_detects_most_adjacent_transpositions(self):
+        swaps = [
+            aadhaar_id[:position] + aadhaar_id[position + 1] + aadhaar_id[position] + aadhaar_id[position + 2:]
+            for aadhaar_id in VALID for position in range(11)
+            if aadhaar_id[position] != aadhaar_id[position + 1]
+        ]
+        assert sum(not is_valid_verhoeff(swap) for swap in swaps) / len(swaps) > 0.95
+
+    @pytest.mark.parametrize("value", ["", "12a4", "١٢٣٤"])
+    def test_rejects_non_digits(self, value):
+        assert not is_valid_verhoeff(value)
+        with pytest.raises(ValueError):
+            verhoeff_check_digit(value or "x")
+
+
+class TestArray:
+    def test_matches_scalar(self):
+        ids = VALID + [f"{n:012d}" for n in rng.integers(0, 10**12, 500)]
+        expected = [is_valid_verhoeff(aadhaar_id) for aadhaar_id in ids]
+        np.testing.assert_array_equal(verhoeff_valid_array(ids), expected)
+        np.testing.assert_array_equal(verhoeff_valid_array(np.array(ids)), expected)
+
+    def test_integer_input(self):
+        ids = np.array([int(aadhaar_id) for aadhaar_id in VALID[:10]] + [int(BAD_CHECK_ID), -1, 10**12])
+        np.testing.assert_array_equal(verhoeff_valid_array(ids), [True] * 10 + [False] * 3)
+
+    def test_malformed_rows(self):
+        ids = [VALID_ID, VALID_ID + "0", VALID_ID[:11], "", VALID_ID[:11] + "x", BAD_CHECK_ID]
+        np.testing.assert_array_equal(verhoeff_valid_array(ids), [True, False, False, False, False, False])
+        assert not verhoeff_valid_array(["123"]).any()
+        assert verhoeff_valid_array([]).shape == (0,)
+
+
+class TestEntryPoints:
+    def test_checksum_is_on_by_default(self):
+        session = RecordingSession()
+        assert validate_aadhaar(session, BAD_CHECK_ID).error_message == INVALID_CHECKSUM_MESSAGE
+        assert perform_kyc_check_batch(session, [BAD_CHECK_ID])[BAD_CHECK_ID].error_message == INVALID_CHECKSUM_MESSAGE
+        assert session.calls == []
+
+        # Opting out sends IDs that predate check digits to the registry
+        assert validate_aadhaar(session, BAD_CHECK_ID, verify_checksum=False).is_valid
+        assert len(session.calls) == 1
+
+    def test_bad_check_digit_rejected_locally(self):
+        session = RecordingSession()
+        assert validate_aadhaar(session, BAD_CHECK_ID, verify_checksum=True).error_message == INVALID_CHECKSUM_MESSAGE
+        assert fetch_digilocker_documents(session, BAD_CHECK_ID, verify_checksum=True).error_message \
+            == INVALID_CHECKSUM_MESSAGE
+        assert perform_kyc_check(session, BAD_CHECK_ID, verify_checksum=True).kyc_status == "FAILED"
+        assert perform_kyc_check(session, "12345", verify_checksum=True).error_message.endswith("12 digits")
+        assert session.calls == []
+
+        assert validate_aadhaar(session, VALID_ID, verify_checksum=True).is_valid
+        assert len(session.calls) == 1
+
+    def test_batch_rejects_before_sending(self):
+        session = RecordingSession()
+        results = validate_aadhaar_batch(session, [VALID_ID, BAD_CHECK_ID, "12345", VALID[1]], verify_checksum=True)
+
+        assert session.calls == [("CORE.VERIFY_AADHAAR_BATCH", ([VALID_ID, VALID[1]],))]
+        assert results[BAD_CHECK_ID].error_message == INVALID_CHECKSUM_MESSAGE
+        assert "12 digits" in results["12345"].error_message
+
+        kyc = perform_kyc_check_batch(session, [BAD_CHECK_ID], verify_checksum=True)
+        assert kyc[BAD_CHECK_ID].error_message == INVALID_CHECKSUM_MESSAGE
+        assert len(session.calls) == 1
@@ -0,0 +1,70 @@
+import pytest
+import random
+from datetime import date
+from src.securitization.pooling import Loan
+from src.securitization.aggregates import PoolAggregates
+
+
+def make_loan(loan_id: str, pool_id: str, amount: float, interest_rate: float) -> Loan:
+    return Loan(loan_id=loan_id, borrower_id="BORR001", amount=amount, disbursement_date=date(2025, 1, 1),
+                pool_id=pool_id, interest_rate=interest_rate)
+
+
+class TestPoolAggregates:
+    def test_deltas_match_full_rebuild(self):
+        rng = random.Random(2)
+        book = [(make_loan(f"L{i}", rng.choice(["RMBS-2025-Q3", "RMBS-2025-Q4"]), rng.uniform(1e6, 8e6),
+                           rng.choice([0.0725, 0.075, 0.08])), rng.randrange(750, 850)) for i in range(200)]
+        running = PoolAggregates()
+        for loan, score in book:
+            running.add_loan(loan.pool_id, loan, score)
+        for loan, score in book[:50]:
+            running.remove_loan(loan.pool_id, loan, score)
+
+        assert running.verify(PoolAggregates.rebuild(book[50:])) == []
+
+    def test_derived_metrics(self):
+        aggregates = PoolAggregates()
+        aggregates.add_loan("RMBS-2025-Q3", make_loan("L1", "RMBS-2025-Q3", 5000000, 0.075), 785)
+        aggregates.add_loan("RMBS-2025-Q3", make_loan("L2", "RMBS-2025-Q3", 3000000, 0.08), 810)
+        pool = aggregates.get("RMBS-2025-Q3")
+
+        assert pool.loan_count == 2
+        assert pool.total_value == 8000000
+        assert pool.avg_credit_score == 797.5
+        assert pool.weighted_avg_coupon == pytest.approx((5e6 * 0.075 + 3e6 * 0.08) / 8e6)
+        assert aggregates.get("RMBS-2026-Q1").avg_credit_score is None
+
+    def test_verify_reports_and_repairs_drift(self):
+        loan = make_loan("L1", "RMBS-2025-Q3", 5000000, 0.075)
+        running = PoolAggregates.from_pool_rows([{"POOL_ID": "RMBS-2025-Q3", "LOAN_COUNT": 1, "TOTAL_VALUE": 5000000,
+                                                  "CREDIT_SCORE_SUM": 700, "WEIGHTED_RATE_SUM": 375000}])
+        expected = PoolAggregates.rebuild([(loan, 785)])
+
+        drifts = running.verify(expected, repair=True)
+        assert [d.pool_id for d in drifts] == ["RMBS-2025-Q3"]
+        assert drifts[0].actual.credit_score_sum == 700
+        assert running.verify(expected) == []
+
+    def test_from_session_reads_running_sums_and_totals(self):
+        class MockSession:
+            def sql(self, query):
+                self.query = query
+                return self
+
+            def collect(self):
+                return [
+                    {"POOL_ID": "RMBS-2025-Q3", "LOAN_COUNT": 2, "TOTAL_VALUE": 8000000,
+                     "CREDIT_SCORE_SUM": 1595, "WEIGHTED_RATE_SUM": 615000},
+                    {"POOL_ID": "RMBS-2025-Q4", "LOAN_COUNT": None, "TOTAL_VALUE": None,
+                     "CREDIT_SCORE_SUM": None, "WEIGHTED_RATE_SUM": None},
+                ]
+
+        session = MockSession()
+        aggregates = PoolAggregates.from_session(session, "HOUSING_PLATFORM.CORE")
+        totals = aggregates.totals()
+
+        assert "FROM HOUSING_PLATFORM.CORE.RMBS_POOLS" in session.query
+        assert len(aggregates) == 2
+        assert (totals.loan_count, totals.total_value) == (2, 8000000)
+        assert totals.weighted_avg_coupon == pytest.approx(615000 / 8000000)
@@ -0,0 +1,212 @@
+from datetime import date
+
+import pytest
+import numpy as np
+from src.securitization.analytics import (
+    SCORE_BIN_LABELS,
+    PoolAnalyticsCache,
+    PoolAnalyticsCube,
+    build_pool_analytics,
+    _bucket,
+    _bucket_sql,
+    _assemble,
+    SCORE_BIN_EDGES,
+)
+
+LOANS = {
+    "pool_id": ["RMBS-2025-Q3", "RMBS-2025-Q3", "RMBS-2025-Q4", "RMBS-2025-Q3"],
+    "amount": [2_000_000.0, 6_000_000.0, 12_000_000.0, 4_000_000.0],
+    "interest_rate": [0.08, 0.075, 0.085, 0.07],
+    "credit_score": [760, 810, 855, 800],
+    "remaining_months": [200, 230, 300, 180],
+}
+
+
+def loan_cube(**kwargs):
+    return build_pool_analytics(**LOANS, **kwargs)
+
+
+class TestBuildPoolAnalytics:
+    def test_per_pool_aggregates(self):
+        cube = loan_cube()
+
+        assert cube.pool_id.tolist() == ["RMBS-2025-Q3", "RMBS-2025-Q4"]
+        assert cube.loan_count.tolist() == [3, 1]
+        assert cube.total_value.tolist() == [12_000_000.0, 12_000_000.0]
+        assert cube.avg_credit_score[0] == pytest.approx((760 + 810 + 800) / 3)
+        assert cube.wac[0] == pytest.approx((2 * 0.08 + 6 * 0.075 + 4 * 0.07) / 12)
+        assert cube.wam_months[0] == pytest.approx((2 * 200 + 6 * 230 + 4 * 180) / 12)
+        assert (cube.min_credit_score[0], cube.max_credit_score[0]) == (760, 810)
+        assert (cube.min_amount[0], cube.max_amount[0]) == (2_000_000, 6_000_000)
+
+    def test_histograms(self):
+        cube = loan_cube()
+        score = cube.histogram_frame("score")
+        size = cube.histogram_frame("size")
+
+        assert list(score.columns) == list(SCORE_BIN_LABELS)
+        assert score.loc["RMBS-2025-Q3", "750-774"] == 1
+        assert score.loc["RMBS-2025-Q3", "800-824"] == 2
+        assert score.loc["RMBS-2025-Q4", "850+"] == 1
+        assert size.loc["RMBS-2025-Q3"].tolist() == [1, 1, 1, 0, 0, 0]
+        assert size.loc["RMBS-2025-Q4", "1-2Cr"] == 1
+
+    def test_grouped_cells_match_loan_level(self):
+        # Each loan as its own pre-grouped warehouse cell gives the same cube
+        loans = loan_cube()
+        amount = np.array(LOANS["amount"])
+        cells = {
+            "pool_id": LOANS["pool_id"],
+            "score_bin": _bucket(np.array(LOANS["credit_score"]), SCORE_BIN_EDGES),
+            "size_bucket": [0, 2, 4, 1],
+            "loan_count": [1, 1, 1, 1],
+            "amount_sum": amount,
+            "score_sum": LOANS["credit_score"],
+            "weighted_rate_sum": amount * LOANS["interest_rate"],
+            "weighted_term_sum": amount * LOANS["remaining_months"],
+            "min_score": LOANS["credit_score"],
+            "max_score": LOANS["credit_score"],
+            "min_amount": amount,
+            "max_amount": amount,
+        }
+        cube = _assemble(cells)
+        np.testing.assert_array_equal(cube.size_histogram, loans.size_histogram)
+        np.testing.assert_allclose(cube.wac, loans.wac)
+
+    def test_bucket_sql_matches_bucket(self):
+        assert _bucket(np.array([649, 650, 749, 850]), SCORE_BIN_EDGES).tolist() == [0, 1, 2, 7]
+        assert _bucket_sql("S", (650, 700)) == "CASE WHEN S < 650 THEN 0 WHEN S < 700 THEN 1 ELSE 2 END"
+
+    def test_pools_without_loans_get_empty_rows(self):
+        cube = loan_cube(pools={"RMBS-2026-Q1": {"name": "Housing Pool 2026 Q1", "status": "OPEN"}})
+
+        assert cube.pool_id.tolist() == ["RMBS-2025-Q3", "RMBS-2025-Q4", "RMBS-2026-Q1"]
+        assert cube.loan_count.tolist() == [3, 1, 0]
+        assert cube.name.tolist() == [None, None, "Housing Pool 2026 Q1"]
+        assert (cube.total_value[2], cube.avg_credit_score[2], cube.wac[2]) == (0, 0, 0)
+        assert np.isnan(cube.min_credit_score[2]) and np.isnan(cube.max_amount[2])
+        assert cube.score_histogram[2].sum() == 0
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        cube = loan_cube(
+            pools={"RMBS-2025-Q3": {"name": "Housing Pool 2025 Q3", "aggregation_date": date(2025, 9, 30),
+                                    "status": "OPEN"}},
+            version="3:42:7",
+        )
+        path = cube.save(tmp_path / "cube.npz")
+        loaded = PoolAnalyticsCube.load(path)
+
+        assert loaded.version == "3:42:7"
+        assert loaded.name.tolist() == ["Housing Pool 2025 Q3", None]
+        assert loaded.aggregation_date.tolist() == [date(2025, 9, 30), None]
+        np.testing.assert_array_equal(loaded.score_histogram, cube.score_histogram)
+        assert loaded.to_frame().equals(cube.to_frame())
+        with np.load(path, allow_pickle=False) as data:
+            assert all(data[name].dtype != object for name in data.files)
+
+
+class MockSession:
+    """Answers the membership-version query and the two cube build queries."""
+
+    def __init__(self):
+        self.membership = {"AS_OF": date(2026, 1, 19), "LOANS": 1, "MEMBERSHIP_HASH": 100, "POOLS_HASH": 7,
+                           "BORROWERS_HASH": 40}
+        self.status = "OPEN"
+        self.queries = []
+        self._result = []
+
+    def sql(self, query):
+        self.queries.append(query)
+        if "HASH_AGG" in query:
+            self._result = [self.membership]
+        elif "RMBS_POOLS" in query:
+            self._result = [{"POOL_ID": "RMBS-2025-Q3", "NAME": "Housing Pool 2025 Q3",
+                             "AGGREGATION_DATE": None, "STATUS": self.status}]
+        else:
+            self._result = [{
+                "POOL_ID": "RMBS-2025-Q3", "SCORE_BIN": 4, "SIZE_BUCKET": 1, "LOAN_COUNT": 2,
+                "AMOUNT_SUM": 8_000_000, "SCORE_SUM": 1_570, "WEIGHTED_RATE_SUM": 620_000,
+                "WEIGHTED_TERM_SUM": 1_600_000_000, "MIN_SCORE": 780, "MAX_SCORE": 790,
+                "MIN_AMOUNT": 3_000_000, "MAX_AMOUNT": 5_000_000,
+            }]
+        return self
+
+    def collect(self):
+        return self._result
+
+    def builds(self):
+        return sum("GROUP BY" in query for query in self.queries)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestPoolAnalyticsCache:
+    def test_serves_cached_cube_until_membership_changes(self):
+        session, clock = MockSession(), FakeClock()
+        cache = PoolAnalyticsCache(check_interval_seconds=60, clock=clock)
+
+        cube = cache.get(session)
+        assert cube.loan_count.tolist() == [2]
+        assert cube.wac[0] == pytest.approx(0.0775)
+        assert cube.name.tolist() == ["Housing Pool 2025 Q3"]
+
+        clock.now = 30
+        assert cache.get(session) is cube
+        assert len(session.queries) == 3  # no version check inside the interval
+
+        clock.now = 90
+        assert cache.get(session) is cube
+        assert session.builds() == 1
+
+        session.membership = {**session.membership, "LOANS": 2, "MEMBERSHIP_HASH": 101}
+        clock.now = 200
+        assert cache.get(session) is not cube
+        assert session.builds() == 2
+        assert cache.builds == 2
+
+    def test_pool_status_change_rebuilds(self):
+        session, clock = MockSession(), FakeClock()
+        cache = PoolAnalyticsCache(check_interval_seconds=60, clock=clock)
+        assert cache.get(session).status.tolist() == ["OPEN"]
+
+        # Same loans in the same pools; only the RMBS_POOLS row moved on
+        session.status = "SECURITIZED"
+        session.membership = {**session.membership, "POOLS_HASH": 8}
+        clock.now = 90
+        assert cache.get(session).status.tolist() == ["SECURITIZED"]
+        assert session.builds() == 2
+
+    @pytest.mark.parametrize("change", [{"BORROWERS_HASH": 41}, {"AS_OF": date(2026, 1, 20)}])
+    def test_rescored_borrower_or_new_day_rebuilds(self, change):
+        session, clock = MockSession(), FakeClock()
+        cache = PoolAnalyticsCache(check_interval_seconds=60, clock=clock)
+        cube = cache.get(session)
+
+        # Same pool membership; only the borrower scores or the as-of date moved on
+        session.membership = {**session.membership, **change}
+        clock.now = 90
+        assert cache.get(session) is not cube
+        assert session.builds() == 2
+
+    def test_invalidate_forces_rebuild(self):
+        session = MockSession()
+        cache = PoolAnalyticsCache(clock=FakeClock())
+        cache.get(session)
+        cache.invalidate()
+        cache.get(session)
+        assert session.builds() == 2
+
+    def test_reuses_persisted_cube_in_new_process(self, tmp_path):
+        session = MockSession()
+        PoolAnalyticsCache(path=tmp_path / "cube.npz", clock=FakeClock()).get(session)
+
+        fresh = PoolAnalyticsCache(path=tmp_path / "cube.npz", clock=FakeClock())
+        assert fresh.get(session).loan_count.tolist() == [2]
+        assert session.builds() == 1
+        assert fresh.builds == 0
@@ -0,0 +1,40 @@
+import pytest
+from datetime import date, timedelta
+from dateutil.relativedelta import relativedelta
+import numpy as np
+from src.securitization.pooling import assign_rmbs_pool, Loan, MHP_MONTHS
+from src.securitization.batch import add_months, assign_rmbs_pools
+
+REFERENCE_DATE = date(2026, 1, 19)
+
+
+def disbursement_range() -> list[date]:
+    start = date(2023, 1, 1)
+    return [start + timedelta(days=n) for n in range(0, 365 * 3 + 30)]
+
+
+class TestAddMonths:
+    def test_matches_relativedelta_clamping(self):
+        dates = disbursement_range()
+        shifted = add_months(dates, MHP_MONTHS)
+        assert shifted.tolist() == [d + relativedelta(months=MHP_MONTHS) for d in dates]
+
+    def test_end_of_month_clamps(self):
+        shifted = add_months([date(2026, 8, 31), date(2027, 8, 31)], 6)
+        assert shifted.tolist() == [date(2027, 2, 28), date(2028, 2, 29)]
+
+
+class TestAssignRMBSPools:
+    def test_matches_scalar_assignment(self):
+        dates = disbursement_range()
+        batch = assign_rmbs_pools(dates, reference_date=REFERENCE_DATE)
+
+        for i, disbursement in enumerate(dates):
+            loan, pool_name = assign_rmbs_pool(Loan("L", "B", 1.0, disbursement), reference_date=REFERENCE_DATE)
+            assert batch.eligible_date[i] == np.datetime64(loan.pool_eligible_date)
+            assert batch.pool_id[i] == loan.pool_id
+            assert bool(batch.assigned[i]) is (pool_name is not None)
+
+    def test_empty_input(self):
+        batch = assign_rmbs_pools(np.array([], dtype="datetime64[D]"), reference_date=REFERENCE_DATE)
+        assert len(batch) == 0
@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+from src.marketplace.emi import calculate_emi
+from src.securitization.cashflows import (
+    load_pool_loans,
+    monthly_payment,
+    project_loan_cash_flows,
+    project_pool_cash_flows,
+)
+
+
+def iterative_schedule(principal: float, annual_rate: float, tenure: int):
+    """Month-by-month amortization, as the EMI schedule page walks it."""
+    r = annual_rate / 12
+    emi = principal * r * (1 + r) ** tenure / ((1 + r) ** tenure - 1) if r else principal / tenure
+    balance = principal
+    rows = []
+    for _ in range(tenure):
+        interest = balance * r
+        paid = emi - interest
+        balance -= paid
+        rows.append((paid, interest, balance))
+    return rows
+
+
+class TestMonthlyPayment:
+    def test_matches_calculate_emi(self):
+        emi = monthly_payment([5_000_000, 1_200_000], [0.085, 0.075], [240, 120])
+        assert emi[0] == pytest.approx(calculate_emi(5_000_000, 8.5, 240), abs=0.5)
+        assert emi[1] == pytest.approx(calculate_emi(1_200_000, 7.5, 120), abs=0.5)
+
+    def test_zero_rate(self):
+        assert monthly_payment([1200.0], [0.0], [12])[0] == pytest.approx(100.0)
+
+    def test_rejects_tenure_beyond_limit(self):
+        with pytest.raises(ValueError):
+            monthly_payment([1.0], [0.08], [361])
+
+
+class TestProjectLoanCashFlows:
+    def test_matches_iterative_schedule(self):
+        flows = project_loan_cash_flows([2_500_000, 800_000], [0.08, 0.0725], [360, 24])
+
+        assert flows.principal.shape == (2, 360)
+        for i, (principal, rate, tenure) in enumerate([(2_500_000, 0.08, 360), (800_000, 0.0725, 24)]):
+            expected = np.array(iterative_schedule(principal, rate, tenure))
+            np.testing.assert_allclose(flows.principal[i, :tenure], expected[:, 0], atol=1e-4)
+            np.testing.assert_allclose(flows.interest[i, :tenure], expected[:, 1], atol=1e-4)
+            np.testing.assert_allclose(flows.balance[i, :tenure], np.maximum(expected[:, 2], 0), atol=1e-4)
+
+    def test_zero_after_tenure_and_principal_repaid(self):
+        flows = project_loan_cash_flows([800_000], [0.0725], [24], horizon=36)
+
+        assert not flows.principal[0, 24:].any()
+        assert not flows.interest[0, 24:].any()
+        assert flows.balance[0, 23] == 0
+        assert flows.principal.sum() == pytest.approx(800_000)
+
+    def test_zero_rate_amortizes_linearly(self):
+        flows = project_loan_cash_flows([1200.0], [0.0], [12])
+        np.testing.assert_allclose(flows.principal[0], 100.0)
+        assert not flows.interest.any()
+
+
+class TestProjectPoolCashFlows:
+    def test_chunked_matches_single_pass(self):
+        rng = np.random.default_rng(7)
+        count = 2_500
+        principal = rng.uniform(500_000, 5_000_000, size=count)
+        rate = rng.choice([0.0725, 0.08, 0.085], size=count)
+        tenure = rng.choice([120, 240, 360], size=count)
+
+        full = project_loan_cash_flows(principal, rate, tenure)
+        pool = project_pool_cash_flows(principal, rate, tenure, chunk_size=300)
+
+        assert pool.loan_count == count
+        assert pool.month.tolist() == list(range(1, 361))
+        np.testing.assert_allclose(pool.principal, full.principal.sum(axis=0), rtol=1e-9)
+        np.testing.assert_allclose(pool.interest, full.interest.sum(axis=0), rtol=1e-9)
+        np.testing.assert_allclose(pool.balance, full.balance.sum(axis=0), rtol=1e-9, atol=1e-3)
+        assert pool.principal.sum() == pytest.approx(principal.sum())
+
+    def test_empty_pool(self):
+        pool = project_pool_cash_flows([], [], [])
+        assert pool.loan_count == 0
+        assert len(pool.principal) == 0
+
+
+class MockSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def sql(self, query):
+        self.queries.append(query)
+        return self
+
+    def collect(self):
+        return self.rows
+
+
+class TestLoadPoolLoans:
+    def test_loads_columns(self):
+        session = MockSession([{"AMOUNT": 1_000_000, "INTEREST_RATE": 0.08, "TENURE_MONTHS": 240}])
+        loans = load_pool_loans(session, "RMBS-2025-Q3")
+
+        assert "POOL_ID = 'RMBS-2025-Q3'" in session.queries[0]
+        assert loans["tenure_months"].tolist() == [240]
+
+    def test_reads_from_schema(self):
+        session = MockSession([])
+        load_pool_loans(session, "RMBS-2025-Q3", schema="HOUSING_PLATFORM.CORE")
+        assert "FROM HOUSING_PLATFORM.CORE.LOANS " in session.queries[0]
+
+    def test_rejects_malformed_pool_id(self):
+        with pytest.raises(ValueError):
+            load_pool_loans(MockSession([]), "x' OR '1'='1")
@@ -0,0 +1,82 @@
+import pytest
+from datetime import date
+from src.securitization.pooling import assign_rmbs_pool, get_pool_for_date, Loan
+from src.securitization.catalog import PoolCatalog, parse_pool_id
+
+
+class MockSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def sql(self, query):
+        self.queries.append(query)
+        return self
+
+    def collect(self):
+        return self.rows
+
+
+class TestPoolCatalog:
+    def test_pools_interned_per_quarter(self):
+        catalog = PoolCatalog()
+        first = catalog.pool_for_date(date(2026, 7, 19))
+        second = catalog.pool_for_date(date(2026, 9, 30))
+
+        assert first is second
+        assert first.pool_id == get_pool_for_date(date(2026, 7, 19)).pool_id
+        assert first.name == "Housing Pool 2026 Q3"
+        assert first.aggregation_date == date(2026, 7, 19)
+        assert len(catalog) == 1
+
+    def test_month_to_quarter_boundaries(self):
+        catalog = PoolCatalog()
+        for month in range(1, 13):
+            eligible_date = date(2025, month, 1)
+            assert catalog.pool_for_date(eligible_date).pool_id == get_pool_for_date(eligible_date).pool_id
+        assert len(catalog) == 4
+
+    def test_seeded_from_rmbs_pools_rows(self):
+        session = MockSession([
+            {"POOL_ID": "RMBS-2025-Q1", "NAME": "Housing Pool 2025 Q1",
+             "AGGREGATION_DATE": date(2025, 1, 10), "TRUSTEE": "Bharat Trustee Co"},
+        ])
+        catalog = PoolCatalog.from_session(session)
+        pool = catalog.pool_for_date(date(2025, 3, 31))
+
+        assert pool.trustee == "Bharat Trustee Co"
+        assert pool.aggregation_date == date(2025, 1, 10)
+        assert "RMBS-2025-Q1" in catalog
+        assert "CORE.RMBS_POOLS" in session.queries[0]
+
+    def test_non_quarterly_pool_ids_are_kept_aside(self):
+        session = MockSession([
+            {"POOL_ID": "RMBS-2025-Q1", "NAME": "Housing Pool 2025 Q1",
+             "AGGREGATION_DATE": date(2025, 1, 10), "TRUSTEE": "India Housing Trust"},
+            {"POOL_ID": "LEGACY-POOL-7", "NAME": "Legacy pool",
+             "AGGREGATION_DATE": date(2019, 4, 1), "TRUSTEE": "India Housing Trust"},
+            {"POOL_ID": "RMBS-2024-H2", "NAME": "Half-year pool",
+             "AGGREGATION_DATE": date(2024, 7, 1), "TRUSTEE": "India Housing Trust"},
+        ])
+        catalog = PoolCatalog.from_session(session, schema="HOUSING_PLATFORM.CORE")
+
+        assert len(catalog) == 1
+        assert sorted(catalog.other_pools) == ["LEGACY-POOL-7", "RMBS-2024-H2"]
+        assert "LEGACY-POOL-7" in catalog
+        assert "MANUAL-1" not in catalog
+        assert catalog.pool_for_date(date(2025, 2, 1)).pool_id == "RMBS-2025-Q1"
+        assert "HOUSING_PLATFORM.CORE.RMBS_POOLS" in session.queries[0]
+
+    def test_assign_rmbs_pool_uses_catalog(self):
+        catalog = PoolCatalog()
+        loan = Loan("LOAN001", "BORR001", 5000000, date(2025, 6, 1))
+        updated_loan, pool_name = assign_rmbs_pool(loan, reference_date=date(2026, 1, 19), catalog=catalog)
+
+        assert updated_loan.pool_id == "RMBS-2025-Q4"
+        assert pool_name == "Housing Pool 2025 Q4"
+        assert catalog.pool(2025, 4).pool_id == "RMBS-2025-Q4"
+
+    def test_parse_pool_id_rejects_other_formats(self):
+        assert parse_pool_id("RMBS-2026-Q2") == (2026, 2)
+        with pytest.raises(ValueError):
+            parse_pool_id("POOL-2026-2")
@@ -0,0 +1,151 @@
+import pytest
+import random
+import re
+from datetime import date, datetime, timedelta
+from src.rules import eligibility
+from src.securitization.pooling import assign_rmbs_pool, Loan
+from src.securitization.incremental import IncrementalPoolAssigner
+
+
+class MockSession:
+    def __init__(self, tables: dict):
+        self.tables = tables
+        self.queries = []
+        self._query = None
+
+    def sql(self, query):
+        self._query = query
+        self.queries.append(query)
+        return self
+
+    def collect(self):
+        for table, rows in self.tables.items():
+            if table in self._query:
+                return rows
+        return []
+
+
+def make_loan(loan_id: str, disbursement_date: date) -> Loan:
+    return Loan(loan_id=loan_id, borrower_id="BORR001", amount=5000000, disbursement_date=disbursement_date)
+
+
+class TestIncrementalPoolAssigner:
+    def test_daily_runs_match_full_rescan(self):
+        rng = random.Random(9)
+        loans = [make_loan(f"LOAN{i}", date(2025, 1, 1) + timedelta(days=rng.randrange(0, 400))) for i in range(300)]
+        assigner = IncrementalPoolAssigner()
+        assigner.add_many(make_loan(l.loan_id, l.disbursement_date) for l in loans)
+
+        assigned = {}
+        run_date = date(2025, 6, 1)
+        while run_date <= date(2026, 9, 1):
+            for loan, pool in assigner.run(run_date):
+                assert loan.pool_eligible_date <= run_date
+                assert loan.pool_eligible_date > (run_date - timedelta(days=7)) or loan.loan_id not in assigned
+                assigned[loan.loan_id] = loan.pool_id
+            run_date += timedelta(days=7)
+
+        for loan in loans:
+            expected, _ = assign_rmbs_pool(loan, reference_date=date(2026, 9, 1))
+            assert assigned.get(loan.loan_id) == expected.pool_id
+        assert len(assigner) == 0
+
+    def test_run_only_pops_crossed_loans(self):
+        assigner = IncrementalPoolAssigner()
+        assigner.add(make_loan("EARLY", date(2025, 1, 15)))
+        assigner.add(make_loan("LATE", date(2025, 12, 1)))
+
+        assert [loan.loan_id for loan, _ in assigner.run(date(2026, 1, 19))] == ["EARLY"]
+        assert assigner.watermark == date(2026, 1, 19)
+        assert assigner.next_eligible_date() == date(2026, 6, 1)
+        assert assigner.run(date(2026, 1, 20)) == []
+
+    def test_removed_and_readded_loans(self):
+        assigner = IncrementalPoolAssigner()
+        assigner.add(make_loan("LOAN1", date(2025, 1, 15)))
+        assigner.remove("LOAN1")
+        assert len(assigner) == 0
+        assigner.add(make_loan("LOAN1", date(2025, 1, 15)))
+
+        assert len(assigner.run(date(2026, 1, 19))) == 1
+
+    def test_run_before_watermark_rejected(self):
+        assigner = IncrementalPoolAssigner(watermark=date(2026, 1, 19))
+        with pytest.raises(ValueError):
+            assigner.run(date(2026, 1, 18))
+
+    def test_from_session_loads_unpooled_loans(self):
+        session = MockSession({
+            "CORE.RMBS_POOLS": [],
+            "CORE.POOL_ASSIGNMENT_WATERMARK": [{"WATERMARK": None, "LAST_RUN_AT": None,
+                                                "NOW": datetime(2026, 1, 19, 2, 0)}],
+            "CORE.LOANS": [{"LOAN_ID": "LOAN-A1B2C3D4", "BORROWER_ID": "123456789010", "AMOUNT": 5000000,
+                            "DISBURSEMENT_DATE": date(2025, 3, 15), "POOL_ELIGIBLE_DATE": None}],
+        })
+        assigner = IncrementalPoolAssigner.from_session(session, reference_date=date(2026, 1, 19))
+        (loan, pool), = assigner.run(date(2026, 1, 19))
+
+        assert loan.pool_id == "RMBS-2025-Q3"
+        assert pool.aggregation_date == date(2025, 9, 15)
+        loans_query = next(q for q in session.queries if "CORE.LOANS" in q)
+        assert "<= '2026-01-19'" in loans_query
+        assert "> '" not in loans_query
+
+    def test_from_session_reads_only_past_persisted_watermark(self):
+        session = MockSession({
+            "CORE.RMBS_POOLS": [],
+            "CORE.POOL_ASSIGNMENT_WATERMARK": [{"WATERMARK": date(2026, 1, 18),
+                                                "LAST_RUN_AT": datetime(2026, 1, 18, 2, 0),
+                                                "NOW": datetime(2026, 1, 19, 2, 0)}],
+            "CORE.LOANS": [],
+        })
+        assigner = IncrementalPoolAssigner.from_session(session, reference_date=date(2026, 1, 19))
+        assert assigner.watermark == date(2026, 1, 18)
+
+        loans_query = next(q for q in session.queries if "CORE.LOANS" in q)
+        assert "> '2026-01-18'" in loans_query
+        assert "<= '2026-01-19'" in loans_query
+        assert "L.UPDATED_AT >= '2026-01-18 02:00:00'" in loans_query
+        assert "B.UPDATED_AT >= '2026-01-18 02:00:00'" in loans_query
+
+        assigner.run(date(2026, 1, 19))
+        assigner.save_watermark(session)
+        merge = session.queries[-1]
+        assert merge.startswith("MERGE INTO CORE.POOL_ASSIGNMENT_WATERMARK")
+        assert "W.WATERMARK = '2026-01-19'" in merge
+        assert "W.LAST_RUN_AT = '2026-01-19 02:00:00'" in merge
+
+    def test_from_session_skips_borrowers_below_min_credit_score(self, monkeypatch):
+        class ScoringSession(MockSession):
+            # Applies the credit score predicate the way the warehouse would
+            def collect(self):
+                rows = super().collect()
+                threshold = re.search(r"B\.CREDIT_SCORE >= (\d+)", self._query)
+                if threshold:
+                    rows = [row for row in rows if row["CREDIT_SCORE"] >= int(threshold.group(1))]
+                return rows
+
+        loan = {"AMOUNT": 5000000, "DISBURSEMENT_DATE": date(2025, 3, 15), "POOL_ELIGIBLE_DATE": None}
+        session = ScoringSession({
+            "CORE.RMBS_POOLS": [],
+            "CORE.POOL_ASSIGNMENT_WATERMARK": [{"WATERMARK": None, "LAST_RUN_AT": None,
+                                                "NOW": datetime(2026, 1, 19, 2, 0)}],
+            "CORE.LOANS": [
+                {**loan, "LOAN_ID": "LOAN-PRIME", "BORROWER_ID": "123456789010", "CREDIT_SCORE": 780},
+                {**loan, "LOAN_ID": "LOAN-SUBPRIME", "BORROWER_ID": "999999999997", "CREDIT_SCORE": 700},
+            ],
+        })
+        assigner = IncrementalPoolAssigner.from_session(session, reference_date=date(2026, 1, 19))
+
+        assert [loan.loan_id for loan, _ in assigner.run(date(2026, 1, 19))] == ["LOAN-PRIME"]
+        loans_query = next(q for q in session.queries if "CORE.LOANS" in q)
+        assert "JOIN CORE.BORROWERS B ON L.BORROWER_ID = B.AADHAAR_ID" in loans_query
+        assert "B.CREDIT_SCORE >= 750" in loans_query
+
+        monkeypatch.setattr(eligibility, "MIN_CREDIT_SCORE", 800)
+        IncrementalPoolAssigner.from_session(session, reference_date=date(2026, 1, 19))
+        assert "B.CREDIT_SCORE >= 800" in session.queries[-1]
+
+    def test_save_requires_a_run(self):
+        with pytest.raises(ValueError):
+            IncrementalPoolAssigner().save_watermark(MockSession({}))
@@ -0,0 +1,110 @@
+import pytest
+from datetime import date
+import numpy as np
+from src.rules import eligibility
+from src.securitization.optimizer import PoolConstraints, build_pools, eligible_loan_mask, load_eligible_loans
+
+
+@pytest.fixture
+def loans():
+    rng = np.random.default_rng(11)
+    count = 5_000
+    return {
+        "amount": rng.uniform(500_000, 10_000_000, size=count).round(-3),
+        "credit_score": rng.integers(750, 900, size=count),
+        "borrower_id": np.array([f"B{n}" for n in rng.integers(0, count // 2, size=count)]),
+    }
+
+
+def weighted_score(loans, index):
+    return np.average(loans["credit_score"][index], weights=loans["amount"][index])
+
+
+class TestEligibleLoanMask:
+    def test_matches_rmbs_eligible_loans_filter(self):
+        mask = eligible_loan_mask(
+            credit_score=[780, 700, 780, 780, 780],
+            disbursement_date=np.array(["2025-01-01", "2025-01-01", "2025-12-01", "2025-01-01", "2025-01-01"],
+                                       dtype="datetime64[D]"),
+            status=["ACTIVE", "ACTIVE", "ACTIVE", "CLOSED", "ACTIVE"],
+            pool_id=[None, None, None, None, "RMBS-2025-Q3"],
+            reference_date=date(2026, 1, 19),
+        )
+        assert mask.tolist() == [True, False, False, False, False]
+
+    def test_reads_min_credit_score_when_called(self, monkeypatch):
+        monkeypatch.setattr(eligibility, "MIN_CREDIT_SCORE", 800)
+        mask = eligible_loan_mask(
+            credit_score=[780, 820],
+            disbursement_date=np.array(["2025-01-01", "2025-01-01"], dtype="datetime64[D]"),
+            status=["ACTIVE", "ACTIVE"],
+            pool_id=[None, None],
+            reference_date=date(2026, 1, 19),
+        )
+        assert mask.tolist() == [False, True]
+
+
+class TestBuildPools:
+    def test_meets_size_score_and_concentration(self, loans):
+        constraints = PoolConstraints(target_size=1e9, size_tolerance=0.05, max_borrower_share=0.02,
+                                      min_avg_credit_score=weighted_score(loans, slice(None)) - 0.5)
+        plan = build_pools(loans["amount"], loans["credit_score"], loans["borrower_id"], constraints)
+
+        assert plan.violations == []
+        assert len(plan.pools) == int(loans["amount"].sum() // 1e9)
+        for pool in plan.pools:
+            members = np.flatnonzero(plan.pool_number == pool.pool_number)
+            assert constraints.min_size <= loans["amount"][members].sum() <= constraints.max_size
+            assert weighted_score(loans, members) == pytest.approx(pool.avg_credit_score)
+            assert pool.avg_credit_score >= constraints.min_avg_credit_score
+            assert pool.max_borrower_share <= constraints.max_borrower_share
+            assert pool.loan_count == len(members)
+
+    def test_local_search_lifts_pools_below_score_floor(self, loans):
+        floor = weighted_score(loans, slice(None)) - 0.5
+        greedy_only = build_pools(loans["amount"], loans["credit_score"], loans["borrower_id"],
+                                  PoolConstraints(target_size=1e9, min_avg_credit_score=floor), max_iterations=0)
+        refined = build_pools(loans["amount"], loans["credit_score"], loans["borrower_id"],
+                              PoolConstraints(target_size=1e9, min_avg_credit_score=floor))
+        assert greedy_only.violations
+        assert refined.swaps > 0
+        assert not refined.violations
+
+    def test_borrower_concentration_limit(self):
+        plan = build_pools(
+            amount=[600.0, 600.0, 300.0, 300.0, 200.0],
+            credit_score=[800, 800, 800, 800, 800],
+            borrower_id=["A", "A", "B", "C", "D"],
+            constraints=PoolConstraints(target_size=1000.0, size_tolerance=0.1, max_borrower_share=0.6,
+                                        min_avg_credit_score=750),
+            n_pools=2,
+        )
+        assert plan.pool_number[0] != plan.pool_number[1]
+        assert all(pool.max_borrower_share <= 0.6 for pool in plan.pools)
+
+    def test_unplaceable_loans_and_infeasible_floor_are_reported(self):
+        plan = build_pools(
+            amount=[1000.0, 5000.0],
+            credit_score=[760, 760],
+            borrower_id=["A", "B"],
+            constraints=PoolConstraints(target_size=1000.0, max_borrower_share=1.0, min_avg_credit_score=800),
+            n_pools=1,
+        )
+        assert plan.unassigned.tolist() == [1]
+        assert plan.violations == ["Pool 0 average credit score 760.0 below 800"]
+
+
+class MockSession:
+    def sql(self, query):
+        self.query = query
+        return self
+
+    def collect(self):
+        return [{"LOAN_ID": "L1", "BORROWER_ID": "B1", "AMOUNT": 2_500_000, "CREDIT_SCORE": 790}]
+
+
+def test_load_eligible_loans():
+    session = MockSession()
+    loans = load_eligible_loans(session)
+    assert "CORE.RMBS_ELIGIBLE_LOANS" in session.query
+    assert loans["amount"].tolist() == [2_500_000.0]
@@ -0,0 +1,60 @@
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from src.securitization.cashflows import project_pool_cash_flows
+from src.securitization.simulation import ScenarioAssumptions, run_monte_carlo, simulate_paths
+
+
+@pytest.fixture
+def schedule():
+    rng = np.random.default_rng(3)
+    count = 200
+    return project_pool_cash_flows(
+        rng.uniform(500_000, 5_000_000, size=count),
+        rng.choice([0.0725, 0.08, 0.085], size=count),
+        rng.choice([120, 240, 360], size=count),
+    )
+
+
+class TestSimulatePaths:
+    def test_no_prepayment_or_default_reproduces_schedule(self, schedule):
+        result = simulate_paths(schedule, 4, np.random.default_rng(0), ScenarioAssumptions(base_cpr=0, base_cdr=0))
+
+        scheduled_wal = (schedule.principal @ schedule.month) / schedule.principal.sum() / 12
+        np.testing.assert_allclose(result.losses, 0)
+        np.testing.assert_allclose(result.interest, schedule.interest.sum())
+        np.testing.assert_allclose(result.wal_years, scheduled_wal)
+
+    def test_balance_is_conserved(self, schedule):
+        result = simulate_paths(schedule, 50, np.random.default_rng(1))
+        pool_balance = schedule.principal.sum()
+        np.testing.assert_allclose(result.losses + result.principal_collected, pool_balance, rtol=1e-9)
+
+    def test_prepayment_shortens_wal_and_cuts_interest(self, schedule):
+        slow = simulate_paths(schedule, 200, np.random.default_rng(2), ScenarioAssumptions(base_cpr=0.02))
+        fast = simulate_paths(schedule, 200, np.random.default_rng(2), ScenarioAssumptions(base_cpr=0.25))
+        assert fast.wal_years.mean() < slow.wal_years.mean()
+        assert fast.interest.mean() < slow.interest.mean()
+
+
+class TestRunMonteCarlo:
+    def test_reproducible_regardless_of_workers(self, schedule):
+        with ThreadPoolExecutor(max_workers=1) as one, ThreadPoolExecutor(max_workers=4) as four:
+            first = run_monte_carlo(schedule, 1_050, seed=42, block_size=100, executor=one)
+            second = run_monte_carlo(schedule, 1_050, seed=42, block_size=100, executor=four)
+
+        assert len(first) == 1_050
+        np.testing.assert_array_equal(first.losses, second.losses)
+        np.testing.assert_array_equal(first.wal_years, second.wal_years)
+
+    def test_seed_changes_paths(self, schedule):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = run_monte_carlo(schedule, 100, seed=1, executor=executor)
+            second = run_monte_carlo(schedule, 100, seed=2, executor=executor)
+        assert not np.array_equal(first.losses, second.losses)
+
+    def test_process_pool(self, schedule):
+        result = run_monte_carlo(schedule, 40, seed=0, block_size=10, max_workers=2)
+        assert len(result) == 40
+        summary = result.summary()
+        assert summary["losses"]["p5"] <= summary["losses"]["p50"] <= summary["losses"]["p95"]
@@ -0,0 +1,164 @@
+import pytest
+from datetime import date
+import numpy as np
+from src.securitization.batch import assign_rmbs_pools
+from src.securitization.pooling import Loan
+from src.securitization.tape import (
+    assign_pool_chunks,
+    loan_chunks,
+    open_loan_tape,
+    session_loan_chunks,
+    tape_column,
+    write_loan_tape,
+    write_pool_tape,
+)
+
+REFERENCE_DATE = date(2026, 1, 19)
+
+
+def loan_column_chunks(count=2_500, chunk_size=1_000, seed=0):
+    rng = np.random.default_rng(seed)
+    for start in range(0, count, chunk_size):
+        rows = min(chunk_size, count - start)
+        yield {
+            "loan_id": np.array([f"LOAN-{start + i:06d}" for i in range(rows)], dtype=object),
+            "borrower_id": np.array([f"{900000000000 + start + i}" for i in range(rows)], dtype=object),
+            "amount": rng.uniform(500_000, 10_000_000, size=rows).round(-3),
+            "interest_rate": rng.choice([0.0725, 0.08], size=rows),
+            "tenure_months": rng.choice([120, 240], size=rows),
+            "disbursement_date": np.datetime64("2024-06-01") + rng.integers(0, 540, size=rows).astype("timedelta64[D]"),
+        }
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+class TestPoolTape:
+    def test_streams_assigned_loans_to_tape(self, tmp_path, suffix):
+        path = tmp_path / f"tape{suffix}"
+        stats = write_pool_tape(path, loan_column_chunks(), REFERENCE_DATE)
+
+        all_dates = np.concatenate([c["disbursement_date"] for c in loan_column_chunks()])
+        expected = assign_rmbs_pools(all_dates, REFERENCE_DATE)
+        table = open_loan_tape(path)
+
+        assert stats.chunks == 3
+        assert stats.rows == table.num_rows == int(expected.assigned.sum())
+        assert tape_column(table, "pool_id").tolist() == expected.pool_id[expected.assigned].tolist()
+        assert tape_column(table, "pool_eligible_date").astype("datetime64[D]").tolist() == \
+            expected.eligible_date[expected.assigned].tolist()
+
+    def test_include_unassigned_keeps_every_loan(self, tmp_path, suffix):
+        path = tmp_path / f"tape{suffix}"
+        write_pool_tape(path, loan_column_chunks(), REFERENCE_DATE, include_unassigned=True)
+        table = open_loan_tape(path)
+
+        assert table.num_rows == 2_500
+        assert table.column("pool_id").null_count > 0
+
+
+def test_arrow_tape_is_memory_mapped_zero_copy(tmp_path):
+    path = tmp_path / "tape.arrow"
+    write_pool_tape(path, loan_column_chunks(count=500, chunk_size=500), REFERENCE_DATE)
+    table = open_loan_tape(path)
+
+    amount = tape_column(table, "amount")
+    assert not amount.flags.owndata
+    assert not amount.flags.writeable
+
+
+def test_loan_records_round_trip(tmp_path):
+    loans = [
+        Loan("LOAN-1", "123456789010", 2_500_000.0, date(2025, 1, 15), pool_id="RMBS-2025-Q3",
+             pool_eligible_date=date(2025, 7, 15), interest_rate=0.08, tenure_months=240),
+        Loan("LOAN-2", "999888777668", 1_000_000.0, date(2025, 11, 2)),
+    ]
+    path = tmp_path / "tape.parquet"
+    stats = write_loan_tape(path, loan_chunks(loans, chunk_size=1))
+    rows = open_loan_tape(path).to_pylist()
+
+    assert stats.chunks == 2
+    assert rows[0] == {
+        "loan_id": "LOAN-1", "borrower_id": "123456789010", "pool_id": "RMBS-2025-Q3", "amount": 2_500_000.0,
+        "interest_rate": 0.08, "tenure_months": 240, "disbursement_date": date(2025, 1, 15),
+        "pool_eligible_date": date(2025, 7, 15),
+    }
+    assert rows[1]["pool_id"] is None
+    assert rows[1]["interest_rate"] is None
+    assert rows[1]["tenure_months"] is None
+
+
+def test_assign_pool_chunks_without_optional_columns():
+    chunk = {"loan_id": ["L1"], "borrower_id": ["B1"], "amount": [1.0],
+             "disbursement_date": np.array(["2025-01-10"], dtype="datetime64[D]")}
+    (columns,) = assign_pool_chunks([chunk], REFERENCE_DATE)
+    assert columns["pool_id"].tolist() == ["RMBS-2025-Q3"]
+    assert np.isnan(columns["interest_rate"][0])
+
+
+class MockCursor:
+    def __init__(self, tables):
+        self.tables = tables
+        self.closed = False
+
+    def execute(self, query):
+        self.query = query
+        return self
+
+    def fetch_arrow_batches(self):
+        return iter(self.tables)
+
+    def close(self):
+        self.closed = True
+
+
+class MockSession:
+    """Snowpark session whose connector cursor serves Arrow result batches."""
+
+    def __init__(self, tables):
+        self._cursor = MockCursor(tables)
+        self.connection = self
+
+    def cursor(self):
+        return self._cursor
+
+
+def loan_batch(**overrides):
+    import pyarrow as pa
+    from decimal import Decimal
+
+    columns = {
+        "LOAN_ID": pa.array(["L1", "L2"]), "BORROWER_ID": pa.array(["B1", "B2"]),
+        "POOL_ID": pa.array(["RMBS-2025-Q3", None]),
+        "AMOUNT": pa.array([Decimal("1000000.00"), Decimal("250000.50")], pa.decimal128(15, 2)),
+        "INTEREST_RATE": pa.array([Decimal("0.0800"), None], pa.decimal128(5, 4)),
+        "TENURE_MONTHS": pa.array([240, None], pa.int64()),
+        "DISBURSEMENT_DATE": pa.array([date(2025, 1, 10), date(2025, 11, 2)]),
+        "POOL_ELIGIBLE_DATE": pa.array([date(2025, 7, 10), None]),
+    }
+    columns.update(overrides)
+    return pa.table(columns)
+
+
+def test_session_loan_chunks(tmp_path):
+    session = MockSession([loan_batch()])
+    stats = write_loan_tape(tmp_path / "pool.arrow", session_loan_chunks(session, "RMBS-2025-Q3"))
+    rows = open_loan_tape(tmp_path / "pool.arrow").to_pylist()
+
+    assert "POOL_ID = 'RMBS-2025-Q3'" in session._cursor.query
+    assert session._cursor.closed
+    assert stats.rows == 2
+    assert rows[0]["amount"] == 1_000_000.0 and rows[0]["tenure_months"] == 240
+    assert (rows[1]["interest_rate"], rows[1]["tenure_months"], rows[1]["pool_eligible_date"]) == (None, None, None)
+    with pytest.raises(ValueError):
+        next(session_loan_chunks(session, "bad'id"))
+
+
+def test_zero_tenure_is_a_value_not_a_null(tmp_path):
+    import pyarrow as pa
+
+    (chunk,) = session_loan_chunks(MockSession([loan_batch(TENURE_MONTHS=pa.array([0, None], pa.int64()))]))
+    assert chunk["tenure_months"].tolist() == [0, 0]
+    assert chunk["tenure_months_valid"].tolist() == [True, False]
+
+    stats = write_pool_tape(tmp_path / "tape.parquet", [chunk], REFERENCE_DATE, include_unassigned=True)
+    assert stats.rows == 2
+    assert [row["tenure_months"] for row in open_loan_tape(tmp_path / "tape.parquet").to_pylist()] == [0, None]
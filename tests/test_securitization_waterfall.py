@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+from src.securitization.cashflows import project_pool_cash_flows
+from src.securitization.simulation import ScenarioAssumptions, simulate_path_cash_flows
+from src.securitization.waterfall import Tranche, run_waterfall, tranches_from_enhancement
+
+
+def loop_waterfall(tranches, principal, interest, losses):
+    """Reference month-by-month sequential waterfall for one path."""
+    tranches = sorted(tranches, key=lambda t: t.priority)
+    balance = [t.balance for t in tranches]
+    paid_interest = np.zeros((len(tranches), len(principal)))
+    paid_principal = np.zeros_like(paid_interest)
+    for month in range(len(principal)):
+        available = interest[month]
+        for k, tranche in enumerate(tranches):
+            due = balance[k] * tranche.coupon / 12
+            paid_interest[k, month] = min(due, available)
+            available -= paid_interest[k, month]
+        available = principal[month]
+        for k in range(len(tranches)):
+            paid_principal[k, month] = min(balance[k], available)
+            balance[k] -= paid_principal[k, month]
+            available -= paid_principal[k, month]
+        loss = losses[month]
+        for k in reversed(range(len(tranches))):
+            written = min(balance[k], loss)
+            balance[k] -= written
+            loss -= written
+    return paid_interest, paid_principal, balance
+
+
+class TestTranchesFromEnhancement:
+    def test_sizes_follow_subordination(self):
+        senior, mezzanine, equity = tranches_from_enhancement(1_000.0, 0.10, 0.04)
+        assert (senior.balance, mezzanine.balance, equity.balance) == pytest.approx((900.0, 60.0, 40.0))
+        assert [t.priority for t in (senior, mezzanine, equity)] == [1, 2, 3]
+
+    def test_rejects_inverted_enhancement(self):
+        with pytest.raises(ValueError):
+            tranches_from_enhancement(1_000.0, 0.02, 0.04)
+
+
+class TestRunWaterfall:
+    def test_matches_month_by_month_loop(self):
+        rng = np.random.default_rng(5)
+        tranches = [Tranche("MEZZ", 150.0, 0.09, 2), Tranche("SENIOR", 800.0, 0.06, 1), Tranche("EQUITY", 50.0, 0.0, 3)]
+        principal = rng.uniform(0, 20, size=60)
+        losses = rng.uniform(0, 3, size=60)
+        interest = rng.uniform(0, 6, size=60)
+
+        result = run_waterfall(tranches, principal, interest, losses)
+        paid_interest, paid_principal, balance = loop_waterfall(tranches, principal, interest, losses)
+
+        assert [t.name for t in result.tranches] == ["SENIOR", "MEZZ", "EQUITY"]
+        np.testing.assert_allclose(result.interest_paid[:, 0], paid_interest, atol=1e-9)
+        np.testing.assert_allclose(result.principal_paid[:, 0], paid_principal, atol=1e-9)
+        np.testing.assert_allclose(result.balance[:, 0, -1], balance, atol=1e-9)
+
+    def test_losses_hit_overcollateralization_then_equity(self):
+        tranches = tranches_from_enhancement(1_000.0)
+        result = run_waterfall(tranches, principal=[0.0, 0.0], interest=[0.0, 0.0], losses=[30.0, 30.0],
+                               pool_balance=1_050.0)
+
+        assert result.writedown[:, 0].sum(axis=1) == pytest.approx([0.0, 0.0, 10.0])
+        assert result.loss_rate()[result.index("EQUITY"), 0] == pytest.approx(0.25)
+
+    def test_cash_is_conserved_across_simulated_paths(self):
+        schedule = project_pool_cash_flows([4_000_000, 2_500_000, 1_000_000], [0.08, 0.075, 0.085], [240, 180, 120])
+        flows = simulate_path_cash_flows(schedule, 64, np.random.default_rng(0),
+                                         ScenarioAssumptions(base_cdr=0.01, loss_severity=0.4))
+        pool_balance = schedule.principal.sum()
+        tranches = tranches_from_enhancement(pool_balance * 0.98)
+
+        result = run_waterfall(tranches, flows.principal, flows.interest, flows.losses, pool_balance=pool_balance)
+
+        assert result.interest_paid.shape == (3, 64, len(schedule.month))
+        paid_out = result.interest_paid.sum(axis=0) + result.principal_paid.sum(axis=0) + result.residual
+        np.testing.assert_allclose(paid_out, flows.principal + flows.interest, rtol=1e-9, atol=1e-6)
+        np.testing.assert_allclose(result.balance[..., -1], 0, atol=1e-6)
+        assert (result.writedown[result.index("SENIOR")] == 0).all()
+        # Sequential pay builds senior enhancement above its 11.8% starting level (10% subordination plus 2% OC)
+        assert (result.credit_enhancement[result.index("SENIOR"), :, 0] > 0.118).all()